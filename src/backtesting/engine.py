@@ -6,10 +6,12 @@ strategies and risk management, simulating execution and calculating metrics.
 """
 
 import logging
+from array import array
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.core.events import EventType, MarketDataEvent
@@ -76,7 +78,9 @@ class BacktestEngine:
 
         # State tracking
         self.cash = initial_capital
-        self.equity_curve = [(start_date, initial_capital)]
+        # Equity curve buffers (columnar: one timestamp list, one float64 array)
+        self._equity_timestamps = [start_date]
+        self._equity_values = array('d', [initial_capital])
         self.current_timestamp = None
         self.current_bars = {}  # symbol -> current bar dict (shared with ExecutionEngine)
         self.current_prices = {}  # symbol -> latest close price
@@ -94,6 +98,18 @@ class BacktestEngine:
         logger.info(f"Period: {start_date.date()} to {end_date.date()}")
         logger.info(f"Initial Capital: ${initial_capital:,.2f}")
 
+    @property
+    def equity_curve(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Equity curve as (timestamps, equity) NumPy arrays.
+
+        Returns:
+            (datetime64[ns] array, float64 array)
+        """
+        timestamps = pd.DatetimeIndex(self._equity_timestamps).values
+        equity = np.array(self._equity_values, dtype=np.float64)
+        return timestamps, equity
+
     def run(self) -> Dict:
         """
         Execute backtest and return performance metrics.
@@ -252,26 +268,22 @@ class BacktestEngine:
         Returns:
             DataFrame with columns: timestamp, symbol, open, high, low, close, volume
         """
-        # Query database for historical data
-        data_rows = []
-
-        for symbol in self.symbols:
-            rows = self.db.get_market_data(
+        # Query database for historical data (one columnar frame per symbol)
+        frames = [
+            self.db.get_market_data_df(
                 symbol=symbol,
                 start_date=self.start_date,
                 end_date=self.end_date
             )
-            data_rows.extend(rows)
+            for symbol in self.symbols
+        ]
+        frames = [frame for frame in frames if not frame.empty]
 
-        if not data_rows:
+        if not frames:
             logger.warning(f"No data found for symbols {self.symbols}")
             return pd.DataFrame()
 
-        # Convert to DataFrame
-        df = pd.DataFrame(data_rows)
-
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df = pd.concat(frames, ignore_index=True)
 
         # Sort chronologically (CRITICAL for no look-ahead bias)
         df = df.sort_values('timestamp')
@@ -288,7 +300,8 @@ class BacktestEngine:
         portfolio_value = self.portfolio_manager.get_portfolio_value(self.current_prices)
 
         # Update equity curve
-        self.equity_curve.append((self.current_timestamp, portfolio_value))
+        self._equity_timestamps.append(self.current_timestamp)
+        self._equity_values.append(portfolio_value)
 
         # Update RiskManager state
         self.risk_manager.portfolio_value = portfolio_value
@@ -388,28 +401,27 @@ class BacktestEngine:
         Args:
             metrics: Metrics dict from PerformanceCalculator
         """
-        import json
-
-        final_value = self.equity_curve[-1][1] if self.equity_curve else self.initial_capital
+        final_value = self._equity_values[-1] if self._equity_values else self.initial_capital
 
+        # Storage serializes symbols/config/results itself
         self.db.save_backtest_results(
             backtest_id=self.backtest_id,
             strategy_id=self.strategy_config.get('name', 'unknown'),
-            symbols=json.dumps(self.symbols),
+            symbols=self.symbols,
             asset_type='CRYPTO',
-            start_date=self.start_date.isoformat(),
-            end_date=self.end_date.isoformat(),
+            start_date=self.start_date,
+            end_date=self.end_date,
             initial_capital=self.initial_capital,
             final_capital=final_value,
             metrics=metrics,
-            config=json.dumps({
+            config={
                 'strategy': self.strategy_config,
                 'risk': self.risk_config
-            }),
-            results=json.dumps({
-                'equity_curve_length': len(self.equity_curve),
-                'total_bars': len(self.equity_curve) - 1
-            })
+            },
+            results={
+                'equity_curve_length': len(self._equity_values),
+                'total_bars': len(self._equity_values) - 1
+            }
         )
 
     def generate_report(self, output_dir: str = "reports/") -> str:
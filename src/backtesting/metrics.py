@@ -6,13 +6,42 @@ Calculates comprehensive performance metrics from backtest results.
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+EquityCurve = Union[List[Tuple[datetime, float]], Tuple[np.ndarray, np.ndarray]]
+
+
+def equity_curve_to_arrays(equity_curve: EquityCurve) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalize an equity curve to (timestamps, equity) NumPy arrays.
+
+    Accepts either the columnar form produced by BacktestEngine
+    (datetime64[ns] array, float64 array) or a list of
+    (timestamp, portfolio_value) tuples.
+
+    Args:
+        equity_curve: Equity curve in either form
+
+    Returns:
+        (timestamps, equity) as datetime64[ns] and float64 arrays
+    """
+    if (isinstance(equity_curve, tuple) and len(equity_curve) == 2
+            and isinstance(equity_curve[1], np.ndarray)):
+        timestamps, equity = equity_curve
+    elif len(equity_curve) == 0:
+        return np.empty(0, dtype='datetime64[ns]'), np.empty(0, dtype=np.float64)
+    else:
+        timestamps, equity = zip(*equity_curve)
+
+    timestamps = pd.DatetimeIndex(timestamps).values
+    equity = np.asarray(equity, dtype=np.float64)
+    return timestamps, equity
+
 
 class PerformanceCalculator:
     """
@@ -26,7 +55,7 @@ class PerformanceCalculator:
     - Monthly analysis: Best/worst/average month
     """
 
-    def __init__(self, equity_curve: List[Tuple[datetime, float]],
+    def __init__(self, equity_curve: EquityCurve,
                  trades: List[Dict], initial_capital: float,
                  start_date: datetime, end_date: datetime,
                  risk_free_rate: float = 0.03):
@@ -34,7 +63,8 @@ class PerformanceCalculator:
         Initialize performance calculator.
 
         Args:
-            equity_curve: List of (timestamp, portfolio_value) tuples
+            equity_curve: (timestamps, equity) arrays or list of
+                (timestamp, portfolio_value) tuples
             trades: List of trade dicts from database
             initial_capital: Starting capital
             start_date: Backtest start date
@@ -48,7 +78,9 @@ class PerformanceCalculator:
         self.end_date = end_date
         self.risk_free_rate = risk_free_rate
 
-        logger.info(f"PerformanceCalculator initialized with {len(equity_curve)} equity points")
+        self._timestamps, self._equity = equity_curve_to_arrays(equity_curve)
+
+        logger.info(f"PerformanceCalculator initialized with {len(self._equity)} equity points")
 
     def calculate_all(self) -> Dict:
         """
@@ -62,13 +94,12 @@ class PerformanceCalculator:
             - trades: {total_trades, win_rate, profit_factor, expectancy, avg_win, avg_loss}
             - monthly: {best_month, worst_month, avg_month, positive_months_pct}
         """
-        if len(self.equity_curve) < 2:
+        if len(self._equity) < 2:
             logger.warning("Insufficient data points in equity curve")
             return self._empty_metrics()
 
-        # Convert equity curve to pandas series
-        timestamps, equity_values = zip(*self.equity_curve)
-        equity_series = pd.Series(equity_values, index=pd.DatetimeIndex(timestamps))
+        # Wrap equity arrays in a pandas series (no per-point conversion)
+        equity_series = pd.Series(self._equity, index=pd.DatetimeIndex(self._timestamps))
 
         # Calculate all metrics
         returns_metrics = self._calculate_returns(equity_series)
@@ -138,7 +138,7 @@ class PortfolioManager:
         self.positions[fill.symbol] = position_id
 
         # Publish update
-        self._publish_position_update(position_id, 'OPEN')
+        self._publish_position_update(position_id, 'OPEN', fill.timestamp)
 
         logger.info(f"Opened {fill.side} position: {fill.symbol} {fill.quantity:.4f} @ ${fill.price:.2f}")
 
@@ -175,7 +175,8 @@ class PortfolioManager:
             del self.positions[fill.symbol]
 
         # Publish update
-        self._publish_position_update(position['id'], 'CLOSED', realized_pnl)
+        self._publish_position_update(position['id'], 'CLOSED', fill.timestamp,
+                                      realized_pnl)
 
         pnl_pct = (realized_pnl / (position['entry_price'] * position['quantity'])) * 100
         logger.info(f"Closed position: {fill.symbol} P&L: ${realized_pnl:+,.2f} ({pnl_pct:+.2f}%)")
@@ -306,13 +307,18 @@ class PortfolioManager:
         return total_value
 
     def _publish_position_update(self, position_id: int, status: str,
+                                 timestamp: datetime,
                                  realized_pnl: float = 0.0):
         """
         Publish PositionUpdateEvent.
 
+        The event is stamped with the triggering fill's timestamp rather than
+        wall-clock time, so replays are deterministic.
+
         Args:
             position_id: Position ID
             status: Position status ('OPEN' or 'CLOSED')
+            timestamp: Timestamp of the fill that caused the update
             realized_pnl: Realized P&L (for closed positions)
         """
         # Query position details
@@ -329,7 +335,7 @@ class PortfolioManager:
 
         # Create PositionUpdateEvent
         event = PositionUpdateEvent(
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             type=EventType.POSITION_UPDATE,
             position_id=position_id,
             symbol=position['symbol'],
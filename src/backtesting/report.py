@@ -8,13 +8,16 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from src.backtesting.metrics import EquityCurve, equity_curve_to_arrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +36,7 @@ class BacktestReport:
     """
 
     def __init__(self, backtest_id: str, metrics: Dict,
-                 equity_curve: List[Tuple[datetime, float]],
+                 equity_curve: EquityCurve,
                  trades: List[Dict], initial_capital: float):
         """
         Initialize report generator.
@@ -41,7 +44,8 @@ class BacktestReport:
         Args:
             backtest_id: Unique backtest ID
             metrics: Metrics dict from PerformanceCalculator
-            equity_curve: List of (timestamp, portfolio_value) tuples
+            equity_curve: (timestamps, equity) arrays or list of
+                (timestamp, portfolio_value) tuples
             trades: List of trade dicts
             initial_capital: Starting capital
         """
@@ -51,6 +55,9 @@ class BacktestReport:
         self.trades = trades
         self.initial_capital = initial_capital
 
+        # Columnar equity curve (datetime64[ns], float64)
+        self._timestamps, self._equity = equity_curve_to_arrays(equity_curve)
+
         logger.info(f"BacktestReport initialized for {backtest_id}")
 
     def generate(self, output_dir: str = "reports/") -> str:
@@ -115,11 +122,11 @@ class BacktestReport:
         Returns:
             Path to chart file
         """
-        if len(self.equity_curve) < 2:
+        if len(self._equity) < 2:
             logger.warning("Insufficient data for equity curve")
             return ""
 
-        timestamps, equity = zip(*self.equity_curve)
+        timestamps, equity = self._timestamps, self._equity
 
         fig, ax = plt.subplots(figsize=(12, 6))
         ax.plot(timestamps, equity, linewidth=2, color='#2E86AB')
@@ -160,20 +167,22 @@ class BacktestReport:
         Returns:
             Path to chart file
         """
-        if len(self.equity_curve) < 2:
+        if len(self._equity) < 2:
             return ""
 
-        timestamps, equity = zip(*self.equity_curve)
-        equity_series = pd.Series(equity, index=pd.DatetimeIndex(timestamps))
+        # No-trade backtest: drawdown is identically zero, skip the chart
+        if np.ptp(self._equity) == 0.0:
+            logger.debug("Flat equity curve, skipping drawdown chart")
+            return ""
 
         # Calculate drawdown
-        running_max = equity_series.expanding().max()
-        drawdown = (equity_series - running_max) / running_max
+        running_max = np.maximum.accumulate(self._equity)
+        drawdown = (self._equity - running_max) / running_max
 
         fig, ax = plt.subplots(figsize=(12, 6))
-        ax.fill_between(drawdown.index, 0, drawdown.values,
+        ax.fill_between(self._timestamps, 0, drawdown,
                         alpha=0.5, color='#E63946')
-        ax.plot(drawdown.index, drawdown.values, linewidth=1, color='#E63946')
+        ax.plot(self._timestamps, drawdown, linewidth=1, color='#E63946')
 
         ax.set_title(f'Drawdown - {self.backtest_id}',
                     fontsize=16, fontweight='bold')
@@ -204,18 +213,22 @@ class BacktestReport:
         Returns:
             Path to chart file
         """
-        if len(self.equity_curve) < 2:
+        if len(self._equity) < 2:
+            return ""
+
+        # No-trade backtest: every return is zero, skip the chart
+        if np.ptp(self._equity) == 0.0:
+            logger.debug("Flat equity curve, skipping returns distribution chart")
             return ""
 
-        timestamps, equity = zip(*self.equity_curve)
-        equity_series = pd.Series(equity, index=pd.DatetimeIndex(timestamps))
-        daily_returns = equity_series.pct_change().dropna()
+        daily_returns = np.diff(self._equity) / self._equity[:-1]
+        daily_returns = daily_returns[~np.isnan(daily_returns)]
 
         if len(daily_returns) == 0:
             return ""
 
         fig, ax = plt.subplots(figsize=(12, 6))
-        ax.hist(daily_returns.values, bins=50, alpha=0.7, color='#457B9D',
+        ax.hist(daily_returns, bins=50, alpha=0.7, color='#457B9D',
                edgecolor='black')
 
         ax.set_title(f'Returns Distribution - {self.backtest_id}',
@@ -340,7 +353,7 @@ class BacktestReport:
         results = {
             'backtest_id': self.backtest_id,
             'initial_capital': self.initial_capital,
-            'final_value': self.equity_curve[-1][1] if self.equity_curve else 0,
+            'final_value': float(self._equity[-1]) if len(self._equity) else 0,
             'metrics': self.metrics,
             'num_trades': len(self.trades)
         }
@@ -385,7 +398,7 @@ class BacktestReport:
         return_class = 'positive' if returns.get('total_return_pct', 0) > 0 else 'negative'
 
         # Compute final value (avoid conditional in format spec)
-        final_value = self.equity_curve[-1][1] if self.equity_curve else 0
+        final_value = float(self._equity[-1]) if len(self._equity) else 0
 
         # Generate HTML
         html = f"""
@@ -9,10 +9,17 @@ Centralized configuration with:
 """
 
 import os
+import copy
+import functools
 import logging
+import mmap
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
-from omegaconf import OmegaConf, DictConfig
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+from omegaconf import OmegaConf
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -20,6 +27,277 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Prefer libyaml C bindings; fall back to the pure-Python loader
+try:
+    _SafeLoader = yaml.CSafeLoader
+except AttributeError:
+    _SafeLoader = yaml.SafeLoader
+
+
+# ${oc.env:VAR[,default]}. A bare ${name} is an OmegaConf node reference and
+# is left for OmegaConf, except in !ENV-tagged values where it names a variable.
+_ENV_INTERPOLATION = re.compile(
+    r'(?<!\\)\$\{oc\.env:(?P<name>[A-Za-z_]\w*)(?:,(?P<default>[^}]*))?\}'
+)
+_ENV_TAG_INTERPOLATION = re.compile(
+    r'(?<!\\)\$\{(?:oc\.env:(?P<name>[A-Za-z_]\w*)(?:,(?P<default>[^}]*))?'
+    r'|(?P<bare>[A-Za-z_]\w*))\}'
+)
+
+
+class _ConfigLoader(_SafeLoader):
+    """
+    Safe YAML loader for config files.
+
+    Keeps dates as strings (matches OmegaConf.load) and substitutes
+    environment variable interpolations while constructing strings.
+    Anything it cannot substitute sets needs_resolve, so the caller can
+    fall back to OmegaConf for that file.
+    """
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.needs_resolve = False
+        # Environment variables read during parsing (name -> value or None)
+        self.env_used: Dict[str, Optional[str]] = {}
+
+    def construct_env_str(self, node, pattern: re.Pattern = _ENV_INTERPOLATION) -> str:
+        """Construct a string scalar, substituting ${oc.env:...} interpolations."""
+        value = self.construct_scalar(node)
+        if '${' not in value:
+            return value
+
+        unresolved = False
+
+        def substitute(match):
+            nonlocal unresolved
+            name = match['name'] or match.groupdict().get('bare')
+            env_value = os.environ.get(name)
+            self.env_used[name] = env_value
+            if env_value is not None:
+                return env_value
+            default = match['default']
+            # Quoted/null defaults need OmegaConf's grammar
+            if default is not None and not re.search(r"['\"]|^\s*null\s*$", default):
+                return default.strip()
+            unresolved = True
+            return match.group(0)
+
+        result = pattern.sub(substitute, value)
+        if unresolved or '${' in pattern.sub('', value):
+            self.needs_resolve = True
+        return result
+
+    def construct_env_tag(self, node) -> str:
+        """Construct an !ENV scalar, where bare ${VAR} also names a variable."""
+        return self.construct_env_str(node, _ENV_TAG_INTERPOLATION)
+
+
+_ConfigLoader.add_constructor('tag:yaml.org,2002:str', _ConfigLoader.construct_env_str)
+_ConfigLoader.add_constructor('!ENV', _ConfigLoader.construct_env_tag)
+
+_ConfigLoader.yaml_implicit_resolvers = {
+    key: [(tag, regexp) for tag, regexp in resolvers
+          if tag != 'tag:yaml.org,2002:timestamp']
+    for key, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+}
+
+# Floats as OmegaConf resolves them: YAML 1.1 requires a dot, so without this
+# 1e-3 would load as the string '1e-3'
+_ConfigLoader.add_implicit_resolver(
+    'tag:yaml.org,2002:float',
+    re.compile(r"""^(?:
+         [-+]?[0-9]+(?:_[0-9]+)*\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+        |[-+]?[0-9]+(?:_[0-9]+)*(?:[eE][-+]?[0-9]+)
+        |\.[0-9]+(?:_[0-9]+)*(?:[eE][-+][0-9]+)?
+        |[-+]?[0-9]+(?:_[0-9]+)*(?::[0-5]?[0-9])+\.[0-9_]*
+        |[-+]?\.(?:inf|Inf|INF)
+        |\.(?:nan|NaN|NAN))$""", re.X),
+    list('-+0123456789.')
+)
+
+
+# Sentinel for missing keys in plain-dict lookups
+_MISSING = object()
+
+# Parsed YAML cache: absolute path -> (mtime, size, data, needs_resolve, env_used)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict, bool, Dict[str, Optional[str]]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# Files above this size are memory-mapped; smaller ones are streamed to the parser
+_MMAP_THRESHOLD = 64 * 1024
+# Read buffer for streamed files (Python's default is 8 KB)
+_READ_BUFFER_SIZE = 1024 * 1024
+
+# Keys every main config must define, as paths into the nested dict
+REQUIRED_KEYS: Tuple[Tuple[str, ...], ...] = (
+    ('system', 'mode'),
+    ('database', 'type'),
+    ('portfolio', 'initial_capital'),
+)
+VALID_MODES = frozenset({'backtest', 'paper', 'live'})
+
+
+def _construct(stream) -> Tuple[Dict, bool, Dict[str, Optional[str]]]:
+    """
+    Run _ConfigLoader over a stream.
+
+    Args:
+        stream: File handle or mmap
+
+    Returns:
+        Tuple of (parsed content or empty dict, needs_resolve, env_used)
+    """
+    loader = _ConfigLoader(stream)
+    try:
+        data = loader.get_single_data() or {}
+    finally:
+        loader.dispose()
+    return data, loader.needs_resolve, loader.env_used
+
+
+def _parse_yaml(path: Path) -> Tuple[Dict, bool, Dict[str, Optional[str]]]:
+    """
+    Parse a YAML file into plain Python containers.
+
+    Uses the libyaml C parser when available, which is much faster
+    than the pure-Python loader OmegaConf.load() uses internally. Small
+    files are streamed from a large-buffered handle; large files are
+    memory-mapped. Neither path copies the whole file into a bytes object.
+
+    Environment variables are substituted during the same pass; the
+    needs_resolve flag reports whether other interpolations remain.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Tuple of (parsed YAML content or empty dict, needs_resolve, env_used)
+    """
+    with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+        if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return _construct(f)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    mm.madvise(mmap.MADV_WILLNEED)
+            return _construct(mm)
+
+
+def _load_yaml(path: Path) -> Tuple[Dict, bool]:
+    """
+    Load a YAML file through the (mtime, size)-invalidated parse cache.
+
+    Repeated ConfigManager instantiations (tests, hot reload) reuse the
+    parsed result as long as the file is unchanged on disk and the
+    environment variables it used still have the same values. Callers
+    get a deep copy so mutations never leak into the cache.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Tuple of (parsed YAML content, needs_resolve)
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+
+    cached = _YAML_CACHE.get(key)
+    if (cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size
+            and all(os.environ.get(name) == value for name, value in cached[4].items())):
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2]), cached[3]
+
+    data, needs_resolve, env_used = _parse_yaml(key)
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, data, needs_resolve, env_used)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data), needs_resolve
+
+
+def _resolve(data: Dict) -> Dict:
+    """
+    Resolve remaining ${...} interpolations (node references, resolvers) once.
+
+    Args:
+        data: Parsed YAML content
+
+    Returns:
+        Plain dict with all interpolations resolved
+    """
+    return OmegaConf.to_container(OmegaConf.create(data), resolve=True)
+
+
+def _load_resolved(path: Path) -> Dict:
+    """
+    Load a YAML file, using OmegaConf only for non-environment interpolations.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Plain dict with all interpolations resolved
+    """
+    data, needs_resolve = _load_yaml(path)
+    return _resolve(data) if needs_resolve else data
+
+
+def _scan_strategy_enabled(path: Path) -> bool:
+    """
+    Read only the ``strategy.enabled`` flag from a strategy file.
+
+    Walks the YAML event stream and stops as soon as the flag is found,
+    so the rest of the document is never composed into Python objects.
+    A merge key or alias under ``strategy`` may supply the flag from
+    elsewhere in the file, so those fall back to a full parse.
+
+    Args:
+        path: Path to strategy YAML file
+
+    Returns:
+        True if the strategy is enabled
+    """
+    # Stack of open containers: [is_mapping, expecting_key, current_key]
+    stack = []
+
+    with open(path, 'rb') as f:
+        for event in yaml.parse(f, Loader=_ConfigLoader):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                stack.append([isinstance(event, yaml.MappingStartEvent), True, None])
+                continue
+
+            if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                stack.pop()
+            elif isinstance(event, yaml.ScalarEvent) and stack and stack[-1][0] and stack[-1][1]:
+                if (event.value == '<<' and event.implicit[0]
+                        and len(stack) == 2 and stack[0][2] == 'strategy'):
+                    break
+                stack[-1][1] = False
+                stack[-1][2] = event.value
+                continue
+            elif isinstance(event, yaml.ScalarEvent):
+                keys = [entry[2] for entry in stack if entry[0]]
+                if len(stack) == 2 and keys == ['strategy', 'enabled']:
+                    if event.implicit[0]:  # Plain scalar: resolve bool/int
+                        return bool(yaml.load(event.value, Loader=_ConfigLoader))
+                    return bool(event.value)
+            elif not isinstance(event, yaml.AliasEvent):
+                continue
+            elif stack and stack[0][2] == 'strategy' and (len(stack) > 1 or not stack[0][1]):
+                break
+
+            # A mapping value has been consumed; next scalar is a key
+            if stack and stack[-1][0]:
+                stack[-1][1] = True
+        else:
+            return False
+
+    return bool(_load_resolved(path).get('strategy', {}).get('enabled', False))
+
 
 class ConfigManager:
     """
@@ -40,8 +318,11 @@ class ConfigManager:
             config_path: Path to main configuration file
         """
         self.config_path = Path(config_path)
-        self.config: Optional[DictConfig] = None
-        self.strategies: Dict[str, DictConfig] = {}
+        self.config: Optional[Dict] = None  # Resolved plain dict
+        self.strategies: Dict[str, Dict] = {}  # Parsed on first use
+        self._strategy_paths: Dict[str, Path] = {}
+        self._enabled_symbols: Dict[Optional[str], Tuple[str, ...]] = {}
+        self._valid = False
 
         self.load_config()
 
@@ -51,36 +332,48 @@ class ConfigManager:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
-        self.config = OmegaConf.load(self.config_path)
-
-        # Resolve environment variables
-        OmegaConf.resolve(self.config)
+        # Resolve environment variables once; everything downstream is plain dicts
+        self.config = _load_resolved(self.config_path)
 
         # Load risk config
-        if hasattr(self.config, 'risk_config'):
-            risk_path = Path(self.config.risk_config)
+        if 'risk_config' in self.config:
+            risk_path = Path(self.config['risk_config'])
             if risk_path.exists():
-                self.config.risk = OmegaConf.load(risk_path)
+                self.config['risk'] = _load_resolved(risk_path)
                 logger.info(f"Loaded risk config from {risk_path}")
 
         # Load strategy configs
-        if hasattr(self.config, 'strategies_config'):
-            strategies_dir = Path(self.config.strategies_config)
+        if 'strategies_config' in self.config:
+            strategies_dir = Path(self.config['strategies_config'])
             if strategies_dir.exists():
                 self._load_strategies(strategies_dir)
 
+        self._cached_lookup = functools.lru_cache(maxsize=None)(self._lookup)
+
+        # Precompute enabled symbol lists
+        crypto = self._collect_enabled_symbols('data.crypto_symbols')
+        stock = self._collect_enabled_symbols('data.stock_symbols')
+        self._enabled_symbols = {
+            'CRYPTO': crypto,
+            'STOCK': stock,
+            None: crypto + stock
+        }
+
+        self._valid = self._validate()
+
         logger.info(f"Configuration loaded from {self.config_path}")
 
     def _load_strategies(self, strategies_dir: Path):
-        """Load all strategy configuration files."""
+        """
+        Index strategy configuration files.
+
+        Files are only parsed when first requested via get_strategy_config().
+        """
+        self.strategies = {}
+        self._strategy_paths = {}
         for file in strategies_dir.glob("*.yaml"):
-            try:
-                strategy_name = file.stem
-                strategy_config = OmegaConf.load(file)
-                self.strategies[strategy_name] = strategy_config
-                logger.info(f"Loaded strategy config: {strategy_name}")
-            except Exception as e:
-                logger.error(f"Error loading strategy config {file}: {e}")
+            self._strategy_paths[file.stem] = file
+            logger.info(f"Found strategy config: {file.stem}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -93,78 +386,129 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        try:
-            return OmegaConf.select(self.config, key, default=default)
-        except Exception as e:
-            logger.warning(f"Error getting config key '{key}': {e}")
-            return default
+        value = self._cached_lookup(key)
+        return default if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        """
+        Walk the plain-dict config by dot-notation key.
 
-    def get_strategy_config(self, strategy_name: str) -> Optional[DictConfig]:
-        """Get configuration for specific strategy."""
-        return self.strategies.get(strategy_name)
+        Args:
+            key: Configuration key
+
+        Returns:
+            Configuration value, or _MISSING if not found
+        """
+        node = self.config
+        for part in key.split('.'):
+            if isinstance(node, dict):
+                node = node.get(part, _MISSING)
+            elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            else:
+                return _MISSING
+            if node is _MISSING:
+                return _MISSING
+        return node
+
+    def get_strategy_config(self, strategy_name: str) -> Optional[Dict]:
+        """Get configuration for specific strategy (parsed on first call)."""
+        if strategy_name not in self.strategies:
+            file = self._strategy_paths.get(strategy_name)
+            if file is None:
+                return None
+            try:
+                self.strategies[strategy_name] = _load_resolved(file)
+                logger.info(f"Loaded strategy config: {strategy_name}")
+            except Exception as e:
+                logger.error(f"Error loading strategy config {file}: {e}")
+                return None
+        return self.strategies[strategy_name]
 
-    def get_enabled_strategies(self) -> Dict[str, DictConfig]:
-        """Get all enabled strategies."""
+    def get_enabled_strategies(self) -> Dict[str, Dict]:
+        """Get all enabled strategies (disabled ones are never fully parsed)."""
         enabled = {}
-        for name, config in self.strategies.items():
-            if config.get('strategy', {}).get('enabled', False):
-                enabled[name] = config
+        for name, file in self._strategy_paths.items():
+            if name in self.strategies:
+                is_enabled = self.strategies[name].get('strategy', {}).get('enabled', False)
+            else:
+                try:
+                    is_enabled = _scan_strategy_enabled(file)
+                except Exception as e:
+                    logger.error(f"Error scanning strategy config {file}: {e}")
+                    is_enabled = False
+
+            if is_enabled:
+                config = self.get_strategy_config(name)
+                if config is not None:
+                    enabled[name] = config
         return enabled
 
-    def get_enabled_symbols(self, asset_type: str = None) -> list:
+    def get_enabled_symbols(self, asset_type: str = None) -> Tuple[str, ...]:
         """
-        Get list of enabled trading symbols.
+        Get enabled trading symbols (precomputed at load time).
 
         Args:
             asset_type: Filter by 'CRYPTO' or 'STOCK', None for all
 
         Returns:
-            List of enabled symbols
+            Tuple of enabled symbols
         """
-        symbols = []
+        return self._enabled_symbols.get(asset_type, ())
 
-        # Get crypto symbols
-        if asset_type is None or asset_type == 'CRYPTO':
-            crypto_symbols = self.get('data.crypto_symbols', [])
-            for symbol_config in crypto_symbols:
-                if symbol_config.get('enabled', False):
-                    symbols.append(symbol_config['symbol'])
+    def _collect_enabled_symbols(self, key: str) -> Tuple[str, ...]:
+        """
+        Collect enabled symbols from a symbol list config key.
 
-        # Get stock symbols
-        if asset_type is None or asset_type == 'STOCK':
-            stock_symbols = self.get('data.stock_symbols', [])
-            for symbol_config in stock_symbols:
-                if symbol_config.get('enabled', False):
-                    symbols.append(symbol_config['symbol'])
+        Args:
+            key: Config key of a list of {symbol, enabled} entries
 
-        return symbols
+        Returns:
+            Tuple of enabled symbols
+        """
+        return tuple(
+            symbol_config['symbol']
+            for symbol_config in (self.get(key, []) or [])
+            if symbol_config.get('enabled', False)
+        )
 
     def validate(self) -> bool:
         """
         Validate configuration.
 
+        Validation runs once at the end of load_config(); this returns
+        that result.
+
         Returns:
             True if valid, False otherwise
         """
-        required_keys = [
-            'system.mode',
-            'database.type',
-            'portfolio.initial_capital'
-        ]
+        return self._valid
+
+    def _validate(self) -> bool:
+        """
+        Check required keys, system mode and initial capital.
 
-        for key in required_keys:
-            if self.get(key) is None:
-                logger.error(f"Missing required config key: {key}")
+        Returns:
+            True if valid, False otherwise
+        """
+        values = {}
+        for path in REQUIRED_KEYS:
+            node = self.config
+            for part in path:
+                node = node.get(part) if isinstance(node, dict) else None
+            if node is None:
+                logger.error(f"Missing required config key: {'.'.join(path)}")
                 return False
+            values[path[-1]] = node
 
         # Validate system mode
-        mode = self.get('system.mode')
-        if mode not in ['backtest', 'paper', 'live']:
+        mode = values['mode']
+        if mode not in VALID_MODES:
             logger.error(f"Invalid system mode: {mode}")
             return False
 
         # Validate portfolio
-        initial_capital = self.get('portfolio.initial_capital')
+        initial_capital = values['initial_capital']
         if initial_capital <= 0:
             logger.error(f"Invalid initial capital: {initial_capital}")
             return False
@@ -174,7 +518,7 @@ class ConfigManager:
 
     def to_dict(self) -> Dict:
         """Convert configuration to dictionary."""
-        return OmegaConf.to_container(self.config, resolve=True)
+        return copy.deepcopy(self.config)
 
     def __repr__(self) -> str:
         return f"ConfigManager(config_path='{self.config_path}')"
@@ -228,10 +572,10 @@ if __name__ == "__main__":
     # Get specific strategy config
     mean_rev_config = config.get_strategy_config('mean_reversion_crypto')
     if mean_rev_config:
-        print(f"\nMean Reversion BB Window: {mean_rev_config.strategy.parameters.bb_window}")
+        print(f"\nMean Reversion BB Window: {mean_rev_config['strategy']['parameters']['bb_window']}")
 
     # Print full config
     print("\n" + "="*50)
     print("Full Configuration:")
     print("="*50)
-    print(OmegaConf.to_yaml(config.config))
+    print(yaml.safe_dump(config.config, sort_keys=False))
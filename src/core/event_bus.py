@@ -7,15 +7,92 @@ Supports both synchronous and asynchronous event handling.
 
 import asyncio
 import logging
-from collections import defaultdict
-from typing import Callable, List, Optional, Dict
-from datetime import datetime
+from collections import defaultdict, deque
+from typing import Callable, List, Optional, Dict, Tuple
+from datetime import datetime, timezone
 import queue
+import threading
 
-from .events import Event, EventType
+import numpy as np
+
+from .events import Event, EventType, MarketDataBatchEvent, SYMBOL_IDS
 
 logger = logging.getLogger(__name__)
 
+# Compact integer codes for event types (columnar history)
+_EVENT_TYPES: Tuple[EventType, ...] = tuple(EventType)
+_EVENT_TYPE_CODES: Dict[EventType, int] = {t: i for i, t in enumerate(_EVENT_TYPES)}
+
+_EPOCH = datetime(1970, 1, 1)
+_INITIAL_HISTORY_CAPACITY = 1024
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """
+    Convert a datetime to integer nanoseconds since the epoch.
+
+    Timezone-aware values are converted to UTC; naive values are taken as
+    UTC. History filtering compares these integers, so mixing aware and
+    naive timestamps never raises.
+
+    Args:
+        timestamp: Datetime (or pandas Timestamp)
+
+    Returns:
+        Nanoseconds since 1970-01-01
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+class EventRing:
+    """
+    Append-only event store backed by a preallocated NumPy object array.
+
+    Capacity doubles only when full, and can be sized up front when the
+    number of events is known, so long backtests avoid repeated list
+    reallocation. Supports len(), iteration, integer/slice indexing and
+    fancy-index lookups via take().
+    """
+
+    __slots__ = ('_items', '_len')
+
+    def __init__(self, capacity: int = _INITIAL_HISTORY_CAPACITY):
+        self._items = np.empty(max(capacity, 1), dtype=object)
+        self._len = 0
+
+    def append(self, event: Event):
+        """Append an event, doubling capacity if full."""
+        n = self._len
+        if n == len(self._items):
+            items = np.empty(2 * n, dtype=object)
+            items[:n] = self._items
+            self._items = items
+        self._items[n] = event
+        self._len = n + 1
+
+    def clear(self):
+        """Remove all events (capacity is kept)."""
+        self._items[:self._len] = None
+        self._len = 0
+
+    def take(self, indices: np.ndarray) -> List[Event]:
+        """Events at the given positions, as a list."""
+        return self._items[:self._len][indices].tolist()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        return iter(self._items[:self._len])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._items[:self._len][index].tolist()
+        return self._items[:self._len][index]
+
 
 class EventBus:
     """
@@ -28,18 +105,33 @@ class EventBus:
     - Event filtering
     """
 
-    def __init__(self, mode: str = 'live'):
+    def __init__(self, mode: str = 'live', expected_events: Optional[int] = None):
         """
         Initialize event bus.
 
         Args:
             mode: 'live' or 'backtest'
                   In backtest mode, events are stored for analysis
+            expected_events: Expected number of events, used to preallocate
+                             backtest history (it still grows if exceeded)
         """
+        capacity = expected_events or _INITIAL_HISTORY_CAPACITY
         self.mode = mode
         self.subscribers: Dict[EventType, List[Callable]] = defaultdict(list)
-        self.event_queue = queue.Queue()
-        self.event_history: List[Event] = [] if mode == 'backtest' else None
+        # Immutable snapshot of subscribers used by the dispatch hot loop
+        self._dispatch: Dict[EventType, Tuple[Callable, ...]] = {}
+        # publish/process run on the same thread, so no lock is needed
+        # (see ThreadedEventBus for cross-thread publishing)
+        self.event_queue = deque()
+        self.event_history: Optional[EventRing] = EventRing(capacity) if mode == 'backtest' else None
+        # (type code, UTC timestamp ns, symbol ID) of each history entry, for
+        # vectorized filtering; empty in live mode, which keeps no history
+        columns = capacity if self.event_history is not None else 0
+        self._h_type = np.empty(columns, dtype=np.uint8)
+        self._h_ts = np.empty(columns, dtype=np.int64)
+        self._h_symbol = np.empty(columns, dtype=np.int32)
+        self._h_len = 0
+        self._h_ts_sorted = True
         self.running = False
 
         logger.info(f"EventBus initialized in {mode} mode")
@@ -54,13 +146,19 @@ class EventBus:
                      Should accept Event as parameter
         """
         self.subscribers[event_type].append(handler)
-        logger.debug(f"Subscribed {handler.__name__} to {event_type.value}")
+        self._rebuild_dispatch(event_type)
+        logger.debug("Subscribed %s to %s", handler.__name__, event_type.value)
 
     def unsubscribe(self, event_type: EventType, handler: Callable):
         """Unsubscribe from event type."""
-        if handler in self.subscribers[event_type]:
+        if handler in self.subscribers.get(event_type, ()):
             self.subscribers[event_type].remove(handler)
-            logger.debug(f"Unsubscribed {handler.__name__} from {event_type.value}")
+            self._rebuild_dispatch(event_type)
+            logger.debug("Unsubscribed %s from %s", handler.__name__, event_type.value)
+
+    def _rebuild_dispatch(self, event_type: EventType):
+        """Refresh the dispatch snapshot for an event type after (un)subscribe."""
+        self._dispatch[event_type] = tuple(self.subscribers[event_type])
 
     def publish(self, event: Event):
         """
@@ -71,12 +169,51 @@ class EventBus:
         """
         # Store in history for backtesting
         if self.event_history is not None:
-            self.event_history.append(event)
+            self._record_history(event)
 
         # Add to queue
-        self.event_queue.put(event)
+        self.event_queue.append(event)
+
+        # Per-event hot path: skip even the argument lookups unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published %s event at %s", event.type.value, event.timestamp)
+
+        if event.type is EventType.MARKET_DATA_BATCH:
+            self._publish_batch_bars(event)
+
+    def publish_many(self, events: List[Event]):
+        """
+        Publish several events at once.
+
+        Equivalent to calling publish() for each event, with a single
+        queue extend. MarketDataBatchEvents should go through publish().
+
+        Args:
+            events: Events to publish, in order
+        """
+        if self.event_history is not None:
+            for event in events:
+                self._record_history(event)
+
+        self.event_queue.extend(events)
 
-        logger.debug(f"Published {event.type.value} event at {event.timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published %d events", len(events))
+
+    def _publish_batch_bars(self, event: MarketDataBatchEvent):
+        """
+        Fan a market data batch out to per-bar subscribers.
+
+        Batch subscribers get the whole array in a single call. Individual
+        MarketDataEvents are only built when something subscribes to
+        MARKET_DATA, so purely vectorized consumers skip per-bar objects.
+
+        Args:
+            event: Published batch event
+        """
+        if self._dispatch.get(EventType.MARKET_DATA):
+            for bar_event in event.iter_events():
+                self.publish(bar_event)
 
     def process_events(self):
         """
@@ -84,39 +221,68 @@ class EventBus:
 
         Called in main loop to dispatch events to subscribers.
         """
-        while not self.event_queue.empty():
+        while self.event_queue:
+            event = self.event_queue.popleft()
             try:
-                event = self.event_queue.get_nowait()
                 self._dispatch_event(event)
-            except queue.Empty:
-                break
             except Exception as e:
                 logger.error(f"Error processing event: {e}", exc_info=True)
 
     def _dispatch_event(self, event: Event):
         """Dispatch event to subscribers."""
-        event_type = event.type
-
         # Call subscribers for this specific event type
-        if event_type in self.subscribers:
-            for handler in self.subscribers[event_type]:
+        handlers = self._dispatch.get(event.type)
+        if handlers:
+            for handler in handlers:
                 try:
                     handler(event)
                 except Exception as e:
                     logger.error(
-                        f"Error in {handler.__name__} handling {event_type.value}: {e}",
+                        f"Error in {handler.__name__} handling {event.type.value}: {e}",
                         exc_info=True
                     )
 
+    def _record_history(self, event: Event):
+        """
+        Append event to history and its columnar index.
+
+        Args:
+            event: Event to record
+        """
+        self.event_history.append(event)
+
+        n = self._h_len
+        if n == len(self._h_ts):
+            self._grow_columns()
+        ts_ns = _to_ns(event.timestamp)
+        if n and ts_ns < self._h_ts[n - 1]:
+            self._h_ts_sorted = False
+        self._h_type[n] = _EVENT_TYPE_CODES[event.type]
+        self._h_ts[n] = ts_ns
+        self._h_symbol[n] = event.symbol_id
+        self._h_len = n + 1
+
+    def _grow_columns(self):
+        """Double the capacity of the columnar history arrays."""
+        capacity = 2 * len(self._h_ts)
+        for name in ('_h_type', '_h_ts', '_h_symbol'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._h_len] = old[:self._h_len]
+            setattr(self, name, new)
+
     def clear_history(self):
         """Clear event history (for backtesting)."""
         if self.event_history is not None:
             self.event_history.clear()
+            self._h_len = 0
+            self._h_ts_sorted = True
             logger.debug("Event history cleared")
 
     def get_history(self, event_type: Optional[EventType] = None,
                    start_time: Optional[datetime] = None,
-                   end_time: Optional[datetime] = None) -> List[Event]:
+                   end_time: Optional[datetime] = None,
+                   symbol: Optional[str] = None) -> List[Event]:
         """
         Get event history with optional filtering.
 
@@ -124,6 +290,7 @@ class EventBus:
             event_type: Filter by event type
             start_time: Filter events after this time
             end_time: Filter events before this time
+            symbol: Filter by symbol
 
         Returns:
             List of events matching criteria
@@ -131,25 +298,48 @@ class EventBus:
         if self.event_history is None:
             return []
 
-        events = self.event_history
-
-        # Filter by event type
+        if not (event_type or start_time or end_time or symbol):
+            return self.event_history[:]
+
+        symbol_id = None
+        if symbol:
+            # Symbols are compared by integer ID; an unseen symbol matches nothing
+            symbol_id = SYMBOL_IDS.get(symbol)
+            if symbol_id is None:
+                return []
+
+        ts = self._h_ts[:self._h_len]
+        lo, hi = 0, len(ts)
+        mask = None
+        if self._h_ts_sorted:
+            # Time-ordered history (the backtest case): bisect the time range
+            if start_time:
+                lo = int(np.searchsorted(ts, _to_ns(start_time), 'left'))
+            if end_time:
+                hi = max(lo, int(np.searchsorted(ts, _to_ns(end_time), 'right')))
+            if not (event_type or symbol):
+                return self.event_history[lo:hi]
+        else:
+            mask = np.ones(len(ts), dtype=bool)
+            if start_time:
+                mask &= ts >= _to_ns(start_time)
+            if end_time:
+                mask &= ts <= _to_ns(end_time)
+
+        # Type and symbol filters in one pass over the (narrowed) columns
+        if mask is None:
+            mask = np.ones(hi - lo, dtype=bool)
         if event_type:
-            events = [e for e in events if e.type == event_type]
-
-        # Filter by time
-        if start_time:
-            events = [e for e in events if e.timestamp >= start_time]
-        if end_time:
-            events = [e for e in events if e.timestamp <= end_time]
-
-        return events
+            mask &= self._h_type[lo:hi] == _EVENT_TYPE_CODES[event_type]
+        if symbol_id is not None:
+            mask &= self._h_symbol[lo:hi] == symbol_id
+        return self.event_history.take(lo + np.flatnonzero(mask))
 
     def get_stats(self) -> Dict:
         """Get event bus statistics."""
         stats = {
             'mode': self.mode,
-            'queue_size': self.event_queue.qsize(),
+            'queue_size': self._queue_size(),
             'subscriber_count': {
                 event_type.value: len(handlers)
                 for event_type, handlers in self.subscribers.items()
@@ -159,13 +349,71 @@ class EventBus:
         if self.event_history is not None:
             stats['history_size'] = len(self.event_history)
             # Count by event type
-            type_counts = defaultdict(int)
-            for event in self.event_history:
-                type_counts[event.type.value] += 1
-            stats['event_counts'] = dict(type_counts)
+            counts = np.bincount(self._h_type[:self._h_len], minlength=len(_EVENT_TYPES))
+            stats['event_counts'] = {
+                _EVENT_TYPES[code].value: int(count)
+                for code, count in enumerate(counts) if count
+            }
 
         return stats
 
+    def _queue_size(self) -> int:
+        """Number of events waiting to be processed."""
+        return len(self.event_queue)
+
+
+class ThreadedEventBus(EventBus):
+    """
+    Event bus that accepts events published from other threads.
+
+    Uses a lock-protected queue.Queue instead of a deque, and records
+    history under a lock. Only needed when publishers (e.g. data
+    collectors) run on a different thread than process_events().
+    """
+
+    def __init__(self, mode: str = 'live', expected_events: Optional[int] = None):
+        super().__init__(mode, expected_events)
+        self.event_queue = queue.Queue()
+        self._history_lock = threading.Lock()
+
+    def publish(self, event: Event):
+        """Publish event (thread-safe)."""
+        if self.event_history is not None:
+            with self._history_lock:
+                self._record_history(event)
+
+        self.event_queue.put(event)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published %s event at %s", event.type.value, event.timestamp)
+
+        if event.type is EventType.MARKET_DATA_BATCH:
+            self._publish_batch_bars(event)
+
+    def publish_many(self, events: List[Event]):
+        """Publish several events at once (thread-safe)."""
+        if self.event_history is not None:
+            with self._history_lock:
+                for event in events:
+                    self._record_history(event)
+        for event in events:
+            self.event_queue.put(event)
+
+    def process_events(self):
+        """Process all events currently in queue."""
+        while not self.event_queue.empty():
+            try:
+                event = self.event_queue.get_nowait()
+                self._dispatch_event(event)
+            except queue.Empty:
+                break
+            except Exception as e:
+                logger.error(f"Error processing event: {e}", exc_info=True)
+
+    def _queue_size(self) -> int:
+        """Number of events waiting to be processed."""
+        return self.event_queue.qsize()
+
 
 class AsyncEventBus(EventBus):
     """
@@ -174,56 +422,67 @@ class AsyncEventBus(EventBus):
     Use this for production with async/await pattern.
     """
 
-    def __init__(self, mode: str = 'live'):
-        super().__init__(mode)
+    def __init__(self, mode: str = 'live', expected_events: Optional[int] = None):
+        super().__init__(mode, expected_events)
         self.async_queue = asyncio.Queue()
+        # Handlers split by kind at subscribe time: (coroutine functions, sync)
+        self._async_dispatch: Dict[EventType, Tuple[Tuple[Callable, ...], Tuple[Callable, ...]]] = {}
+
+    def _rebuild_dispatch(self, event_type: EventType):
+        """Refresh dispatch snapshots, classifying handlers as async or sync."""
+        super()._rebuild_dispatch(event_type)
+        handlers = self.subscribers[event_type]
+        self._async_dispatch[event_type] = (
+            tuple(h for h in handlers if asyncio.iscoroutinefunction(h)),
+            tuple(h for h in handlers if not asyncio.iscoroutinefunction(h))
+        )
 
     async def publish_async(self, event: Event):
         """Publish event asynchronously."""
         if self.event_history is not None:
-            self.event_history.append(event)
+            self._record_history(event)
 
         await self.async_queue.put(event)
-        logger.debug(f"Published {event.type.value} event (async)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published %s event (async)", event.type.value)
 
     async def process_events_async(self):
         """Process events asynchronously."""
         while not self.async_queue.empty():
             try:
-                event = await asyncio.wait_for(
-                    self.async_queue.get(),
-                    timeout=0.1
-                )
+                event = self.async_queue.get_nowait()
                 await self._dispatch_event_async(event)
-            except asyncio.TimeoutError:
+            except asyncio.QueueEmpty:
                 break
             except Exception as e:
                 logger.error(f"Error processing async event: {e}", exc_info=True)
 
     async def _dispatch_event_async(self, event: Event):
         """Dispatch event to async subscribers."""
-        event_type = event.type
+        split = self._async_dispatch.get(event.type)
+        if not split:
+            return
 
-        if event_type in self.subscribers:
-            tasks = []
-            for handler in self.subscribers[event_type]:
-                try:
-                    # Check if handler is async
-                    if asyncio.iscoroutinefunction(handler):
-                        tasks.append(handler(event))
-                    else:
-                        # Run sync handler in executor
-                        loop = asyncio.get_event_loop()
-                        tasks.append(loop.run_in_executor(None, handler, event))
-                except Exception as e:
-                    logger.error(
-                        f"Error preparing {handler.__name__}: {e}",
-                        exc_info=True
-                    )
+        async_handlers, sync_handlers = split
+        tasks = []
+        for handler in async_handlers:
+            try:
+                tasks.append(handler(event))
+            except Exception as e:
+                logger.error(
+                    f"Error preparing {handler.__name__}: {e}",
+                    exc_info=True
+                )
+
+        if sync_handlers:
+            # Run sync handlers in executor
+            loop = asyncio.get_running_loop()
+            for handler in sync_handlers:
+                tasks.append(loop.run_in_executor(None, handler, event))
 
-            # Wait for all handlers to complete
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all handlers to complete
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 # Example usage
@@ -5,15 +5,20 @@ All communication between components happens through events.
 This ensures the same code runs in backtest and live modes.
 """
 
-from dataclasses import dataclass, field
+import functools
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
 
 
 class EventType(Enum):
     """Event types in the system."""
     MARKET_DATA = "market_data"
+    MARKET_DATA_BATCH = "market_data_batch"
     SIGNAL = "signal"
     ORDER = "order"
     FILL = "fill"
@@ -23,15 +28,96 @@ class EventType(Enum):
     SYSTEM = "system"
 
 
-@dataclass
+# Process-wide registries of small integer IDs for repeated identifiers
+SYMBOL_IDS: Dict[str, int] = {}
+ASSET_TYPE_IDS: Dict[str, int] = {}
+
+_INTERNED_FIELDS = ('symbol', 'asset_type', 'strategy_id')
+
+
+def _registry_id(registry: Dict[str, int], value: Optional[str]) -> int:
+    """Return value's ID in registry, assigning the next one if new (-1 for None)."""
+    if value is None:
+        return -1
+    key = registry.get(value)
+    if key is None:
+        key = registry[value] = len(registry)
+    return key
+
+
+@functools.lru_cache(maxsize=None)
+def _interned_fields(event_cls: type) -> Tuple[str, ...]:
+    """Names of an event class's identifier fields that are interned."""
+    names = {f.name for f in fields(event_cls)}
+    return tuple(name for name in _INTERNED_FIELDS if name in names)
+
+
+@functools.lru_cache(maxsize=None)
+def _payload_fields(event_cls: type) -> Tuple[str, ...]:
+    """Names of an event class's payload fields (all but type/timestamp/private)."""
+    return tuple(
+        f.name for f in fields(event_cls)
+        if f.name not in ('type', 'timestamp') and not f.name.startswith('_')
+    )
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Event:
-    """Base event class."""
+    """
+    Base event class.
+
+    Events are frozen, keyword-only dataclasses with __slots__ (no
+    per-instance __dict__): they record something that already happened.
+    Each subclass defaults `type` to its own EventType. The serialized form
+    returned by to_dict() is built once and cached.
+
+    Identifier strings (symbol, asset_type, strategy_id) are interned, and
+    symbol/asset_type are also mapped to integer IDs (SYMBOL_IDS,
+    ASSET_TYPE_IDS) so filters can compare ints instead of strings.
+    """
     type: EventType
     timestamp: datetime
-    data: Dict[str, Any] = field(default_factory=dict)
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    _symbol_id: int = field(default=-1, init=False, repr=False, compare=False)
+    _asset_type_id: int = field(default=-1, init=False, repr=False, compare=False)
+
+    @property
+    def symbol_id(self) -> int:
+        """Integer ID of the event's symbol (-1 if it has none)."""
+        return self._symbol_id
+
+    @property
+    def asset_type_id(self) -> int:
+        """Integer ID of the event's asset type (-1 if it has none)."""
+        return self._asset_type_id
+
+    def __post_init__(self):
+        self._intern_identifiers()
+
+    def _intern_identifiers(self):
+        """Intern identifier strings and look up their integer IDs."""
+        for name in _interned_fields(self.__class__):
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+                if name == 'symbol':
+                    object.__setattr__(self, '_symbol_id', _registry_id(SYMBOL_IDS, value))
+                elif name == 'asset_type':
+                    object.__setattr__(self, '_asset_type_id', _registry_id(ASSET_TYPE_IDS, value))
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Event payload (every field except type/timestamp), built on demand."""
+        return {name: getattr(self, name) for name in _payload_fields(self.__class__)}
 
     def to_dict(self) -> Dict:
-        """Convert event to dictionary."""
+        """Convert event to dictionary (cached after first call)."""
+        if self._dict is None:
+            object.__setattr__(self, '_dict', self._build_dict())
+        return self._dict
+
+    def _build_dict(self) -> Dict:
+        """Build the serialized form of the event."""
         return {
             'type': self.type.value,
             'timestamp': self.timestamp.isoformat(),
@@ -39,27 +125,20 @@ class Event:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class MarketDataEvent(Event):
     """
     Market data update event.
 
     Published when new price/volume data arrives.
     """
+    type: EventType = EventType.MARKET_DATA
     symbol: str = ""
     asset_type: str = ""
     ohlcv: Dict[str, float] = field(default_factory=dict)
     data_source: str = ""
 
-    def __init__(self, timestamp: datetime, symbol: str, asset_type: str,
-                 ohlcv: Dict[str, float], data_source: str):
-        super().__init__(EventType.MARKET_DATA, timestamp)
-        self.symbol = symbol
-        self.asset_type = asset_type
-        self.ohlcv = ohlcv
-        self.data_source = data_source
-
-    def to_dict(self) -> Dict:
+    def _build_dict(self) -> Dict:
         return {
             'type': self.type.value,
             'timestamp': self.timestamp.isoformat(),
@@ -70,13 +149,83 @@ class MarketDataEvent(Event):
         }
 
 
-@dataclass
+# Row layout of MarketDataBatchEvent.bars
+MARKET_DATA_BATCH_DTYPE = np.dtype([
+    ('timestamp_ns', 'i8'),
+    ('symbol_id', 'i4'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+])
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MarketDataBatchEvent(Event):
+    """
+    Batch of market data bars in columnar form.
+
+    Carries many bars as one structured array (MARKET_DATA_BATCH_DTYPE), so
+    numeric handlers can work on whole columns with NumPy instead of
+    receiving one MarketDataEvent per bar. Each row's symbol_id indexes
+    into `symbols`.
+    """
+    type: EventType = EventType.MARKET_DATA_BATCH
+    bars: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=MARKET_DATA_BATCH_DTYPE)
+    )
+    symbols: Tuple[str, ...] = ()
+    asset_type: str = ""
+    data_source: str = ""
+
+    def iter_events(self) -> Iterator[MarketDataEvent]:
+        """
+        Expand the batch into one MarketDataEvent per bar.
+
+        Yields:
+            MarketDataEvent for each row, in array order
+        """
+        bars = self.bars
+        columns = zip(
+            bars['timestamp_ns'].view('datetime64[ns]').astype('datetime64[us]').tolist(),
+            bars['symbol_id'].tolist(),
+            bars['open'].tolist(),
+            bars['high'].tolist(),
+            bars['low'].tolist(),
+            bars['close'].tolist(),
+            bars['volume'].tolist(),
+        )
+        symbols = self.symbols
+        for timestamp, symbol_id, open_, high, low, close, volume in columns:
+            yield MarketDataEvent(
+                timestamp=timestamp,
+                symbol=symbols[symbol_id],
+                asset_type=self.asset_type,
+                ohlcv={'open': open_, 'high': high, 'low': low,
+                       'close': close, 'volume': volume},
+                data_source=self.data_source
+            )
+
+    def _build_dict(self) -> Dict:
+        return {
+            'type': self.type.value,
+            'timestamp': self.timestamp.isoformat(),
+            'symbols': list(self.symbols),
+            'asset_type': self.asset_type,
+            'data_source': self.data_source,
+            'bars': self.bars.tolist()
+        }
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class SignalEvent(Event):
     """
     Trading signal event.
 
     Published by strategies to indicate trading opportunity.
     """
+    type: EventType = EventType.SIGNAL
     symbol: str = ""
     asset_type: str = ""
     strategy_id: str = ""
@@ -85,19 +234,12 @@ class SignalEvent(Event):
     price: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __init__(self, timestamp: datetime, symbol: str, asset_type: str,
-                 strategy_id: str, signal_type: str, confidence: float,
-                 price: float, metadata: Dict[str, Any] = None):
-        super().__init__(EventType.SIGNAL, timestamp)
-        self.symbol = symbol
-        self.asset_type = asset_type
-        self.strategy_id = strategy_id
-        self.signal_type = signal_type
-        self.confidence = confidence
-        self.price = price
-        self.metadata = metadata or {}
+    def __post_init__(self):
+        if self.metadata is None:
+            object.__setattr__(self, 'metadata', {})
+        self._intern_identifiers()
 
-    def to_dict(self) -> Dict:
+    def _build_dict(self) -> Dict:
         return {
             'type': self.type.value,
             'timestamp': self.timestamp.isoformat(),
@@ -111,13 +253,14 @@ class SignalEvent(Event):
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class OrderEvent(Event):
     """
     Order request event.
 
     Published when a position should be opened/closed.
     """
+    type: EventType = EventType.ORDER
     order_id: str = ""
     symbol: str = ""
     asset_type: str = ""
@@ -129,22 +272,7 @@ class OrderEvent(Event):
     strategy_id: str = ""
     position_id: Optional[int] = None
 
-    def __post_init__(self):
-        self.type = EventType.ORDER
-        self.data = {
-            'order_id': self.order_id,
-            'symbol': self.symbol,
-            'asset_type': self.asset_type,
-            'side': self.side,
-            'order_type': self.order_type,
-            'quantity': self.quantity,
-            'price': self.price,
-            'stop_price': self.stop_price,
-            'strategy_id': self.strategy_id,
-            'position_id': self.position_id
-        }
-
-    def to_dict(self) -> Dict:
+    def _build_dict(self) -> Dict:
         return {
             'type': self.type.value,
             'timestamp': self.timestamp.isoformat(),
@@ -152,13 +280,14 @@ class OrderEvent(Event):
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class FillEvent(Event):
     """
     Order fill event.
 
     Published when an order is executed.
     """
+    type: EventType = EventType.FILL
     trade_id: str = ""
     order_id: str = ""
     symbol: str = ""
@@ -170,22 +299,7 @@ class FillEvent(Event):
     commission_asset: str = "USD"
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        self.type = EventType.FILL
-        self.data = {
-            'trade_id': self.trade_id,
-            'order_id': self.order_id,
-            'symbol': self.symbol,
-            'asset_type': self.asset_type,
-            'side': self.side,
-            'quantity': self.quantity,
-            'price': self.price,
-            'commission': self.commission,
-            'commission_asset': self.commission_asset,
-            'metadata': self.metadata
-        }
-
-    def to_dict(self) -> Dict:
+    def _build_dict(self) -> Dict:
         return {
             'type': self.type.value,
             'timestamp': self.timestamp.isoformat(),
@@ -193,13 +307,14 @@ class FillEvent(Event):
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class PositionUpdateEvent(Event):
     """
     Position update event.
 
     Published when a position is opened, updated, or closed.
     """
+    type: EventType = EventType.POSITION_UPDATE
     position_id: int = 0
     symbol: str = ""
     asset_type: str = ""
@@ -212,30 +327,15 @@ class PositionUpdateEvent(Event):
     status: str = ""  # 'OPEN', 'CLOSED', 'PARTIAL'
     strategy_id: str = ""
 
-    def __post_init__(self):
-        self.type = EventType.POSITION_UPDATE
-        self.data = {
-            'position_id': self.position_id,
-            'symbol': self.symbol,
-            'asset_type': self.asset_type,
-            'side': self.side,
-            'quantity': self.quantity,
-            'entry_price': self.entry_price,
-            'current_price': self.current_price,
-            'pnl_realized': self.pnl_realized,
-            'pnl_unrealized': self.pnl_unrealized,
-            'status': self.status,
-            'strategy_id': self.strategy_id
-        }
-
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class RiskAlertEvent(Event):
     """
     Risk alert event.
 
     Published when a risk limit is breached.
     """
+    type: EventType = EventType.RISK_ALERT
     alert_type: str = ""
     severity: str = ""  # 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'
     description: str = ""
@@ -244,58 +344,30 @@ class RiskAlertEvent(Event):
     strategy_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        self.type = EventType.RISK_ALERT
-        self.data = {
-            'alert_type': self.alert_type,
-            'severity': self.severity,
-            'description': self.description,
-            'symbol': self.symbol,
-            'asset_type': self.asset_type,
-            'strategy_id': self.strategy_id,
-            'metadata': self.metadata
-        }
-
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class PerformanceMetricEvent(Event):
     """
     Performance metric event.
 
     Published for tracking system performance.
     """
+    type: EventType = EventType.PERFORMANCE_METRIC
     metric_name: str = ""
     metric_value: float = 0.0
     strategy_id: Optional[str] = None
     timeframe: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        self.type = EventType.PERFORMANCE_METRIC
-        self.data = {
-            'metric_name': self.metric_name,
-            'metric_value': self.metric_value,
-            'strategy_id': self.strategy_id,
-            'timeframe': self.timeframe,
-            'metadata': self.metadata
-        }
-
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class SystemEvent(Event):
     """
     System-level event.
 
     Published for system state changes.
     """
+    type: EventType = EventType.SYSTEM
     event_name: str = ""
     message: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self):
-        self.type = EventType.SYSTEM
-        self.data = {
-            'event_name': self.event_name,
-            'message': self.message,
-            'metadata': self.metadata
-        }
@@ -12,27 +12,89 @@ Features:
 - Database persistence
 """
 
+import json
+import os
+import queue
+import threading
 import time
+from bisect import bisect_left
+from operator import itemgetter
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any
+import numpy as np
 import pandas as pd
 import pytz
+from requests.adapters import HTTPAdapter
 
 try:
     import ccxt
+    import ccxt.async_support as ccxt_async
 except ImportError:
     print("CCXT not installed. Install with: pip install ccxt")
     ccxt = None
+    ccxt_async = None
 
 from src.core.config import ConfigManager
 from src.core.events import MarketDataEvent, EventType
-from src.core.event_bus import EventBus
+from src.core.event_bus import EventBus, ThreadedEventBus
 from src.data.storage import DatabaseManager
 
 
 logger = logging.getLogger(__name__)
 
+# Persistent HTTP connection pool shared by all requests to the exchange
+HTTP_POOL_SIZE = 32
+
+# CCXT timeframe string -> candle length in minutes
+TIMEFRAME_MINUTES = {
+    '1m': 1,
+    '5m': 5,
+    '15m': 15,
+    '30m': 30,
+    '1h': 60,
+    '2h': 120,
+    '4h': 240,
+    '6h': 360,
+    '12h': 720,
+    '1d': 1440,
+    '1w': 10080,
+}
+
+# Candles per OHLCV request when the exchange does not advertise its maximum
+DEFAULT_OHLCV_LIMIT = 1000
+
+# Loaded markets are cached on disk and reused for this long
+MARKETS_CACHE_TTL_SECONDS = 24 * 3600
+
+# Sort key of a raw CCXT OHLCV row (epoch milliseconds)
+_row_timestamp = itemgetter(0)
+
+# Rows per block in the early-exit price-consistency scan (fits in L2 cache)
+PRICE_SCAN_BLOCK_ROWS = 16_384
+
+
+def _first_price_issue(ohlc: np.ndarray) -> int:
+    """
+    Find the first row whose high is not the row maximum or low not the minimum.
+    
+    Scans in cache-sized blocks and stops at the first block with a bad row.
+    
+    Args:
+        ohlc: Array of shape (n, 4) with open, high, low, close
+    
+    Returns:
+        Index of the first inconsistent row, or -1 if all rows are consistent
+    """
+    for start in range(0, len(ohlc), PRICE_SCAN_BLOCK_ROWS):
+        block = ohlc[start:start + PRICE_SCAN_BLOCK_ROWS]
+        bad = (block.max(axis=1) > block[:, 1]) | (block.min(axis=1) < block[:, 2])
+        if bad.any():
+            return start + int(bad.argmax())
+    return -1
+
 
 class CryptoCollector:
     """
@@ -66,13 +128,26 @@ class CryptoCollector:
         # Get crypto data source configuration
         self.exchange_name = config.get('data.data_sources.crypto.default', 'coinbase')
         self.rate_limit = config.get('data.data_sources.crypto.rate_limit', 10)
+        self.markets_cache_dir = Path(config.get(
+            'data.data_sources.crypto.markets_cache_dir', 'data/cache/markets'
+        ))
         
         # Initialize exchange
         self.exchange = self._init_exchange()
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0 / self.rate_limit  # seconds between requests
+        # Symbols loaded with the markets, for cheap membership checks
+        self._market_symbols = frozenset(self.exchange.markets)
+        
+        # Largest OHLCV page the exchange serves; one request per history chunk
+        self._ohlcv_limit = self._max_ohlcv_limit(self.exchange)
+        
+        # Rate limiting: token bucket allowing bursts of up to rate_limit requests
+        self._tokens = float(self.rate_limit)
+        self._last_refill = time.perf_counter()
+        
+        # Event publishing runs on a background thread (started on first use)
+        self._event_queue: queue.Queue = queue.Queue()
+        self._event_thread: Optional[threading.Thread] = None
         
         logger.info(f"CryptoCollector initialized with exchange: {self.exchange_name}")
     
@@ -87,24 +162,15 @@ class CryptoCollector:
             # Get exchange class
             exchange_class = getattr(ccxt, self.exchange_name)
             
-            # Initialize with configuration
-            exchange_config = {
-                'enableRateLimit': True,
-                'rateLimit': int(1000 / self.rate_limit),  # milliseconds
-            }
-            
-            # Add API credentials if available (for private endpoints)
-            api_key = self.config.get('data.data_sources.crypto.api_key')
-            api_secret = self.config.get('data.data_sources.crypto.api_secret')
+            exchange = exchange_class(self._exchange_config())
             
-            if api_key and api_key != 'placeholder_api_key':
-                exchange_config['apiKey'] = api_key
-                exchange_config['secret'] = api_secret
+            # Keep TLS connections alive across requests (no handshake per fetch)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+            exchange.session.mount('https://', adapter)
+            exchange.session.headers['Connection'] = 'keep-alive'
             
-            exchange = exchange_class(exchange_config)
-            
-            # Load markets
-            exchange.load_markets()
+            # Load markets (from the on-disk cache when fresh)
+            self._load_markets(exchange)
             
             logger.info(f"Exchange {self.exchange_name} initialized successfully")
             logger.info(f"Available markets: {len(exchange.markets)}")
@@ -115,13 +181,136 @@ class CryptoCollector:
             logger.error(f"Failed to initialize exchange {self.exchange_name}: {e}")
             raise
     
+    def _load_markets(self, exchange: ccxt.Exchange):
+        """
+        Load exchange markets, reusing a cached copy younger than a day.
+        
+        load_markets() downloads and parses every market on the exchange;
+        a fresh cache skips that with set_markets(). Cache errors only fall
+        back to a normal load.
+        
+        Args:
+            exchange: CCXT exchange instance
+        """
+        cache_path = self.markets_cache_dir / f"{self.exchange_name}_markets.json"
+        
+        try:
+            if time.time() - cache_path.stat().st_mtime < MARKETS_CACHE_TTL_SECONDS:
+                with open(cache_path, 'r') as f:
+                    cached = json.load(f)
+                exchange.set_markets(cached['markets'], cached['currencies'])
+                logger.debug(f"Loaded {self.exchange_name} markets from {cache_path}")
+                return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring markets cache {cache_path}: {e}")
+        
+        exchange.load_markets()
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'markets': exchange.markets, 'currencies': exchange.currencies}, f)
+            os.replace(tmp_path, cache_path)  # Readers never see a partial file
+        except Exception as e:
+            logger.warning(f"Could not write markets cache {cache_path}: {e}")
+    
+    def _exchange_config(self) -> Dict[str, Any]:
+        """
+        Build CCXT exchange options (rate limit and optional credentials).
+        
+        Returns:
+            Exchange configuration dict
+        """
+        exchange_config = {
+            'enableRateLimit': True,
+            'rateLimit': int(1000 / self.rate_limit),  # milliseconds
+        }
+        
+        # Add API credentials if available (for private endpoints)
+        api_key = self.config.get('data.data_sources.crypto.api_key')
+        api_secret = self.config.get('data.data_sources.crypto.api_secret')
+        
+        if api_key and api_key != 'placeholder_api_key':
+            exchange_config['apiKey'] = api_key
+            exchange_config['secret'] = api_secret
+        
+        return exchange_config
+    
+    @staticmethod
+    def _max_ohlcv_limit(exchange: Any) -> int:
+        """
+        Largest number of candles the exchange returns per OHLCV request.
+        
+        Uses the 'fetchOHLCVLimit' option when set, otherwise the limit CCXT
+        advertises in the exchange's features for its default market type.
+        
+        Args:
+            exchange: Initialized CCXT exchange
+        
+        Returns:
+            Maximum candles per request
+        """
+        options = getattr(exchange, 'options', None) or {}
+        features = getattr(exchange, 'features', None) or {}
+        market_features = features.get(options.get('defaultType', 'spot')) or {}
+        limit = (
+            options.get('fetchOHLCVLimit')
+            or (market_features.get('fetchOHLCV') or {}).get('limit')
+        )
+        return int(limit) if limit else DEFAULT_OHLCV_LIMIT
+    
+    async def _init_async_exchange(self):
+        """
+        Initialize an asyncio CCXT exchange sharing this collector's settings.
+        
+        Returns:
+            ccxt.async_support exchange instance (caller must close it)
+        """
+        if ccxt_async is None:
+            raise ImportError("CCXT library not installed. Run: pip install ccxt")
+        
+        exchange = getattr(ccxt_async, self.exchange_name)(self._exchange_config())
+        # Reuse the markets already loaded by the sync exchange
+        exchange.set_markets(self.exchange.markets, self.exchange.currencies)
+        
+        # CCXT opens its own pooled aiohttp session on the first request and
+        # keeps it for every page fetched through this instance
+        return exchange
+    
+    def _acquire_token(self) -> float:
+        """
+        Take one request token from the bucket.
+        
+        The bucket refills at rate_limit tokens per second (monotonic clock)
+        and holds at most rate_limit tokens. A caller that finds it empty
+        reserves a future token, so concurrent callers queue up in order.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        now = time.perf_counter()
+        self._tokens = min(
+            float(self.rate_limit),
+            self._tokens + (now - self._last_refill) * self.rate_limit
+        )
+        self._last_refill = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate_limit
+    
     def _rate_limit_wait(self):
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        wait = self._acquire_token()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def _rate_limit_wait_async(self):
+        """Enforce rate limiting between requests without blocking the event loop."""
+        wait = self._acquire_token()
+        if wait > 0:
+            await asyncio.sleep(wait)
     
     def fetch_ohlcv(self, symbol: str, timeframe: str = '1m', 
                      since: Optional[datetime] = None,
@@ -138,18 +327,49 @@ class CryptoCollector:
         Returns:
             DataFrame with columns: timestamp, open, high, low, close, volume
         """
+        # Convert datetime to milliseconds timestamp if provided
+        since_ms = None
+        if since:
+            if since.tzinfo is None:
+                since = pytz.UTC.localize(since)
+            since_ms = int(since.timestamp() * 1000)
+        
+        ohlcv = self._fetch_ohlcv_rows(symbol, timeframe, since_ms, limit)
+        if not ohlcv:
+            return pd.DataFrame()
+        
+        try:
+            df = self._to_dataframe(ohlcv, symbol)
+            
+            logger.info(f"Fetched {len(df)} candles for {symbol} ({timeframe})")
+            
+            return df
+            
+        except Exception as e:
+            logger.error(f"Error fetching OHLCV for {symbol}: {e}")
+            return pd.DataFrame()
+    
+    def _fetch_ohlcv_rows(self, symbol: str, timeframe: str,
+                          since_ms: Optional[int],
+                          limit: Optional[int]) -> List[List]:
+        """
+        Fetch raw OHLCV rows from the exchange.
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            since_ms: Start time in epoch milliseconds
+            limit: Maximum number of candles to fetch
+        
+        Returns:
+            Rows of [timestamp_ms, open, high, low, close, volume], sorted by
+            time (empty on error)
+        """
         try:
             # Validate symbol exists
-            if symbol not in self.exchange.markets:
+            if symbol not in self._market_symbols:
                 logger.error(f"Symbol {symbol} not found on {self.exchange_name}")
-                return pd.DataFrame()
-            
-            # Convert datetime to milliseconds timestamp if provided
-            since_ms = None
-            if since:
-                if since.tzinfo is None:
-                    since = pytz.UTC.localize(since)
-                since_ms = int(since.timestamp() * 1000)
+                return []
             
             # Rate limiting
             self._rate_limit_wait()
@@ -165,30 +385,73 @@ class CryptoCollector:
             
             if not ohlcv:
                 logger.warning(f"No data returned for {symbol}")
-                return pd.DataFrame()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
+                return []
             
-            # Convert timestamp from milliseconds to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
-            
-            # Add symbol column
-            df['symbol'] = symbol
-            
-            # Set timestamp as index
-            df.set_index('timestamp', inplace=True)
-            
-            logger.info(f"Fetched {len(df)} candles for {symbol} ({timeframe})")
-            
-            return df
+            return ohlcv
             
         except Exception as e:
             logger.error(f"Error fetching OHLCV for {symbol}: {e}")
-            return pd.DataFrame()
+            return []
+    
+    @staticmethod
+    def _to_dataframe(ohlcv: List[List], symbol: str) -> pd.DataFrame:
+        """
+        Convert raw CCXT OHLCV rows to a timestamp-indexed DataFrame.
+        
+        Args:
+            ohlcv: Rows of [timestamp_ms, open, high, low, close, volume]
+            symbol: Trading pair symbol
+        
+        Returns:
+            DataFrame with open, high, low, close, volume, symbol columns
+        """
+        # One typed array for all columns (ms timestamps are exact in float64)
+        values = np.asarray(ohlcv, dtype=np.float64)
+        
+        # Build the UTC index straight from the millisecond timestamps
+        timestamps = values[:, 0].astype(np.int64).view('datetime64[ms]')
+        index = pd.DatetimeIndex(timestamps.astype('datetime64[ns]'), tz='UTC', name='timestamp')
+        
+        df = pd.DataFrame(
+            values[:, 1:],
+            index=index,
+            columns=['open', 'high', 'low', 'close', 'volume']
+        )
+        
+        # Add symbol column
+        df['symbol'] = symbol
+        
+        return df
+    
+    @classmethod
+    def _rows_to_dataframe(cls, rows: List[List], symbol: str) -> pd.DataFrame:
+        """
+        Combine OHLCV rows from many requests into one frame.
+        
+        Callers clip every request to its own disjoint, ascending time window,
+        so the rows are normally already unique and ordered; that is checked
+        in one comparison pass. If the exchange returned a duplicate or
+        out-of-order candle, the block is sorted and de-duplicated (first
+        row per timestamp kept) instead.
+        
+        Args:
+            rows: Rows of [timestamp_ms, open, high, low, close, volume]
+            symbol: Trading pair symbol
+        
+        Returns:
+            DataFrame indexed by unique, increasing timestamps
+        """
+        values = np.asarray(rows, dtype=np.float64)
+        ts = values[:, 0]
+        if not (ts[1:] > ts[:-1]).all():
+            _, first = np.unique(ts, return_index=True)
+            logger.warning(
+                f"{symbol}: exchange returned duplicate or out-of-order candles; "
+                f"kept {len(first)} of {len(ts)} after sorting"
+            )
+            values = values[first]
+        
+        return cls._to_dataframe(values, symbol)
     
     def fetch_historical_data(self, symbol: str, start_time: datetime,
                               end_time: datetime, timeframe: str = '1m',
@@ -219,65 +482,14 @@ class CryptoCollector:
             logger.info(f"Time range: {start_time} to {end_time}")
             logger.info(f"Timeframe: {timeframe}")
             
-            all_data = []
-            current_start = start_time
-            
-            # Determine chunk size based on timeframe
-            timeframe_minutes = self._timeframe_to_minutes(timeframe)
-            chunk_size = timedelta(hours=24)  # Fetch 24 hours at a time
-            
-            retry_count = 0
-            
-            while current_start < end_time:
-                current_end = min(current_start + chunk_size, end_time)
-                
-                try:
-                    # Fetch chunk
-                    df_chunk = self.fetch_ohlcv(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        since=current_start,
-                        limit=1000  # CCXT default limit
-                    )
-                    
-                    if not df_chunk.empty:
-                        # Filter to requested time range
-                        df_chunk = df_chunk[
-                            (df_chunk.index >= current_start) & 
-                            (df_chunk.index < current_end)
-                        ]
-                        all_data.append(df_chunk)
-                        retry_count = 0  # Reset on success
-                        
-                        # Move to next chunk
-                        if not df_chunk.empty:
-                            current_start = df_chunk.index[-1] + timedelta(minutes=timeframe_minutes)
-                        else:
-                            current_start = current_end
-                    else:
-                        # No data in this chunk, move forward
-                        current_start = current_end
-                    
-                    # Small delay between chunks
-                    time.sleep(0.1)
-                    
-                except Exception as chunk_error:
-                    logger.warning(f"Error fetching chunk: {chunk_error}")
-                    retry_count += 1
-                    
-                    if retry_count >= max_retries:
-                        logger.error(f"Max retries ({max_retries}) reached. Moving to next chunk.")
-                        current_start = current_end
-                        retry_count = 0
-                    else:
-                        time.sleep(2 ** retry_count)  # Exponential backoff
-                        continue
+            all_rows = []
+            for rows in self._iter_historical_rows(symbol, start_time, end_time,
+                                                   timeframe, max_retries):
+                all_rows.extend(rows)
             
             # Combine all chunks
-            if all_data:
-                df = pd.concat(all_data)
-                df = df.sort_index()
-                df = df[~df.index.duplicated(keep='first')]  # Remove duplicates
+            if all_rows:
+                df = self._rows_to_dataframe(all_rows, symbol)
                 
                 logger.info(f"Successfully fetched {len(df)} candles for {symbol}")
                 return df
@@ -289,6 +501,179 @@ class CryptoCollector:
             logger.error(f"Error in fetch_historical_data: {e}")
             return pd.DataFrame()
     
+    def iter_historical_chunks(self, symbol: str, start_time: datetime,
+                               end_time: datetime, timeframe: str = '1m',
+                               max_retries: int = 3) -> Iterator[pd.DataFrame]:
+        """
+        Fetch historical data for a date range one chunk at a time.
+        
+        Same pagination and retry logic as fetch_historical_data, but each
+        chunk is yielded as soon as it arrives, so only one chunk is held in
+        memory.
+        
+        Args:
+            symbol: Trading pair symbol
+            start_time: Start datetime
+            end_time: End datetime
+            timeframe: Candle timeframe
+            max_retries: Maximum retry attempts on failure
+        
+        Yields:
+            DataFrame per non-empty chunk, in time order
+        """
+        for rows in self._iter_historical_rows(symbol, start_time, end_time,
+                                               timeframe, max_retries):
+            yield self._rows_to_dataframe(rows, symbol)
+    
+    def _iter_historical_rows(self, symbol: str, start_time: datetime,
+                              end_time: datetime, timeframe: str,
+                              max_retries: int) -> Iterator[List[List]]:
+        """Yield the raw OHLCV rows of each chunk in [start_time, end_time)."""
+        # Ensure timezone awareness
+        if start_time.tzinfo is None:
+            start_time = pytz.UTC.localize(start_time)
+        if end_time.tzinfo is None:
+            end_time = pytz.UTC.localize(end_time)
+        
+        current_ms = int(start_time.timestamp() * 1000)
+        end_ms = int(end_time.timestamp() * 1000)
+        
+        # Determine chunk size based on timeframe: one full page per request
+        candle_ms = self._timeframe_to_minutes(timeframe) * 60_000
+        chunk_ms = candle_ms * self._ohlcv_limit
+        
+        retry_count = 0
+        
+        while current_ms < end_ms:
+            chunk_end_ms = min(current_ms + chunk_ms, end_ms)
+            
+            try:
+                # Fetch chunk
+                rows = self._fetch_ohlcv_rows(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    since_ms=current_ms,
+                    limit=self._ohlcv_limit
+                )
+                
+                if rows:
+                    # Filter to requested time range (rows are time-sorted)
+                    lo = bisect_left(rows, current_ms, key=_row_timestamp)
+                    hi = bisect_left(rows, chunk_end_ms, lo=lo, key=_row_timestamp)
+                    retry_count = 0  # Reset on success
+                    
+                    # Move to next chunk
+                    if hi > lo:
+                        current_ms = rows[hi - 1][0] + candle_ms
+                        yield rows[lo:hi]
+                    else:
+                        current_ms = chunk_end_ms
+                else:
+                    # No data in this chunk, move forward
+                    current_ms = chunk_end_ms
+                
+                # Small delay between chunks
+                time.sleep(0.1)
+                
+            except Exception as chunk_error:
+                logger.warning(f"Error fetching chunk: {chunk_error}")
+                retry_count += 1
+                
+                if retry_count >= max_retries:
+                    logger.error(f"Max retries ({max_retries}) reached. Moving to next chunk.")
+                    current_ms = chunk_end_ms
+                    retry_count = 0
+                else:
+                    time.sleep(2 ** retry_count)  # Exponential backoff
+                    continue
+    
+    async def fetch_historical_data_async(self, symbol: str, start_time: datetime,
+                                          end_time: datetime, timeframe: str = '1m',
+                                          max_retries: int = 3,
+                                          limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Fetch historical data for a date range with concurrent requests.
+        
+        The range is split up front into pages of `limit` candles, which are
+        fetched concurrently (at most `rate_limit` in flight) through
+        ccxt.async_support. CCXT's own rate limiter still caps the request
+        rate to what the exchange allows.
+        
+        Args:
+            symbol: Trading pair symbol
+            start_time: Start datetime
+            end_time: End datetime
+            timeframe: Candle timeframe
+            max_retries: Maximum retry attempts per page
+            limit: Candles per request (defaults to the exchange maximum)
+        
+        Returns:
+            DataFrame with all historical data in the range
+        """
+        try:
+            # Ensure timezone awareness
+            if start_time.tzinfo is None:
+                start_time = pytz.UTC.localize(start_time)
+            if end_time.tzinfo is None:
+                end_time = pytz.UTC.localize(end_time)
+            
+            if symbol not in self._market_symbols:
+                logger.error(f"Symbol {symbol} not found on {self.exchange_name}")
+                return pd.DataFrame()
+            
+            limit = limit or self._ohlcv_limit
+            start_ms = int(start_time.timestamp() * 1000)
+            end_ms = int(end_time.timestamp() * 1000)
+            page_ms = self._timeframe_to_minutes(timeframe) * 60_000 * limit
+            starts = range(start_ms, end_ms, page_ms)
+            
+            logger.info(f"Fetching {len(starts)} pages of {timeframe} data for {symbol} concurrently")
+            
+            semaphore = asyncio.Semaphore(max(1, int(self.rate_limit)))
+            exchange = await self._init_async_exchange()
+            
+            async def fetch_page(since_ms: int) -> List[List]:
+                for attempt in range(1, max_retries + 1):
+                    try:
+                        async with semaphore:
+                            await self._rate_limit_wait_async()
+                            page = await exchange.fetch_ohlcv(
+                                symbol=symbol,
+                                timeframe=timeframe,
+                                since=since_ms,
+                                limit=limit
+                            )
+                        # Clip to this page's window so pages never overlap
+                        page_end_ms = min(since_ms + page_ms, end_ms)
+                        lo = bisect_left(page, since_ms, key=_row_timestamp)
+                        hi = bisect_left(page, page_end_ms, lo=lo, key=_row_timestamp)
+                        return page[lo:hi]
+                    except Exception as page_error:
+                        logger.warning(f"Error fetching page at {since_ms}: {page_error}")
+                        if attempt < max_retries:
+                            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                logger.error(f"Max retries ({max_retries}) reached for page at {since_ms}")
+                return []
+            
+            try:
+                pages = await asyncio.gather(*(fetch_page(since) for since in starts))
+            finally:
+                await exchange.close()
+            
+            rows = [row for page in pages for row in page]
+            if not rows:
+                logger.warning(f"No data collected for {symbol}")
+                return pd.DataFrame()
+            
+            df = self._rows_to_dataframe(rows, symbol)
+            
+            logger.info(f"Successfully fetched {len(df)} candles for {symbol}")
+            return df
+        
+        except Exception as e:
+            logger.error(f"Error in fetch_historical_data_async: {e}")
+            return pd.DataFrame()
+    
     def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Fetch current ticker (price) for a symbol.
@@ -324,7 +709,11 @@ class CryptoCollector:
         """
         Collect historical data and store in database.
         
-        Also publishes MarketDataEvents if event bus is configured.
+        Also publishes MarketDataEvents if event bus is configured. With a
+        ThreadedEventBus, events are built and published on a background
+        thread while the next chunk is fetched; a plain EventBus is not
+        thread-safe, so it is published to on this thread instead. Either
+        way, all events are on the bus when this returns.
         
         Args:
             symbol: Trading pair symbol
@@ -336,57 +725,99 @@ class CryptoCollector:
             True if successful, False otherwise
         """
         try:
-            # Fetch data
-            df = self.fetch_historical_data(symbol, start_time, end_time, timeframe)
-            
-            if df.empty:
-                logger.error(f"No data to store for {symbol}")
-                return False
-            
-            # Validate data
-            if not self.validate_data(df):
-                logger.error(f"Data validation failed for {symbol}")
-                return False
-            
-            # Store in database
             stored_count = 0
-            for timestamp, row in df.iterrows():
-                ohlcv = {
-                    'open': float(row['open']),
-                    'high': float(row['high']),
-                    'low': float(row['low']),
-                    'close': float(row['close']),
-                    'volume': float(row['volume']),
-                }
+            fetched_count = 0
+            columns = ('open', 'high', 'low', 'close', 'volume')
+            
+            # Validate, store and publish each chunk as it is fetched
+            for df in self.iter_historical_chunks(symbol, start_time, end_time, timeframe):
+                fetched_count += len(df)
+                
+                # Validate data
+                if not self.validate_data(df):
+                    logger.error(f"Data validation failed for {symbol}")
+                    return False
                 
-                success = self.db.insert_market_data(
+                # Store in database (one executemany per chunk)
+                ohlcv = df[list(columns)].to_numpy(dtype='float64')
+                chunk_stored = self.db.insert_market_data_bulk(
                     symbol=symbol,
                     asset_type='CRYPTO',
-                    timestamp=timestamp,
+                    timestamps=df.index,
                     ohlcv=ohlcv,
                     data_source=self.exchange_name
                 )
+                stored_count += chunk_stored
                 
-                if success:
-                    stored_count += 1
-                    
-                    # Publish event if event bus is available
-                    if self.event_bus:
-                        event = MarketDataEvent(
-                            timestamp=timestamp,
-                            symbol=symbol,
-                            asset_type='CRYPTO',
-                            ohlcv=ohlcv,
-                            data_source=self.exchange_name
-                        )
-                        self.event_bus.publish(event)
-            
-            logger.info(f"Stored {stored_count}/{len(df)} candles for {symbol}")
+                # Publish events if event bus is available (off the ingest
+                # thread when the bus accepts cross-thread publishing)
+                if self.event_bus and chunk_stored:
+                    if isinstance(self.event_bus, ThreadedEventBus):
+                        self._queue_events(symbol, df.index.to_pydatetime(), ohlcv)
+                    else:
+                        self._publish_events(symbol, df.index.to_pydatetime(), ohlcv)
+            
+            if not fetched_count:
+                logger.error(f"No data to store for {symbol}")
+                return False
+            
+            logger.info(f"Stored {stored_count}/{fetched_count} candles for {symbol}")
             return stored_count > 0
             
         except Exception as e:
             logger.error(f"Error in collect_and_store: {e}")
             return False
+        
+        finally:
+            # Every queued event is on the bus by the time we return
+            self._event_queue.join()
+    
+    def _publish_events(self, symbol: str, timestamps: np.ndarray, ohlcv: np.ndarray):
+        """Build one MarketDataEvent per stored candle and publish them together."""
+        columns = ('open', 'high', 'low', 'close', 'volume')
+        self.event_bus.publish_many([
+            MarketDataEvent(
+                timestamp=timestamp,
+                symbol=symbol,
+                asset_type='CRYPTO',
+                ohlcv=dict(zip(columns, row)),
+                data_source=self.exchange_name
+            )
+            for timestamp, row in zip(timestamps, ohlcv.tolist())
+        ])
+    
+    def _queue_events(self, symbol: str, timestamps: np.ndarray, ohlcv: np.ndarray):
+        """Hand one chunk of stored candles to the publisher thread (ThreadedEventBus only)."""
+        if self._event_thread is None:
+            self._event_thread = threading.Thread(
+                target=self._publish_queued_events,
+                name=f"{self.exchange_name}-events",
+                daemon=True
+            )
+            self._event_thread.start()
+        
+        self._event_queue.put((symbol, timestamps, ohlcv))
+    
+    def _publish_queued_events(self):
+        """Publisher thread: build MarketDataEvents per chunk and publish them."""
+        while True:
+            item = self._event_queue.get()
+            try:
+                if item is None:  # Shutdown sentinel
+                    return
+                
+                self._publish_events(*item)
+            except Exception as e:
+                logger.error(f"Error publishing market data events: {e}")
+            finally:
+                self._event_queue.task_done()
+    
+    def close(self):
+        """Stop the event publisher thread after it drains pending events."""
+        if self._event_thread is not None:
+            self._event_queue.put(None)
+            self._event_thread.join()
+            self._event_thread = None
     
     def validate_data(self, df: pd.DataFrame) -> bool:
         """
@@ -410,12 +841,6 @@ class CryptoCollector:
                 logger.error(f"Missing required columns: {missing_columns}")
                 return False
             
-            # Check for null values
-            null_counts = df[list(required_columns)].isnull().sum()
-            if null_counts.any():
-                logger.error(f"Found null values: {null_counts[null_counts > 0]}")
-                return False
-            
             # Check data types
             numeric_columns = ['open', 'high', 'low', 'close', 'volume']
             for col in numeric_columns:
@@ -423,15 +848,27 @@ class CryptoCollector:
                     logger.error(f"Column {col} is not numeric")
                     return False
             
-            # Verify price consistency (high >= low, open/close between high/low)
-            price_issues = (
-                (df['low'] > df['high']) |
-                (df['open'] > df['high']) |
-                (df['close'] > df['high']) |
-                (df['open'] < df['low']) |
-                (df['close'] < df['low'])
-            )
-            if price_issues.any():
+            # Materialize the numeric columns once as a float64 block, reused by
+            # every check below (nullable/extension NA maps to NaN)
+            numeric = df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            # Check for null values with np.isnan, symbol column apart
+            null_counts = dict(zip(numeric_columns, np.isnan(numeric).sum(axis=0).tolist()))
+            null_counts['symbol'] = int(df['symbol'].isna().sum())
+            null_counts = {col: count for col, count in null_counts.items() if count}
+            if null_counts:
+                logger.error(f"Found null values: {null_counts}")
+                return False
+            
+            # Verify price consistency (high >= low, open/close between high/low):
+            # high must be the row maximum and low the row minimum
+            ohlc = numeric[:, :4]
+            if _first_price_issue(ohlc) >= 0:
+                # Only invalid frames pay for the full mask
+                price_issues = (
+                    (ohlc.max(axis=1) > ohlc[:, 1]) |
+                    (ohlc.min(axis=1) < ohlc[:, 2])
+                )
                 issue_count = price_issues.sum()
                 logger.error(f"Found {issue_count} rows with inconsistent price data")
                 # Log first few problematic rows
@@ -440,9 +877,10 @@ class CryptoCollector:
                 return False
             
             # Check for negative values
-            negative_values = (df[numeric_columns] < 0).any()
+            negative_values = (numeric < 0).any(axis=0)
             if negative_values.any():
-                logger.error(f"Found negative values in: {negative_values[negative_values].index.tolist()}")
+                negative_columns = [col for col, neg in zip(numeric_columns, negative_values) if neg]
+                logger.error(f"Found negative values in: {negative_columns}")
                 return False
             
             # Check time index
@@ -456,22 +894,22 @@ class CryptoCollector:
                 return False
             
             # Check for outliers (warn only, don't fail)
-            for col in ['open', 'high', 'low', 'close']:
-                mean = df[col].mean()
-                std = df[col].std()
-                outliers = df[col].apply(lambda x: abs(x - mean) > 5 * std)
-                if outliers.any():
-                    logger.warning(f"Found {outliers.sum()} potential outliers in {col}")
+            price_columns = numeric_columns[:4]
+            mean = ohlc.mean(axis=0)
+            std = ohlc.std(axis=0, ddof=1)
+            outlier_counts = (np.abs(ohlc - mean) > 5 * std).sum(axis=0)
+            for col, count in zip(price_columns, outlier_counts):
+                if count:
+                    logger.warning(f"Found {count} potential outliers in {col}")
             
             # Check for gaps in time series (warn only)
             if len(df) > 1:
-                time_diff = df.index.to_series().diff()
-                median_diff = time_diff.median()
-                gaps = time_diff[time_diff > median_diff * 1.5]
+                time_diff = np.diff(df.index.as_unit('ns').asi8)  # int64 nanoseconds
+                gaps = time_diff[time_diff > np.median(time_diff) * 1.5]
                 
-                if not gaps.empty:
-                    total_gap_minutes = gaps.sum().total_seconds() / 60
-                    logger.warning(f"Found {len(gaps)} gaps in data, total: {total_gap_minutes:.1f} minutes")
+                if gaps.size:
+                    total_gap_minutes = gaps.sum() / 60e9
+                    logger.warning(f"Found {gaps.size} gaps in data, total: {total_gap_minutes:.1f} minutes")
             
             logger.info("Data validation passed")
             return True
@@ -482,20 +920,7 @@ class CryptoCollector:
     
     def _timeframe_to_minutes(self, timeframe: str) -> int:
         """Convert CCXT timeframe string to minutes."""
-        timeframe_map = {
-            '1m': 1,
-            '5m': 5,
-            '15m': 15,
-            '30m': 30,
-            '1h': 60,
-            '2h': 120,
-            '4h': 240,
-            '6h': 360,
-            '12h': 720,
-            '1d': 1440,
-            '1w': 10080,
-        }
-        return timeframe_map.get(timeframe, 1)
+        return TIMEFRAME_MINUTES.get(timeframe, 1)
     
     def get_available_symbols(self) -> List[str]:
         """Get list of available trading symbols on the exchange."""
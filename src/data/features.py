@@ -12,22 +12,239 @@ Key features:
 """
 
 import logging
-import pickle
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.preprocessing import StandardScaler
 
-# Technical Analysis
-from ta.trend import SMAIndicator, EMAIndicator, MACD
-from ta.momentum import RSIIndicator, StochasticOscillator
-from ta.volatility import BollingerBands
-from ta.volume import VolumeWeightedAveragePrice
+try:
+    import talib
+except ImportError:
+    talib = None
+
+from .utils import frame_fingerprint
 
 
 logger = logging.getLogger(__name__)
 
+# Nanoseconds per hour/day, for time features computed from epoch timestamps
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+# Number of distinct input frames whose indicators are kept per engineer
+INDICATOR_CACHE_SIZE = 4
+# Recently seen (shape, first, last timestamp) keys; a frame is only hashed
+# and cached once its key repeats
+INDICATOR_SEEN_KEYS = 64
+
+# Raw bars kept between transform_incremental() calls. The weight left on
+# the oldest bar by the slowest recurrence (Wilder RSI, alpha 1/14) is
+# (13/14)**512 < 1e-16, so the tail reproduces full-history indicators.
+INCREMENTAL_HISTORY_ROWS = 512
+
+# dtype of normalized features handed to models (halves memory vs float64)
+FEATURE_DTYPE = np.float32
+
+# sin/cos of every hour of day and day of week, looked up instead of recomputed
+_HOUR_ANGLES = 2 * np.pi * np.arange(24) / 24.0
+_DAY_ANGLES = 2 * np.pi * np.arange(7) / 7.0
+HOUR_SIN, HOUR_COS = np.sin(_HOUR_ANGLES), np.cos(_HOUR_ANGLES)
+DAY_OF_WEEK_SIN, DAY_OF_WEEK_COS = np.sin(_DAY_ANGLES), np.cos(_DAY_ANGLES)
+
+
+# Frames up to this many rows take rolling stats from NumPy sliding windows
+# (no per-call pandas overhead); longer ones use pandas' O(n) rolling kernels,
+# which win once rows * window gets large
+SLIDING_WINDOW_MAX_ROWS = 4096
+
+
+# TA-Lib functions with the same definitions as _rolling_stats' statistics.
+# Only these are delegated: TA-Lib seeds its EMA/RSI recurrences differently
+# from the ta definitions used here, which would change feature values.
+_TALIB_ROLLING = {'mean': 'SMA', 'std': 'STDDEV', 'min': 'MIN', 'max': 'MAX', 'sum': 'SUM'}
+
+
+def _rolling_stats(values: np.ndarray, window: int, *stats: str) -> List[np.ndarray]:
+    """
+    Trailing-window statistics, NaN until the first full window.
+    
+    Uses TA-Lib's C kernels when it is installed and the input has no NaNs
+    (TA-Lib carries a NaN into every later output). Otherwise short arrays
+    reduce a zero-copy sliding_window_view and long arrays go through one
+    pandas Rolling object. Standard deviation is the population (ddof=0)
+    one on every path.
+    
+    Args:
+        values: 1-D float array
+        window: Window length in rows
+        *stats: Any of 'mean', 'std', 'min', 'max', 'sum'
+    
+    Returns:
+        One array per requested statistic, same length as values
+    """
+    n = len(values)
+    if talib is not None and not np.isnan(values).any():
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        return [getattr(talib, _TALIB_ROLLING[stat])(values, timeperiod=window) for stat in stats]
+    
+    if n > SLIDING_WINDOW_MAX_ROWS:
+        rolling = pd.Series(values, copy=False).rolling(window)
+        return [
+            (rolling.std(ddof=0) if stat == 'std' else getattr(rolling, stat)()).to_numpy()
+            for stat in stats
+        ]
+    
+    results = [np.full(n, np.nan) for _ in stats]
+    if window <= n:
+        view = sliding_window_view(values, window)
+        for out, stat in zip(results, stats):
+            getattr(view, stat)(axis=1, out=out[window - 1:])
+    return results
+
+
+def _compute_indicators(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        volume: np.ndarray, rsi_window: int, sma_short_window: int,
+                        sma_long_window: int, ema_short_window: int,
+                        ema_long_window: int, signal_window: int,
+                        stoch_window: int, vwap_window: int) -> Dict[str, np.ndarray]:
+    """
+    Compute every technical indicator in one pass over the OHLCV arrays.
+    
+    Definitions follow the `ta` library (Wilder RSI, adjust=False EMAs,
+    population-std Bollinger Bands). Intermediates shared between indicators
+    are computed once: the short SMA serves both Bollinger Bands and sma_20,
+    and the MACD fast/slow EMAs are ema_12/ema_26.
+    
+    Args:
+        high, low, close, volume: float64 price and volume arrays
+        rsi_window ... vwap_window: Indicator windows
+    
+    Returns:
+        Dict of indicator name -> float64 array, in output column order
+    """
+    close_s = pd.Series(close, copy=False)
+    
+    # RSI - Relative Strength Index (Wilder smoothing)
+    diff = np.diff(close, prepend=np.nan)
+    gains = pd.Series(np.where(diff > 0, diff, 0.0))
+    losses = pd.Series(np.where(diff < 0, -diff, 0.0))
+    alpha = 1.0 / rsi_window
+    avg_gain = gains.ewm(alpha=alpha, min_periods=rsi_window, adjust=False).mean().to_numpy()
+    avg_loss = losses.ewm(alpha=alpha, min_periods=rsi_window, adjust=False).mean().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    
+    # EMAs, shared by MACD and the ema_12/ema_26 features
+    ema_short = close_s.ewm(span=ema_short_window, min_periods=ema_short_window,
+                            adjust=False).mean()
+    ema_long = close_s.ewm(span=ema_long_window, min_periods=ema_long_window,
+                           adjust=False).mean()
+    macd = ema_short - ema_long
+    macd_signal = macd.ewm(span=signal_window, min_periods=signal_window,
+                           adjust=False).mean()
+    
+    # Bollinger Bands around the short SMA (also the sma_20 feature)
+    sma_short, std_short = _rolling_stats(close, sma_short_window, 'mean', 'std')
+    band = 2 * std_short
+    bb_high = sma_short + band
+    bb_low = sma_short - band
+    
+    # Stochastic Oscillator
+    lowest = _rolling_stats(low, stoch_window, 'min')[0]
+    highest = _rolling_stats(high, stoch_window, 'max')[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stoch_k = 100 * (close - lowest) / (highest - lowest)
+    stoch_d = _rolling_stats(stoch_k, 3, 'mean')[0]
+    
+    # VWAP - Volume Weighted Average Price over a rolling window
+    typical_volume = (high + low + close) / 3.0 * volume
+    total_pv = _rolling_stats(typical_volume, vwap_window, 'sum')[0]
+    total_volume = _rolling_stats(volume, vwap_window, 'sum')[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = total_pv / total_volume
+    
+    return {
+        'rsi': rsi,
+        'macd': macd.to_numpy(),
+        'macd_signal': macd_signal.to_numpy(),
+        'macd_diff': (macd - macd_signal).to_numpy(),
+        'bb_high': bb_high,
+        'bb_mid': sma_short,
+        'bb_low': bb_low,
+        'bb_width': (bb_high - bb_low) / sma_short,
+        'sma_20': sma_short,
+        'sma_50': _rolling_stats(close, sma_long_window, 'mean')[0],
+        'ema_12': ema_short.to_numpy(),
+        'ema_26': ema_long.to_numpy(),
+        'stoch_k': stoch_k,
+        'stoch_d': stoch_d,
+        'vwap': vwap,
+    }
+
+
+def _pct_changes(values: np.ndarray, periods: Iterable[int]) -> Dict[int, np.ndarray]:
+    """
+    Percentage change of every column over each of several periods.
+    
+    Like DataFrame.pct_change(periods) without padding NaNs first: a NaN
+    input gives NaN changes (filled later along with indicator warm-up).
+    
+    Args:
+        values: Float array of shape (rows, columns)
+        periods: Lags in rows
+    
+    Returns:
+        Period -> array shaped like values, NaN for the first `period` rows
+    """
+    changes = {}
+    for period in periods:
+        out = np.full(values.shape, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values[period:], values[:-period], out=out[period:])
+        out[period:] -= 1.0
+        changes[period] = out
+    return changes
+
+
+def _fill_gaps(values: np.ndarray) -> np.ndarray:
+    """
+    Forward-fill, then back-fill, NaNs down each column of a 2-D array.
+    
+    Equivalent to DataFrame.ffill().bfill(), done with one running max/min
+    of row positions per direction instead of column-by-column fills.
+    
+    Args:
+        values: Float array of shape (rows, columns)
+    
+    Returns:
+        Filled array (the input itself if it has no NaNs)
+    """
+    missing = np.isnan(values)
+    if not missing.any():
+        return values
+    
+    rows = np.arange(len(values))[:, None]
+    
+    # Forward fill: index of the last valid row at or above each cell
+    last_valid = np.where(missing, 0, rows)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    values = np.take_along_axis(values, last_valid, axis=0)
+    
+    # Back fill what is left (leading NaNs): next valid row at or below
+    missing = np.isnan(values)
+    if missing.any():
+        next_valid = np.where(missing, len(values) - 1, rows)
+        next_valid = np.minimum.accumulate(next_valid[::-1], axis=0)[::-1]
+        values = np.take_along_axis(values, next_valid, axis=0)
+    
+    return values
+
 
 class FeatureEngineer:
     """
@@ -52,165 +269,214 @@ class FeatureEngineer:
         live_features = fe_prod.transform(live_df)
     """
     
+    # Columns produced by calculate_indicators that get normalized, in order
+    FEATURE_COLUMNS = (
+        'open', 'high', 'low', 'close', 'volume',
+        'hour_sin', 'hour_cos', 'day_of_week_sin', 'day_of_week_cos',
+        'rsi', 'macd', 'macd_signal', 'macd_diff',
+        'bb_high', 'bb_mid', 'bb_low', 'bb_width',
+        'sma_20', 'sma_50', 'ema_12', 'ema_26',
+        'stoch_k', 'stoch_d', 'vwap',
+        'price_change', 'price_change_1h', 'price_change_4h', 'price_change_24h',
+        'volume_change', 'volume_change_1h', 'volume_change_4h', 'volume_change_24h',
+    )
+    
     def __init__(self):
         """Initialize feature engineer with empty scaler."""
         self.scaler = StandardScaler()
         self.is_fitted = False
         self.feature_columns = None
+        self._feature_mean = None   # Fitted mean/std in FEATURE_DTYPE
+        self._feature_std = None
+        self._indicator_cache: "OrderedDict[bytes, pd.DataFrame]" = OrderedDict()
+        self._seen_frame_keys: "OrderedDict[Tuple, None]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._history: Optional[pd.DataFrame] = None  # Raw bars for transform_incremental()
         logger.info("FeatureEngineer initialized")
     
     def calculate_indicators(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
         Calculate technical indicators for OHLCV data.
         
+        Frames seen before (same shape and first/last timestamp) are cached
+        by content hash, keeping the last INDICATOR_CACHE_SIZE, so repeated
+        calls on the same data (e.g. cross-validation folds) skip
+        recomputation; each call returns its own copy. A frame's first
+        sighting is neither hashed nor cached, so a growing per-bar window
+        pays nothing for the cache.
+        
         Args:
             df: DataFrame with OHLCV columns (open, high, low, close, volume)
         
         Returns:
-            DataFrame with technical indicators added, or None if error
+            DataFrame with technical indicators added, or None if the input is
+            empty, lacks OHLCV columns or has too few rows
         """
         if df is None or df.empty:
             logger.error("Empty or None dataframe provided")
             return None
         
-        try:
-            logger.debug(f"Calculating indicators for {len(df)} rows")
-            
-            # Create copy to avoid modifying original
-            df_copy = df.copy()
-            
-            # Ensure timestamp index
-            if not isinstance(df_copy.index, pd.DatetimeIndex):
-                if 'timestamp' in df_copy.columns:
-                    df_copy['timestamp'] = pd.to_datetime(df_copy['timestamp'], utc=True)
-                    df_copy.set_index('timestamp', inplace=True)
-                else:
-                    logger.error("DataFrame must have timestamp column or DatetimeIndex")
-                    return None
-            
-            # Ensure timezone-aware
-            if df_copy.index.tz is None:
-                df_copy.index = df_copy.index.tz_localize('UTC')
+        # Cheap key first; only frames whose key repeats are content-hashed
+        frame_key = (df.shape, df.index[0], df.index[-1])
+        with self._cache_lock:
+            seen = frame_key in self._seen_frame_keys
+            self._seen_frame_keys[frame_key] = None
+            self._seen_frame_keys.move_to_end(frame_key)
+            if len(self._seen_frame_keys) > INDICATOR_SEEN_KEYS:
+                self._seen_frame_keys.popitem(last=False)
+        if not seen:
+            return self._calculate_indicators(df)
+        
+        key = frame_fingerprint(df)
+        with self._cache_lock:
+            cached = self._indicator_cache.get(key)
+            if cached is not None:
+                self._indicator_cache.move_to_end(key)
+        if cached is not None:
+            logger.debug(f"Using cached indicators for {len(df)} rows")
+            return cached.copy()
+        
+        df_features = self._calculate_indicators(df)
+        if df_features is not None:
+            with self._cache_lock:
+                self._indicator_cache[key] = df_features.copy()
+                if len(self._indicator_cache) > INDICATOR_CACHE_SIZE:
+                    self._indicator_cache.popitem(last=False)
+        return df_features
+    
+    def calculate_indicators_batch(self, frames: Mapping[str, pd.DataFrame],
+                                   max_workers: Optional[int] = None
+                                   ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Calculate technical indicators for many symbols in parallel.
+        
+        Symbols are independent, and the rolling/EWM/NumPy kernels doing the
+        work release the GIL, so frames are processed on a thread pool.
+        
+        Args:
+            frames: Symbol -> OHLCV DataFrame
+            max_workers: Thread count (defaults to the CPU count)
+        
+        Returns:
+            Symbol -> DataFrame with indicators (None where calculation failed)
+        """
+        workers = min(max_workers or os.cpu_count() or 1, max(len(frames), 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.calculate_indicators, frames.values())
+            return dict(zip(frames.keys(), results))
+    
+    def _calculate_indicators(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Compute indicators for a non-empty frame (uncached)."""
+        logger.debug(f"Calculating indicators for {len(df)} rows")
+        
+        # Validate required columns
+        required_columns = {'open', 'high', 'low', 'close', 'volume'}
+        missing_columns = required_columns.difference(df.columns)
+        if missing_columns:
+            logger.error(f"Missing required columns: {missing_columns}")
+            return None
+        
+        # Check minimum data points
+        min_required_points = 50
+        if len(df) < min_required_points:
+            logger.warning(f"Insufficient data ({len(df)} < {min_required_points})")
+            return None
+        
+        # Shallow copy: new columns and index go on the copy, never the caller's frame
+        df_copy = df.copy(deep=False)
+        
+        # Ensure timestamp index
+        if not isinstance(df_copy.index, pd.DatetimeIndex):
+            if 'timestamp' in df_copy.columns:
+                df_copy['timestamp'] = pd.to_datetime(df_copy['timestamp'], utc=True)
+                df_copy.set_index('timestamp', inplace=True)
             else:
-                df_copy.index = df_copy.index.tz_convert('UTC')
-            
-            # Sort by time
-            df_copy.sort_index(inplace=True)
-            
-            # Validate required columns
-            required_columns = {'open', 'high', 'low', 'close', 'volume'}
-            missing_columns = required_columns - set(df_copy.columns)
-            if missing_columns:
-                logger.error(f"Missing required columns: {missing_columns}")
+                logger.error("DataFrame must have timestamp column or DatetimeIndex")
                 return None
-            
-            # Convert to numeric
-            for col in required_columns:
+        
+        # Ensure timezone-aware
+        if df_copy.index.tz is None:
+            df_copy.index = df_copy.index.tz_localize('UTC')
+        else:
+            df_copy.index = df_copy.index.tz_convert('UTC')
+        
+        # Sort by time (feeds are usually chronological already: O(n) check)
+        if not df_copy.index.is_monotonic_increasing:
+            df_copy.sort_index(inplace=True)
+        
+        # Convert to numeric (columns that already are float/int are left as is;
+        # dtypes are read once from the frame, not per column lookup)
+        dtypes = df_copy.dtypes
+        for col in required_columns:
+            if dtypes[col].kind not in 'fiu':
                 df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
-            
-            # Check minimum data points
-            min_required_points = 50
-            if len(df_copy) < min_required_points:
-                logger.warning(f"Insufficient data ({len(df_copy)} < {min_required_points})")
-                return None
-            
-            # Calculate time-based cyclical features
-            df_copy['hour'] = df_copy.index.hour
-            df_copy['day_of_week'] = df_copy.index.dayofweek
-            
-            # Convert to cyclical (prevents discontinuity at 23h->0h and Sun->Mon)
-            df_copy['hour_sin'] = np.sin(2 * np.pi * df_copy['hour'] / 24.0)
-            df_copy['hour_cos'] = np.cos(2 * np.pi * df_copy['hour'] / 24.0)
-            df_copy['day_of_week_sin'] = np.sin(2 * np.pi * df_copy['day_of_week'] / 7.0)
-            df_copy['day_of_week_cos'] = np.cos(2 * np.pi * df_copy['day_of_week'] / 7.0)
-            
-            df_copy = df_copy.drop(['hour', 'day_of_week'], axis=1)
-            
-            # Adjust indicator windows based on data length
-            data_length = len(df_copy)
-            rsi_window = min(14, data_length // 4)
-            sma_short_window = min(20, data_length // 3)
-            sma_long_window = min(50, data_length // 2)
-            ema_short_window = min(12, data_length // 4)
-            ema_long_window = min(26, data_length // 3)
-            
-            # RSI - Relative Strength Index
-            rsi = RSIIndicator(close=df_copy['close'], window=rsi_window)
-            df_copy['rsi'] = rsi.rsi()
-            
-            # MACD - Moving Average Convergence Divergence
-            macd = MACD(
-                close=df_copy['close'],
-                window_slow=ema_long_window,
-                window_fast=ema_short_window,
-                window_sign=min(9, data_length // 5)
-            )
-            df_copy['macd'] = macd.macd()
-            df_copy['macd_signal'] = macd.macd_signal()
-            df_copy['macd_diff'] = macd.macd_diff()
-            
-            # Bollinger Bands
-            bb = BollingerBands(close=df_copy['close'], window=sma_short_window, window_dev=2)
-            df_copy['bb_high'] = bb.bollinger_hband()
-            df_copy['bb_mid'] = bb.bollinger_mavg()
-            df_copy['bb_low'] = bb.bollinger_lband()
-            df_copy['bb_width'] = (df_copy['bb_high'] - df_copy['bb_low']) / df_copy['bb_mid']
-            
-            # Moving Averages
-            df_copy['sma_20'] = SMAIndicator(close=df_copy['close'], window=sma_short_window).sma_indicator()
-            df_copy['sma_50'] = SMAIndicator(close=df_copy['close'], window=sma_long_window).sma_indicator()
-            df_copy['ema_12'] = EMAIndicator(close=df_copy['close'], window=ema_short_window).ema_indicator()
-            df_copy['ema_26'] = EMAIndicator(close=df_copy['close'], window=ema_long_window).ema_indicator()
-            
-            # Stochastic Oscillator
-            stoch = StochasticOscillator(
-                high=df_copy['high'],
-                low=df_copy['low'],
-                close=df_copy['close'],
-                window=min(14, data_length // 4),
-                smooth_window=3
-            )
-            df_copy['stoch_k'] = stoch.stoch()
-            df_copy['stoch_d'] = stoch.stoch_signal()
-            
-            # VWAP - Volume Weighted Average Price
-            vwap = VolumeWeightedAveragePrice(
-                high=df_copy['high'],
-                low=df_copy['low'],
-                close=df_copy['close'],
-                volume=df_copy['volume'],
-                window=min(14, data_length // 4)
-            )
-            df_copy['vwap'] = vwap.volume_weighted_average_price()
-            
-            # Price change features
-            max_period = min(24, data_length // 2)
-            df_copy['price_change'] = df_copy['close'].pct_change()
-            df_copy['price_change_1h'] = df_copy['close'].pct_change(periods=1)
-            df_copy['price_change_4h'] = df_copy['close'].pct_change(periods=min(4, max_period // 4))
-            df_copy['price_change_24h'] = df_copy['close'].pct_change(periods=max_period)
-            
-            # Volume change features
-            df_copy['volume_change'] = df_copy['volume'].pct_change()
-            df_copy['volume_change_1h'] = df_copy['volume'].pct_change(periods=1)
-            df_copy['volume_change_4h'] = df_copy['volume'].pct_change(periods=min(4, max_period // 4))
-            df_copy['volume_change_24h'] = df_copy['volume'].pct_change(periods=max_period)
-            
-            # Handle NaN values (from indicator calculation on early rows)
-            df_copy = df_copy.fillna(method='ffill').fillna(method='bfill')
-            
-            # Drop any remaining NaN rows
-            initial_len = len(df_copy)
-            df_copy = df_copy.dropna()
-            if len(df_copy) < initial_len:
-                logger.warning(f"Dropped {initial_len - len(df_copy)} rows with NaN values")
-            
-            logger.info(f"Calculated {len(df_copy.columns)} features for {len(df_copy)} rows")
-            return df_copy
-            
-        except Exception as e:
-            logger.error(f"Error calculating indicators: {e}", exc_info=True)
-            return None
+        
+        # Calculate time-based cyclical features straight from epoch nanoseconds
+        # (1970-01-01 was a Thursday, dayofweek 3)
+        ns = df_copy.index.as_unit('ns').asi8
+        hour = (ns // NS_PER_HOUR) % 24
+        day_of_week = (ns // NS_PER_DAY + 3) % 7
+        
+        # Convert to cyclical (prevents discontinuity at 23h->0h and Sun->Mon)
+        df_copy['hour_sin'] = HOUR_SIN[hour]
+        df_copy['hour_cos'] = HOUR_COS[hour]
+        df_copy['day_of_week_sin'] = DAY_OF_WEEK_SIN[day_of_week]
+        df_copy['day_of_week_cos'] = DAY_OF_WEEK_COS[day_of_week]
+        
+        # Adjust indicator windows based on data length
+        data_length = len(df_copy)
+        rsi_window = min(14, data_length // 4)
+        sma_short_window = min(20, data_length // 3)
+        sma_long_window = min(50, data_length // 2)
+        ema_short_window = min(12, data_length // 4)
+        ema_long_window = min(26, data_length // 3)
+        
+        # Technical indicators, computed together on the raw arrays
+        high, low, close, volume = (
+            df_copy[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close', 'volume')
+        )
+        indicators = _compute_indicators(
+            high, low, close, volume,
+            rsi_window=rsi_window,
+            sma_short_window=sma_short_window,
+            sma_long_window=sma_long_window,
+            ema_short_window=ema_short_window,
+            ema_long_window=ema_long_window,
+            signal_window=min(9, data_length // 5),
+            stoch_window=min(14, data_length // 4),
+            vwap_window=min(14, data_length // 4)
+        )
+        
+        # Price and volume change features: each period is one strided
+        # division over the stacked close/volume columns
+        max_period = min(24, data_length // 2)
+        periods = {'': 1, '_1h': 1, '_4h': min(4, max_period // 4), '_24h': max_period}
+        changes = _pct_changes(np.column_stack((close, volume)), set(periods.values()))
+        for suffix, period in periods.items():
+            indicators[f'price_change{suffix}'] = changes[period][:, 0]
+        for suffix, period in periods.items():
+            indicators[f'volume_change{suffix}'] = changes[period][:, 1]
+        
+        df_copy = pd.concat(
+            [df_copy, pd.DataFrame(indicators, index=df_copy.index)], axis=1
+        )
+        
+        # Handle NaN values (from indicator calculation on early rows):
+        # float columns in one array pass, anything else only if it has gaps
+        float_columns = [col for col, dtype in df_copy.dtypes.items() if dtype.kind == 'f']
+        df_copy[float_columns] = _fill_gaps(df_copy[float_columns].to_numpy())
+        other_columns = df_copy.columns.difference(float_columns, sort=False)
+        if df_copy[other_columns].isna().to_numpy().any():
+            df_copy[other_columns] = df_copy[other_columns].ffill().bfill()
+        
+        # Drop any remaining NaN rows
+        initial_len = len(df_copy)
+        df_copy = df_copy.dropna()
+        if len(df_copy) < initial_len:
+            logger.warning(f"Dropped {initial_len - len(df_copy)} rows with NaN values")
+        
+        logger.info(f"Calculated {len(df_copy.columns)} features for {len(df_copy)} rows")
+        return df_copy
     
     def fit_transform(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
@@ -225,42 +491,124 @@ class FeatureEngineer:
         Returns:
             Transformed DataFrame with normalized features
         """
-        try:
-            logger.info("Fitting feature engineer on training data")
-            
-            # Calculate technical indicators
-            df_features = self.calculate_indicators(df)
-            if df_features is None:
-                logger.error("Failed to calculate indicators")
-                return None
-            
-            # Define columns to normalize (exclude symbol and timestamp-related)
-            exclude_cols = {'symbol'}
-            self.feature_columns = [
-                col for col in df_features.columns 
-                if col not in exclude_cols and pd.api.types.is_numeric_dtype(df_features[col])
-            ]
-            
-            logger.debug(f"Normalizing {len(self.feature_columns)} features")
-            
-            # Fit scaler on THIS data only (learns mean and std)
-            self.scaler.fit(df_features[self.feature_columns])
-            self.is_fitted = True
-            
-            # Transform using learned parameters
-            df_features[self.feature_columns] = self.scaler.transform(
-                df_features[self.feature_columns]
-            )
-            
-            logger.info(f"Fit and transformed {len(df_features)} samples")
-            logger.debug(f"Scaler mean: {self.scaler.mean_[:5]}...")  # Show first 5
-            logger.debug(f"Scaler std: {self.scaler.scale_[:5]}...")
-            
-            return df_features
-            
-        except Exception as e:
-            logger.error(f"Error in fit_transform: {e}", exc_info=True)
+        logger.info("Fitting feature engineer on training data")
+        
+        # Calculate technical indicators
+        df_features = self.calculate_indicators(df)
+        if df_features is None:
+            logger.error("Failed to calculate indicators")
             return None
+        
+        # Columns to normalize: the fixed indicator set (no dtype scan)
+        missing_columns = set(self.FEATURE_COLUMNS).difference(df_features.columns)
+        if missing_columns:
+            logger.error(f"Missing feature columns: {missing_columns}")
+            return None
+        self.feature_columns = list(self.FEATURE_COLUMNS)
+        
+        logger.debug(f"Normalizing {len(self.feature_columns)} features")
+        
+        # Fit scaler on THIS data only (learns mean and std, in float64)
+        values = df_features[self.feature_columns].to_numpy(dtype=np.float64)
+        self.scaler.fit(values)
+        self.is_fitted = True
+        self._cache_scaling()
+        
+        # Transform using learned parameters
+        self._scale(df_features, values.astype(FEATURE_DTYPE))
+        
+        logger.info(f"Fit and transformed {len(df_features)} samples")
+        logger.debug(f"Scaler mean: {self.scaler.mean_[:5]}...")  # Show first 5
+        logger.debug(f"Scaler std: {self.scaler.scale_[:5]}...")
+        
+        return df_features
+    
+    def fit_transform_chunked(self, frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Fit the scaler chunk by chunk, then transform each chunk.
+        
+        For training sets too large to featurize in one frame. The first pass
+        computes indicators per chunk and accumulates statistics with
+        StandardScaler.partial_fit; the returned iterator makes the second
+        pass, transforming each chunk with the final statistics. Only one
+        chunk's features are held at a time. Indicators are computed per
+        chunk, so each chunk should be a contiguous series (e.g. one symbol's
+        history) well past the indicator warm-up.
+        
+        Args:
+            frames: Re-iterable collection of training OHLCV DataFrames
+                (e.g. a list); it is iterated twice
+        
+        Returns:
+            Iterator of transformed DataFrames, one per chunk that produced
+            features
+        
+        Raises:
+            TypeError: If frames is a one-shot iterator
+            ValueError: If no chunk produced features
+        """
+        if iter(frames) is frames:
+            raise TypeError("frames is iterated twice; pass a list or other collection")
+        
+        logger.info("Fitting feature engineer on chunked training data")
+        self._fit_scaler(map(self.calculate_indicators, frames))
+        
+        return (
+            df_features for df_features in map(self.transform, frames)
+            if df_features is not None
+        )
+    
+    def fit_transform_batch(self, frames: Mapping[str, pd.DataFrame],
+                            max_workers: Optional[int] = None
+                            ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fit one scaler on several symbols' training data and transform each.
+        
+        Indicators are calculated in parallel with calculate_indicators_batch;
+        the scaler is then fitted on all symbols' features pooled, so every
+        symbol is normalized with the same statistics.
+        
+        Args:
+            frames: Symbol -> training OHLCV DataFrame
+            max_workers: Thread count for indicator calculation
+        
+        Returns:
+            Symbol -> transformed DataFrame (None where calculation failed)
+        
+        Raises:
+            ValueError: If no symbol produced features
+        """
+        logger.info(f"Fitting feature engineer on {len(frames)} symbols")
+        
+        results = self.calculate_indicators_batch(frames, max_workers)
+        self._fit_scaler(results.values())
+        
+        for df_features in results.values():
+            if df_features is not None:
+                values = df_features[self.feature_columns].to_numpy(dtype=FEATURE_DTYPE, copy=True)
+                self._scale(df_features, values)
+        return results
+    
+    def _fit_scaler(self, feature_frames: Iterable[Optional[pd.DataFrame]]):
+        """Fit a fresh scaler incrementally over indicator frames (None entries skipped)."""
+        scaler = StandardScaler()
+        columns = list(self.FEATURE_COLUMNS)
+        n_samples = 0
+        for df_features in feature_frames:
+            if df_features is None:
+                continue
+            scaler.partial_fit(df_features[columns].to_numpy(dtype=np.float64))
+            n_samples += len(df_features)
+        
+        if n_samples == 0:
+            raise ValueError("No training data produced features")
+        
+        self.scaler = scaler
+        self.feature_columns = columns
+        self.is_fitted = True
+        self._cache_scaling()
+        
+        logger.info(f"Fit scaler on {n_samples} samples")
     
     def transform(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
@@ -282,32 +630,91 @@ class FeatureEngineer:
         if not self.is_fitted:
             raise ValueError("Must call fit_transform() on training data first!")
         
-        try:
-            logger.info("Transforming data using fitted scaler")
-            
-            # Calculate technical indicators
-            df_features = self.calculate_indicators(df)
-            if df_features is None:
-                logger.error("Failed to calculate indicators")
-                return None
-            
-            # Transform using PREVIOUSLY LEARNED parameters (no data leakage!)
-            df_features[self.feature_columns] = self.scaler.transform(
-                df_features[self.feature_columns]
-            )
-            
-            logger.info(f"Transformed {len(df_features)} samples using fitted scaler")
-            
-            return df_features
-            
-        except Exception as e:
-            logger.error(f"Error in transform: {e}", exc_info=True)
+        logger.info("Transforming data using fitted scaler")
+        
+        # Calculate technical indicators
+        df_features = self.calculate_indicators(df)
+        if df_features is None:
+            logger.error("Failed to calculate indicators")
             return None
+        
+        # Transform using PREVIOUSLY LEARNED parameters (no data leakage!)
+        values = df_features[self.feature_columns].to_numpy(dtype=FEATURE_DTYPE, copy=True)
+        self._scale(df_features, values)
+        
+        logger.info(f"Transformed {len(df_features)} samples using fitted scaler")
+        
+        return df_features
+    
+    def transform_incremental(self, new_bars: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Transform only newly appended bars, e.g. one bar per live tick.
+        
+        The last INCREMENTAL_HISTORY_ROWS raw bars are kept between calls and
+        indicators are computed over that tail plus the new bars, so an update
+        costs the same however long the series has been running, and matches
+        transform() over the full history. Pass enough history on the first
+        call (or after reset_incremental()) to warm up the indicators.
+        
+        Args:
+            new_bars: OHLCV bars following the last bar of the previous call,
+                in time order
+        
+        Returns:
+            Transformed features for the new bars only
+        
+        Raises:
+            ValueError: If called before fit_transform
+        """
+        if not self.is_fitted:
+            raise ValueError("Must call fit_transform() on training data first!")
+        
+        history = new_bars if self._history is None else pd.concat([self._history, new_bars])
+        self._history = history.iloc[-INCREMENTAL_HISTORY_ROWS:]
+        
+        # Uncached: every call sees a different tail
+        df_features = self._calculate_indicators(history)
+        if df_features is None:
+            logger.error("Failed to calculate indicators")
+            return None
+        
+        df_features = df_features.iloc[-len(new_bars):].copy()
+        values = df_features[self.feature_columns].to_numpy(dtype=FEATURE_DTYPE, copy=True)
+        self._scale(df_features, values)
+        return df_features
+    
+    def reset_incremental(self):
+        """Forget the bars kept by transform_incremental() (e.g. to switch symbol)."""
+        self._history = None
+    
+    def _cache_scaling(self):
+        """Keep the fitted mean/std in FEATURE_DTYPE for transforms."""
+        self._feature_mean = self.scaler.mean_.astype(FEATURE_DTYPE)
+        self._feature_std = self.scaler.scale_.astype(FEATURE_DTYPE)
+    
+    def _scale(self, df_features: pd.DataFrame, values: np.ndarray):
+        """
+        Standardize feature values in place and write them back to the frame.
+        
+        Same arithmetic as StandardScaler.transform, applied directly to a
+        private contiguous copy of the feature columns.
+        
+        Args:
+            df_features: Frame whose feature columns are replaced
+            values: Private FEATURE_DTYPE copy of df_features[self.feature_columns]
+        """
+        values -= self._feature_mean
+        values /= self._feature_std
+        df_features[self.feature_columns] = values
     
     def save(self, filepath: str):
         """
         Save fitted feature engineer to file.
         
+        Stores only the fitted statistics and feature names as NumPy arrays
+        (an uncompressed .npz archive, whatever the file extension), not a
+        pickled StandardScaler.
+        
         Args:
             filepath: Path to save the fitted feature engineer
         """
@@ -317,12 +724,20 @@ class FeatureEngineer:
         try:
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
+            arrays = {
+                'is_fitted': np.array(self.is_fitted),
+                'feature_columns': np.array(self.feature_columns or [], dtype=str),
+            }
+            if self.is_fitted:
+                arrays.update(
+                    mean=self.scaler.mean_,
+                    var=self.scaler.var_,
+                    scale=self.scaler.scale_,
+                    n_samples_seen=np.asarray(self.scaler.n_samples_seen_),
+                )
+            
             with open(filepath, 'wb') as f:
-                pickle.dump({
-                    'scaler': self.scaler,
-                    'is_fitted': self.is_fitted,
-                    'feature_columns': self.feature_columns
-                }, f)
+                np.savez(f, **arrays)
             
             logger.info(f"Saved feature engineer to {filepath}")
             
@@ -335,6 +750,9 @@ class FeatureEngineer:
         """
         Load fitted feature engineer from file.
         
+        Reads the .npz format written by save(); files pickled by earlier
+        versions are still accepted.
+        
         Args:
             filepath: Path to saved feature engineer
         
@@ -343,15 +761,26 @@ class FeatureEngineer:
         """
         try:
             with open(filepath, 'rb') as f:
-                data = pickle.load(f)
-            
-            fe = cls()
-            fe.scaler = data['scaler']
-            fe.is_fitted = data['is_fitted']
-            fe.feature_columns = data['feature_columns']
+                is_npz = f.read(2) == b'PK'  # .npz files are zip archives
+                f.seek(0)
+                if not is_npz:
+                    return cls._load_pickle(f, filepath)
+                data = np.load(f)
+                
+                fe = cls()
+                fe.is_fitted = bool(data['is_fitted'])
+                if fe.is_fitted:
+                    fe.feature_columns = data['feature_columns'].tolist()
+                    scaler = fe.scaler
+                    scaler.mean_ = data['mean']
+                    scaler.var_ = data['var']
+                    scaler.scale_ = data['scale']
+                    scaler.n_samples_seen_ = data['n_samples_seen'][()]
+                    scaler.n_features_in_ = len(fe.feature_columns)
+                    fe._cache_scaling()
             
             logger.info(f"Loaded feature engineer from {filepath}")
-            logger.info(f"Fitted: {fe.is_fitted}, Features: {len(fe.feature_columns)}")
+            logger.info(f"Fitted: {fe.is_fitted}, Features: {len(fe.get_feature_names())}")
             
             return fe
             
@@ -359,6 +788,23 @@ class FeatureEngineer:
             logger.error(f"Error loading feature engineer: {e}")
             raise
     
+    @classmethod
+    def _load_pickle(cls, f, filepath: str) -> 'FeatureEngineer':
+        """Load a feature engineer pickled by an earlier version of save()."""
+        import pickle  # Legacy format only
+        
+        data = pickle.load(f)
+        
+        fe = cls()
+        fe.scaler = data['scaler']
+        fe.is_fitted = data['is_fitted']
+        fe.feature_columns = data['feature_columns']
+        if fe.is_fitted:
+            fe._cache_scaling()
+        
+        logger.info(f"Loaded pickled feature engineer from {filepath}")
+        return fe
+    
     def get_feature_names(self) -> List[str]:
         """Get list of feature column names."""
         if self.feature_columns is None:
@@ -46,6 +46,9 @@ CREATE TABLE IF NOT EXISTS positions (
 
 CREATE INDEX IF NOT EXISTS idx_positions_symbol_status ON positions(symbol, status);
 CREATE INDEX IF NOT EXISTS idx_positions_strategy ON positions(strategy_id);
+-- Partial indexes over open positions only, already in get_open_positions() order
+CREATE INDEX IF NOT EXISTS idx_positions_open ON positions(entry_time DESC) WHERE status = 'OPEN';
+CREATE INDEX IF NOT EXISTS idx_positions_open_symbol ON positions(symbol, entry_time DESC) WHERE status = 'OPEN';
 
 -- Orders Table
 CREATE TABLE IF NOT EXISTS orders (
@@ -129,7 +132,7 @@ CREATE TABLE IF NOT EXISTS backtest_results (
     win_rate REAL,
     total_trades INTEGER,
     config TEXT NOT NULL,  -- JSON string
-    results TEXT NOT NULL,  -- JSON string with detailed results
+    results TEXT NOT NULL,  -- zlib-compressed JSON BLOB with detailed results (JSON string in older rows)
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
 
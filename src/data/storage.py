@@ -5,13 +5,238 @@ Fixes SQL injection vulnerabilities from the original system.
 
 import sqlite3
 import logging
+import threading
+import weakref
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from datetime import date, datetime, time
 import json
+import math
+import zlib
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Schema DDL, read once per process. Its checksum is stored in the database's
+# user_version so an unchanged schema is not re-executed on every open.
+_SCHEMA_SQL = (Path(__file__).parent / "schema.sql").read_text()
+SCHEMA_VERSION = zlib.crc32(_SCHEMA_SQL.encode()) & 0x7FFFFFFF
+
+# Applied to every new connection. WAL lets readers proceed while a writer is
+# active, and synchronous=NORMAL is still crash-safe in WAL mode while skipping
+# the per-commit fsync of the main database file.
+WAL_PRAGMA = "PRAGMA journal_mode=WAL"
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped reads
+    "PRAGMA busy_timeout=30000",  # Wait up to 30s for a lock instead of failing
+    "PRAGMA journal_size_limit=67108864",  # Truncate the WAL back to 64 MiB after checkpoints
+    "PRAGMA wal_autocheckpoint=10000",  # Pages (~40 MiB) between automatic checkpoints
+)
+
+# Bulk-inserted rows between explicit WAL checkpoints, so sustained ingest
+# does not leave readers scanning a long WAL
+CHECKPOINT_INTERVAL_ROWS = 100_000
+
+# Rows per transaction in bulk inserts (bounds WAL growth between checkpoints)
+BULK_INSERT_BATCH_ROWS = 5000
+
+# Rows bound per multi-row INSERT in bulk inserts (64 * 11 columns stays far
+# below SQLite's bound-parameter limit)
+MULTI_ROW_INSERT_ROWS = 64
+
+# Rows fetched from SQLite per step when streaming query results
+FETCH_ARRAY_SIZE = 1000
+
+# zlib level for stored backtest results (multi-MB JSON shrinks ~5x at level 3)
+RESULTS_COMPRESSION_LEVEL = 3
+
+# Size of each connection's prepared statement cache (sqlite3 default: 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Record layout returned by get_market_data_ndarray() (timestamp in epoch ms)
+MARKET_DATA_DTYPE = np.dtype([
+    ('timestamp', 'i8'), ('open', 'f8'), ('high', 'f8'),
+    ('low', 'f8'), ('close', 'f8'), ('volume', 'f8'),
+])
+_MARKET_DATA_ARRAY_COLUMNS = (
+    "CAST(strftime('%s', timestamp) AS INTEGER) * 1000"
+    " + CAST(substr(strftime('%f', timestamp), 4) AS INTEGER),"
+    " open, high, low, close, volume"
+)
+
+# Required price fields of an insert_market_data() ohlcv dict, in one C call
+_OHLCV_VALUES = itemgetter('open', 'high', 'low', 'close', 'volume')
+
+# Position columns update_position() may set (keys are interpolated into SQL)
+POSITION_UPDATE_FIELDS = frozenset({
+    'quantity', 'entry_price', 'exit_price', 'exit_time', 'stop_loss',
+    'take_profit', 'status', 'pnl_realized', 'pnl_unrealized', 'metadata',
+})
+
+# update_position() statements by sorted field tuple, built on first use
+_POSITION_UPDATE_SQL: Dict[Tuple[str, ...], str] = {}
+
+# Fixed statements, parsed once per connection and reused from sqlite3's
+# statement cache
+_INSERT_MARKET_DATA_SQL = """
+    INSERT OR REPLACE INTO market_data
+    (symbol, asset_type, timestamp, open, high, low, close, volume,
+     quote_volume, num_trades, data_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_LATEST_MARKET_DATA_SQL = """
+    SELECT * FROM market_data
+    WHERE symbol = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_INSERT_POSITION_SQL = """
+    INSERT INTO positions
+    (symbol, asset_type, side, quantity, entry_price, entry_time,
+     stop_loss, take_profit, strategy_id, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ORDER_SQL = """
+    INSERT INTO orders
+    (order_id, symbol, asset_type, side, order_type, quantity,
+     price, strategy_id, position_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_ORDER_STATUS_SQL = """
+    UPDATE orders
+    SET status = ?, filled_quantity = COALESCE(?, filled_quantity),
+        avg_fill_price = COALESCE(?, avg_fill_price),
+        commission = COALESCE(?, commission),
+        updated_at = ?
+    WHERE order_id = ?
+"""
+
+_INSERT_SIGNAL_SQL = """
+    INSERT OR REPLACE INTO signals
+    (symbol, asset_type, timestamp, strategy_id, signal_type,
+     confidence, price, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_BACKTEST_RESULTS_SQL = """
+    INSERT INTO backtest_results
+    (backtest_id, strategy_id, symbols, asset_type, start_date, end_date,
+     initial_capital, final_capital, total_return, sharpe_ratio, sortino_ratio,
+     max_drawdown, win_rate, total_trades, config, results)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_BACKTEST_RESULTS_SQL = """
+    SELECT * FROM backtest_results WHERE backtest_id = ?
+"""
+
+_INSERT_RISK_EVENT_SQL = """
+    INSERT INTO risk_events
+    (timestamp, event_type, severity, symbol, asset_type,
+     strategy_id, description, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), allow_nan=False)
+
+
+def _json_compatible(value: Any) -> Any:
+    """
+    Convert a value to what orjson would write, for the stdlib encoder.
+    
+    Datetimes become ISO 8601 strings, NumPy scalars and arrays become
+    Python values and lists, and NaN/infinity become null.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {
+            (key.isoformat() if isinstance(key, (date, time)) else key): _json_compatible(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_compatible(item) for item in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return _json_compatible(value.tolist())
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to compact JSON text, through orjson (~10x faster) when installed."""
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(value, option=options).decode()
+    return _JSON_ENCODER.encode(_json_compatible(value))
+
+
+@lru_cache(maxsize=None)
+def _multi_row_insert_sql(sql: str, n: int) -> str:
+    """Expand a single-row INSERT ... VALUES (...) statement to insert n rows."""
+    head, _, values = sql.rpartition("VALUES")
+    return f"{head}VALUES {', '.join([values.strip()] * n)}"
+
+
+def _isoformat_all(timestamps: Sequence[datetime]) -> List[str]:
+    """
+    Format timestamps exactly as datetime.isoformat() would.
+
+    A UTC DatetimeIndex on whole seconds (every candle timeframe) is
+    formatted in one NumPy call; anything else falls back to isoformat()
+    per timestamp.
+    """
+    if (isinstance(timestamps, pd.DatetimeIndex) and str(timestamps.tz) == 'UTC'
+            and not (timestamps.as_unit('ns').asi8 % 1_000_000_000).any()):
+        naive = timestamps.tz_localize(None).to_numpy()
+        return np.char.add(np.datetime_as_string(naive, unit='s'), '+00:00').tolist()
+    return [ts.isoformat() for ts in timestamps]
+
+
+class _ThreadLease:
+    """Marker kept in a thread's local storage; freed when the thread exits."""
+
+    __slots__ = ('__weakref__',)
+
+
+def _close_connection(conn: sqlite3.Connection):
+    """Close a connection, refreshing query planner statistics first if it can."""
+    try:
+        with suppress(sqlite3.Error):
+            conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+
+
+def _release_connection(connections: List[sqlite3.Connection], lock: threading.Lock,
+                        conn: sqlite3.Connection):
+    """Close an exited thread's connection unless close() already took it."""
+    with lock:
+        if conn not in connections:
+            return
+        connections.remove(conn)
+    _close_connection(conn)
+
 
 class DatabaseManager:
     """
@@ -21,44 +246,132 @@ class DatabaseManager:
     - Parameterized queries (prevents SQL injection)
     - Context manager support
     - Better error handling
-    - Connection pooling
+    - Connection pooling (one connection per thread)
     """
 
     def __init__(self, db_path: str = "data/quantsage.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = None
+        self._in_memory = str(self.db_path) == ":memory:"
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._rows_since_checkpoint = 0
         self._initialize_database()
 
     def _initialize_database(self):
-        """Initialize database with schema."""
-        schema_path = Path(__file__).parent / "schema.sql"
-
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            with open(schema_path, 'r') as f:
-                schema_sql = f.read()
-                cursor.executescript(schema_sql)
-            conn.commit()
+        """Initialize database with schema (skipped if this schema version is applied)."""
+        conn = self.get_connection()
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript(_SCHEMA_SQL)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
         logger.info(f"Database initialized at {self.db_path}")
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        if self.connection is None:
-            self.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                isolation_level=None  # Autocommit mode
-            )
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+        """
+        Get the calling thread's database connection, with row factory.
+
+        Each thread gets its own connection on first use, so with WAL readers
+        in different threads run in parallel instead of queueing on one
+        connection's lock. A thread's connection is closed when the thread
+        exits. An in-memory database exists only within its connection, so
+        that one connection is shared by all threads.
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            with self._connections_lock:
+                if self._in_memory and self._connections:
+                    conn = self._connections[0]
+                else:
+                    conn = self._connect()
+                    self._connections.append(conn)
+                    if not self._in_memory:
+                        # The thread's local storage is dropped when it exits,
+                        # taking the lease with it and closing the connection
+                        self._local.lease = _ThreadLease()
+                        weakref.finalize(
+                            self._local.lease, _release_connection,
+                            self._connections, self._connections_lock, conn
+                        )
+            self._local.connection = conn
+        return conn
+
+    def _cursor(self) -> sqlite3.Cursor:
+        """
+        Get the calling thread's long-lived cursor for single-row writes.
+
+        Connection.execute() allocates a new cursor per call; reusing one
+        keeps that off the per-tick insert path. Statements autocommit, so
+        no transaction block is needed around it.
+        """
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self.get_connection().cursor()
+        return cursor
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,  # close() closes every thread's connection
+            isolation_level=None,  # Autocommit mode
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure_connection(conn)
+        return conn
+
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply journaling and cache PRAGMAs to a new connection."""
+        # In-memory databases cannot use WAL (there is no file to log beside)
+        if not self._in_memory:
+            conn.execute(WAL_PRAGMA)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements as one write transaction, rolled back on error."""
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def checkpoint(self) -> Tuple[int, int, int]:
+        """
+        Copy the WAL into the database file and truncate it.
+
+        Runs automatically every CHECKPOINT_INTERVAL_ROWS bulk-inserted rows;
+        can also be called from maintenance jobs.
+
+        Returns:
+            (busy, wal_pages, checkpointed_pages) as reported by SQLite;
+            busy is 1 if readers kept the checkpoint from completing
+        """
+        self._rows_since_checkpoint = 0
+        busy, wal_pages, checkpointed = self.get_connection().execute(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).fetchone()
+        logger.debug(f"WAL checkpoint: {checkpointed}/{wal_pages} pages (busy={busy})")
+        return busy, wal_pages, checkpointed
 
     def close(self):
-        """Close database connection."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Close every thread's connection, refreshing query planner statistics first."""
+        with self._connections_lock:
+            connections = self._connections[:]
+            self._connections.clear()
+            # Threads still holding a closed connection reconnect on next use
+            local, self._local = self._local, threading.local()
+        # Freeing the old leases runs their finalizers, which take the lock
+        # and find nothing left to close
+        del local
+        for conn in connections:
+            _close_connection(conn)
 
     def query(self, sql: str, params: Tuple = ()) -> List[Dict]:
         """
@@ -71,13 +384,11 @@ class DatabaseManager:
         Returns:
             List of result rows as dicts
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
+        cursor = self.get_connection().execute(sql, params)
+        rows = cursor.fetchall()
 
-            # Convert Row objects to dicts
-            return [dict(row) for row in rows]
+        # Convert Row objects to dicts
+        return [dict(row) for row in rows]
 
     # ==================== Market Data Methods ====================
 
@@ -93,63 +404,103 @@ class DatabaseManager:
             ohlcv: Dict with keys: open, high, low, close, volume
             data_source: Source of data (e.g., 'coinbase', 'alpaca')
         """
-        query = """
-            INSERT OR REPLACE INTO market_data
-            (symbol, asset_type, timestamp, open, high, low, close, volume,
-             quote_volume, num_trades, data_source)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    symbol,
-                    asset_type,
-                    timestamp.isoformat(),
-                    ohlcv['open'],
-                    ohlcv['high'],
-                    ohlcv['low'],
-                    ohlcv['close'],
-                    ohlcv['volume'],
-                    ohlcv.get('quote_volume'),
-                    ohlcv.get('num_trades'),
-                    data_source
-                ))
-                conn.commit()
+            o, h, l, c, v = _OHLCV_VALUES(ohlcv)
+            self._cursor().execute(_INSERT_MARKET_DATA_SQL, (
+                symbol, asset_type, timestamp.isoformat(), o, h, l, c, v,
+                ohlcv.get('quote_volume'), ohlcv.get('num_trades'), data_source
+            ))
             return True
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Error inserting market data: {e}")
             return False
 
-    def bulk_insert_market_data(self, data: List[Tuple]) -> int:
+    def bulk_insert_market_data(self, data: Iterable[Tuple]) -> int:
         """
         Bulk insert market data for efficiency.
 
         Args:
-            data: List of tuples matching market_data table structure
+            data: Tuples matching market_data table structure; any iterable,
+                consumed one batch at a time (so a generator over a large
+                file never needs to be materialized)
 
         Returns:
             Number of rows inserted
         """
-        query = """
-            INSERT OR REPLACE INTO market_data
-            (symbol, asset_type, timestamp, open, high, low, close, volume,
-             quote_volume, num_trades, data_source)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        return self._bulk_insert(_INSERT_MARKET_DATA_SQL, data, "market data")
+
+    def _bulk_insert(self, sql: str, rows: Iterable[Tuple], description: str) -> int:
         """
+        Insert many rows with a single-row INSERT statement, batched.
+
+        Rows are pulled from the iterable and written in transactions of
+        BULK_INSERT_BATCH_ROWS, so a batch costs one commit instead of one per
+        row and only one batch is held in memory. A failing batch is rolled
+        back and logged; batches before it stay committed. Within a batch,
+        rows are bound MULTI_ROW_INSERT_ROWS per statement execution.
+
+        Args:
+            sql: INSERT ... VALUES (?, ...) statement for one row
+            rows: Parameter tuples, one per row (any iterable)
+            description: What is being inserted, for the error log
 
+        Returns:
+            Number of rows inserted
+        """
+        rows = iter(rows)
+        inserted = 0
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany(query, data)
-                conn.commit()
-                return cursor.rowcount
+            while batch := list(islice(rows, BULK_INSERT_BATCH_ROWS)):
+                with self._transaction() as conn:
+                    batch_inserted = self._insert_rows(conn, sql, batch)
+                inserted += batch_inserted
+
+                self._rows_since_checkpoint += batch_inserted
+                if self._rows_since_checkpoint >= CHECKPOINT_INTERVAL_ROWS:
+                    self.checkpoint()
+            return inserted
+
+        except sqlite3.Error as e:
+            logger.error(f"Error bulk inserting {description}: {e}")
+            return inserted
+
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, sql: str, rows: Sequence[Tuple]) -> int:
+        """Insert rows through the multi-row statement, the remainder one row at a time."""
+        full = len(rows) - len(rows) % MULTI_ROW_INSERT_ROWS
+        inserted = 0
+        if full:
+            multi_row_sql = _multi_row_insert_sql(sql, MULTI_ROW_INSERT_ROWS)
+            for start in range(0, full, MULTI_ROW_INSERT_ROWS):
+                params = tuple(chain.from_iterable(rows[start:start + MULTI_ROW_INSERT_ROWS]))
+                inserted += conn.execute(multi_row_sql, params).rowcount
+        if full < len(rows):
+            inserted += conn.executemany(sql, rows[full:]).rowcount
+        return inserted
+
+    def insert_market_data_bulk(self, symbol: str, asset_type: str,
+                                timestamps: Sequence[datetime],
+                                ohlcv: np.ndarray, data_source: str) -> int:
+        """
+        Insert many candles for one symbol in a single executemany call.
+
+        Args:
+            symbol: Trading symbol
+            asset_type: 'CRYPTO', 'STOCK', 'ETF', 'FOREX'
+            timestamps: Candle timestamps (one per row of ohlcv); a UTC
+                DatetimeIndex is formatted without per-row isoformat() calls
+            ohlcv: Array of shape (n, 5) with open, high, low, close, volume
+            data_source: Source of data (e.g., 'coinbase', 'alpaca')
 
-        except Exception as e:
-            logger.error(f"Error bulk inserting market data: {e}")
-            return 0
+        Returns:
+            Number of rows inserted
+        """
+        rows = (
+            (symbol, asset_type, ts, o, h, l, c, v, None, None, data_source)
+            for ts, (o, h, l, c, v) in zip(_isoformat_all(timestamps), ohlcv.tolist())
+        )
+        return self.bulk_insert_market_data(rows)
 
     def get_market_data(self, symbol: str, start_date: datetime,
                        end_date: datetime, limit: Optional[int] = None) -> List[Dict]:
@@ -165,8 +516,109 @@ class DatabaseManager:
         Returns:
             List of market data dictionaries
         """
-        query = """
-            SELECT * FROM market_data
+        try:
+            return list(self.iter_market_data(symbol, start_date, end_date, limit))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching market data: {e}")
+            return []
+
+    def iter_market_data(self, symbol: str, start_date: datetime,
+                         end_date: datetime, limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream market data for symbol within date range, one dict per row.
+
+        Rows are fetched FETCH_ARRAY_SIZE at a time, so memory stays flat
+        however long the range is. The query keeps its read snapshot until
+        the iterator is exhausted or closed.
+
+        Args:
+            symbol: Trading symbol
+            start_date: Start datetime
+            end_date: End datetime
+            limit: Optional limit on number of rows
+
+        Yields:
+            Market data dictionaries in timestamp order
+        """
+        query, params = self._market_data_query(symbol, start_date, end_date, limit)
+
+        cursor = self.get_connection().execute(query, params)
+        cursor.arraysize = FETCH_ARRAY_SIZE
+        try:
+            while rows := cursor.fetchmany():
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
+    def get_market_data_df(self, symbol: str, start_date: datetime,
+                           end_date: datetime, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Fetch market data for symbol within date range as a DataFrame.
+
+        Same rows as get_market_data(), but built column by column by pandas
+        instead of as one dict per row, which is much faster and smaller for
+        long ranges.
+
+        Args:
+            symbol: Trading symbol
+            start_date: Start datetime
+            end_date: End datetime
+            limit: Optional limit on number of rows
+
+        Returns:
+            DataFrame of market_data columns with a parsed timestamp column
+            (empty on error)
+        """
+        query, params = self._market_data_query(symbol, start_date, end_date, limit)
+
+        try:
+            df = pd.read_sql_query(query, self.get_connection(), params=params)
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            return df
+
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:  # pandas re-wraps driver errors
+            logger.error(f"Error fetching market data: {e}")
+            return pd.DataFrame()
+
+    def get_market_data_ndarray(self, symbol: str, start_date: datetime,
+                                end_date: datetime, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Fetch OHLCV for symbol within date range as a NumPy structured array.
+
+        For numeric consumers: no per-row dicts, and fields can be sliced
+        straight into vectorized code. Timestamps are converted to epoch
+        milliseconds by SQLite in the query itself.
+
+        Args:
+            symbol: Trading symbol
+            start_date: Start datetime
+            end_date: End datetime
+            limit: Optional limit on number of rows
+
+        Returns:
+            Array of MARKET_DATA_DTYPE records in timestamp order (empty on error)
+        """
+        query, params = self._market_data_query(
+            symbol, start_date, end_date, limit, columns=_MARKET_DATA_ARRAY_COLUMNS
+        )
+
+        try:
+            cursor = self.get_connection().cursor()
+            cursor.row_factory = None  # Plain tuples, as np.fromiter expects
+            return np.fromiter(cursor.execute(query, params), dtype=MARKET_DATA_DTYPE)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching market data: {e}")
+            return np.empty(0, dtype=MARKET_DATA_DTYPE)
+
+    @staticmethod
+    def _market_data_query(symbol: str, start_date: datetime, end_date: datetime,
+                           limit: Optional[int], columns: str = "*") -> Tuple[str, List]:
+        """Build the market data range query and its parameters."""
+        query = f"""
+            SELECT {columns} FROM market_data
             WHERE symbol = ? AND timestamp BETWEEN ? AND ?
             ORDER BY timestamp ASC
         """
@@ -177,34 +629,16 @@ class DatabaseManager:
             query += " LIMIT ?"
             params.append(limit)
 
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
-
-        except Exception as e:
-            logger.error(f"Error fetching market data: {e}")
-            return []
+        return query, params
 
     def get_latest_market_data(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get latest market data for symbol."""
-        query = """
-            SELECT * FROM market_data
-            WHERE symbol = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (symbol, limit))
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            cursor = self.get_connection().execute(_SELECT_LATEST_MARKET_DATA_SQL, (symbol, limit))
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Error fetching latest market data: {e}")
             return []
 
@@ -242,32 +676,22 @@ class DatabaseManager:
         Returns:
             Position ID
         """
-        query = """
-            INSERT INTO positions
-            (symbol, asset_type, side, quantity, entry_price, entry_time,
-             stop_loss, take_profit, strategy_id, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    symbol,
-                    asset_type,
-                    side,
-                    quantity,
-                    entry_price,
-                    entry_time.isoformat(),
-                    stop_loss,
-                    take_profit,
-                    strategy_id,
-                    json.dumps(metadata) if metadata else None
-                ))
-                conn.commit()
-                return cursor.lastrowid
-
-        except Exception as e:
+            cursor = self.get_connection().execute(_INSERT_POSITION_SQL, (
+                symbol,
+                asset_type,
+                side,
+                quantity,
+                entry_price,
+                entry_time.isoformat(),
+                stop_loss,
+                take_profit,
+                strategy_id,
+                _json_dumps(metadata) if metadata else None
+            ))
+            return cursor.lastrowid
+
+        except sqlite3.Error as e:
             logger.error(f"Error creating position: {e}")
             return -1
 
@@ -282,39 +706,36 @@ class DatabaseManager:
         if not kwargs:
             return False
 
-        # Build dynamic UPDATE query
-        fields = []
+        unknown = kwargs.keys() - POSITION_UPDATE_FIELDS
+        if unknown:
+            logger.error(f"Cannot update position fields: {sorted(unknown)}")
+            return False
+
+        # One statement per distinct field set, bound in sorted field order
+        fields = tuple(sorted(kwargs))
+        query = _POSITION_UPDATE_SQL.get(fields)
+        if query is None:
+            assignments = ', '.join(f"{field} = ?" for field in fields)
+            query = f"UPDATE positions SET {assignments}, updated_at = ? WHERE id = ?"
+            _POSITION_UPDATE_SQL[fields] = query
+
         values = []
-        for key, value in kwargs.items():
-            fields.append(f"{key} = ?")
+        for field in fields:
+            value = kwargs[field]
             if isinstance(value, datetime):
                 values.append(value.isoformat())
             elif isinstance(value, dict):
-                values.append(json.dumps(value))
+                values.append(_json_dumps(value))
             else:
                 values.append(value)
-
-        # Add updated_at
-        fields.append("updated_at = ?")
         values.append(datetime.now().isoformat())
-
-        # Add position_id for WHERE clause
         values.append(position_id)
 
-        query = f"""
-            UPDATE positions
-            SET {', '.join(fields)}
-            WHERE id = ?
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, values)
-                conn.commit()
-                return cursor.rowcount > 0
+            cursor = self.get_connection().execute(query, values)
+            return cursor.rowcount > 0
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Error updating position: {e}")
             return False
 
@@ -335,13 +756,11 @@ class DatabaseManager:
         query += " ORDER BY entry_time DESC"
 
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            cursor = self.get_connection().execute(query, params)
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Error fetching open positions: {e}")
             return []
 
@@ -352,24 +771,14 @@ class DatabaseManager:
                     strategy_id: str, price: Optional[float] = None,
                     position_id: Optional[int] = None) -> int:
         """Create new order."""
-        query = """
-            INSERT INTO orders
-            (order_id, symbol, asset_type, side, order_type, quantity,
-             price, strategy_id, position_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    order_id, symbol, asset_type, side, order_type,
-                    quantity, price, strategy_id, position_id
-                ))
-                conn.commit()
-                return cursor.lastrowid
-
-        except Exception as e:
+            cursor = self.get_connection().execute(_INSERT_ORDER_SQL, (
+                order_id, symbol, asset_type, side, order_type,
+                quantity, price, strategy_id, position_id
+            ))
+            return cursor.lastrowid
+
+        except sqlite3.Error as e:
             logger.error(f"Error creating order: {e}")
             return -1
 
@@ -378,26 +787,14 @@ class DatabaseManager:
                            avg_fill_price: Optional[float] = None,
                            commission: Optional[float] = None) -> bool:
         """Update order status and fill information."""
-        query = """
-            UPDATE orders
-            SET status = ?, filled_quantity = COALESCE(?, filled_quantity),
-                avg_fill_price = COALESCE(?, avg_fill_price),
-                commission = COALESCE(?, commission),
-                updated_at = ?
-            WHERE order_id = ?
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    status, filled_quantity, avg_fill_price, commission,
-                    datetime.now().isoformat(), order_id
-                ))
-                conn.commit()
-                return cursor.rowcount > 0
-
-        except Exception as e:
+            cursor = self.get_connection().execute(_UPDATE_ORDER_STATUS_SQL, (
+                status, filled_quantity, avg_fill_price, commission,
+                datetime.now().isoformat(), order_id
+            ))
+            return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
             logger.error(f"Error updating order status: {e}")
             return False
 
@@ -407,28 +804,32 @@ class DatabaseManager:
                      strategy_id: str, signal_type: str, confidence: float,
                      price: float, metadata: Optional[Dict] = None) -> bool:
         """Insert trading signal."""
-        query = """
-            INSERT OR REPLACE INTO signals
-            (symbol, asset_type, timestamp, strategy_id, signal_type,
-             confidence, price, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    symbol, asset_type, timestamp.isoformat(), strategy_id,
-                    signal_type, confidence, price,
-                    json.dumps(metadata) if metadata else None
-                ))
-                conn.commit()
-                return True
-
-        except Exception as e:
+            self._cursor().execute(_INSERT_SIGNAL_SQL, (
+                symbol, asset_type, timestamp.isoformat(), strategy_id,
+                signal_type, confidence, price,
+                _json_dumps(metadata) if metadata else None
+            ))
+            return True
+
+        except sqlite3.Error as e:
             logger.error(f"Error inserting signal: {e}")
             return False
 
+    def bulk_insert_signals(self, rows: Iterable[Tuple]) -> int:
+        """
+        Bulk insert trading signals in batched transactions.
+
+        Args:
+            rows: Tuples of (symbol, asset_type, timestamp, strategy_id,
+                signal_type, confidence, price, metadata), with timestamp as
+                an ISO string and metadata as a JSON string or None
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(_INSERT_SIGNAL_SQL, rows, "signals")
+
     # ==================== Backtest Results Methods ====================
 
     def save_backtest_results(self, backtest_id: str, strategy_id: str,
@@ -436,64 +837,93 @@ class DatabaseManager:
                              start_date: datetime, end_date: datetime,
                              initial_capital: float, final_capital: float,
                              metrics: Dict, config: Dict, results: Dict) -> bool:
-        """Save backtest results."""
-        query = """
-            INSERT INTO backtest_results
-            (backtest_id, strategy_id, symbols, asset_type, start_date, end_date,
-             initial_capital, final_capital, total_return, sharpe_ratio, sortino_ratio,
-             max_drawdown, win_rate, total_trades, config, results)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
+        """Save backtest results (the detailed results dict as zlib-compressed JSON)."""
         try:
             total_return = (final_capital - initial_capital) / initial_capital
 
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    backtest_id, strategy_id, json.dumps(symbols), asset_type,
-                    start_date.isoformat(), end_date.isoformat(),
-                    initial_capital, final_capital, total_return,
-                    metrics.get('sharpe_ratio'), metrics.get('sortino_ratio'),
-                    metrics.get('max_drawdown'), metrics.get('win_rate'),
-                    metrics.get('total_trades'),
-                    json.dumps(config), json.dumps(results)
-                ))
-                conn.commit()
-                return True
-
-        except Exception as e:
+            self.get_connection().execute(_INSERT_BACKTEST_RESULTS_SQL, (
+                backtest_id, strategy_id, _json_dumps(symbols), asset_type,
+                start_date.isoformat(), end_date.isoformat(),
+                initial_capital, final_capital, total_return,
+                metrics.get('sharpe_ratio'), metrics.get('sortino_ratio'),
+                metrics.get('max_drawdown'), metrics.get('win_rate'),
+                metrics.get('total_trades'),
+                _json_dumps(config),
+                zlib.compress(_json_dumps(results).encode(), RESULTS_COMPRESSION_LEVEL)
+            ))
+            return True
+
+        except sqlite3.Error as e:
             logger.error(f"Error saving backtest results: {e}")
             return False
 
+    def load_backtest_results(self, backtest_id: str) -> Optional[Dict]:
+        """
+        Load one saved backtest with its JSON fields decoded.
+
+        Reads both compressed results and the plain JSON text written by
+        earlier versions.
+
+        Args:
+            backtest_id: Backtest ID passed to save_backtest_results()
+
+        Returns:
+            Row dict with symbols, config and results decoded, or None if
+            not found
+        """
+        try:
+            row = self.get_connection().execute(
+                _SELECT_BACKTEST_RESULTS_SQL, (backtest_id,)
+            ).fetchone()
+
+        except sqlite3.Error as e:
+            logger.error(f"Error loading backtest results: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        backtest = dict(row)
+        results = backtest['results']
+        if isinstance(results, bytes):
+            results = zlib.decompress(results)
+        backtest['results'] = json.loads(results)
+        backtest['symbols'] = json.loads(backtest['symbols'])
+        backtest['config'] = json.loads(backtest['config'])
+        return backtest
+
     # ==================== Risk Event Methods ====================
 
     def log_risk_event(self, event_type: str, severity: str, description: str,
                       symbol: Optional[str] = None, asset_type: Optional[str] = None,
                       strategy_id: Optional[str] = None, metadata: Optional[Dict] = None) -> bool:
         """Log risk event."""
-        query = """
-            INSERT INTO risk_events
-            (timestamp, event_type, severity, symbol, asset_type,
-             strategy_id, description, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (
-                    datetime.now().isoformat(), event_type, severity,
-                    symbol, asset_type, strategy_id, description,
-                    json.dumps(metadata) if metadata else None
-                ))
-                conn.commit()
-                return True
-
-        except Exception as e:
+            self._cursor().execute(_INSERT_RISK_EVENT_SQL, (
+                datetime.now().isoformat(), event_type, severity,
+                symbol, asset_type, strategy_id, description,
+                _json_dumps(metadata) if metadata else None
+            ))
+            return True
+
+        except sqlite3.Error as e:
             logger.error(f"Error logging risk event: {e}")
             return False
 
+    def bulk_log_risk_events(self, rows: Iterable[Tuple]) -> int:
+        """
+        Bulk log risk events in batched transactions.
+
+        Args:
+            rows: Tuples of (timestamp, event_type, severity, symbol,
+                asset_type, strategy_id, description, metadata), with
+                timestamp as an ISO string and metadata as a JSON string or None
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(_INSERT_RISK_EVENT_SQL, rows, "risk events")
+
     def get_recent_risk_events(self, limit: int = 10,
                               resolved: Optional[bool] = None) -> List[Dict]:
         """
@@ -526,7 +956,7 @@ class DatabaseManager:
 
         try:
             return self.query(query, params)
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Error fetching risk events: {e}")
             return []
 
@@ -0,0 +1,28 @@
+"""
+Helpers shared by the data modules.
+"""
+
+import hashlib
+
+import pandas as pd
+
+
+def frame_fingerprint(df: pd.DataFrame) -> bytes:
+    """
+    Content hash of a DataFrame (index, columns, dtypes and values).
+    
+    Dtypes are part of the key because the value hash alone cannot tell a
+    UTC index from its tz-naive copy, or 1 from 1.0.
+    
+    Args:
+        df: Input frame
+    
+    Returns:
+        16-byte digest identifying the frame's contents
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr((
+        df.shape, tuple(df.columns), str(df.index.dtype), tuple(map(str, df.dtypes))
+    )).encode())
+    hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return hasher.digest()
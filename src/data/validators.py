@@ -11,14 +11,42 @@ This module provides comprehensive validation for OHLCV data including:
 """
 
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from datetime import timedelta
 import pandas as pd
 import numpy as np
 
+from .utils import frame_fingerprint
+
 
 logger = logging.getLogger(__name__)
 
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+NUMERIC_COLUMNS = PRICE_COLUMNS + ['volume']
+
+# Distinct frames whose validation results each validator keeps
+VALIDATION_CACHE_SIZE = 8
+
+
+def _find_gaps(index: pd.DatetimeIndex) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Find gaps longer than 1.5x the median interval of a DatetimeIndex.
+    
+    Works on the int64 nanosecond values, so no Timedelta objects are
+    created for the intervals.
+    
+    Returns:
+        (positions, gaps, median): index positions of the rows ending each
+        gap, the gap lengths and the median interval, in nanoseconds
+    """
+    time_diff = np.diff(index.as_unit('ns').asi8)
+    median_diff = np.median(time_diff)
+    
+    # Find gaps (anything > 1.5x median interval)
+    gap_positions = np.flatnonzero(time_diff > median_diff * 1.5)
+    return gap_positions + 1, time_diff[gap_positions], median_diff
+
 
 class DataValidator:
     """
@@ -38,11 +66,16 @@ class DataValidator:
         """
         self.strict_mode = strict_mode
         self.validation_results = {}
+        self._cache: "OrderedDict[Tuple[bytes, bool], Tuple[bool, Dict]]" = OrderedDict()
     
     def validate(self, df: pd.DataFrame, symbol: str = "") -> bool:
         """
         Run all validation checks on a dataframe.
         
+        Results for the last VALIDATION_CACHE_SIZE distinct frames are cached
+        by content hash and strict mode, so validating the same data again
+        (e.g. backtest replays, retries) skips the checks.
+        
         Args:
             df: DataFrame with OHLCV data
             symbol: Optional symbol name for logging
@@ -55,6 +88,23 @@ class DataValidator:
         else:
             logger.info("Running validation")
         
+        key = None
+        if isinstance(df, pd.DataFrame) and not df.empty:
+            try:
+                key = (frame_fingerprint(df), self.strict_mode)
+            except TypeError:
+                # Unhashable cells (e.g. list-valued columns): validate uncached
+                logger.debug("Frame cannot be hashed, skipping validation cache")
+        
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                all_passed, results = cached
+                self.validation_results = {name: dict(r) for name, r in results.items()}
+                logger.debug(f"Using cached validation results for {len(df)} rows")
+                return all_passed
+        
         self.validation_results = {}
         
         # Run all validation checks
@@ -72,10 +122,19 @@ class DataValidator:
             ('outliers', self._check_outliers),
         ]
         
+        # Type, null and negative checks share one scan of the numeric columns
+        try:
+            fused_results = self._fused_column_scan(df)
+        except Exception:
+            fused_results = {}  # Individual checks report the error
+        
         all_passed = True
         for check_name, check_func in checks:
             try:
-                passed, message = check_func(df)
+                if check_name in fused_results:
+                    passed, message = fused_results[check_name]
+                else:
+                    passed, message = check_func(df)
                 self.validation_results[check_name] = {'passed': passed, 'message': message}
                 
                 if not passed:
@@ -98,6 +157,12 @@ class DataValidator:
         else:
             logger.error("✗ Some validation checks failed")
         
+        if key is not None:
+            results = {name: dict(r) for name, r in self.validation_results.items()}
+            self._cache[key] = (all_passed, results)
+            if len(self._cache) > VALIDATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
         return all_passed
     
     def _check_empty_data(self, df: pd.DataFrame) -> Tuple[bool, str]:
@@ -115,6 +180,50 @@ class DataValidator:
             return False, f"Missing required columns: {missing}"
         return True, "All required columns present"
     
+    def _fused_column_scan(self, df: pd.DataFrame) -> Dict[str, Tuple[bool, str]]:
+        """
+        Run the data type, null and negative value checks in one pass.
+        
+        The numeric columns are read into a single float block, and null
+        counts and negative flags both come from it instead of from separate
+        frame scans. Results match _check_data_types, _check_null_values and
+        _check_negative_values.
+        
+        Returns:
+            (passed, message) by check name; empty if a numeric column has a
+            non-numeric dtype, leaving those checks to run individually
+        """
+        numeric_columns = [col for col in NUMERIC_COLUMNS if col in df.columns]
+        if not all(pd.api.types.is_numeric_dtype(df[col]) for col in numeric_columns):
+            return {}
+        
+        block = df[numeric_columns].to_numpy(dtype=float, na_value=np.nan)
+        null_counts = np.isnan(block).sum(axis=0)
+        negative = (block < 0).any(axis=0)
+        
+        null_info = {col: int(n) for col, n in zip(numeric_columns, null_counts) if n}
+        if 'symbol' in df.columns:
+            symbol_nulls = int(df['symbol'].isnull().sum())
+            if symbol_nulls:
+                null_info = {'symbol': symbol_nulls, **null_info}
+        
+        if null_info:
+            null_result = (False, f"Found null values: {null_info}")
+        else:
+            null_result = (True, "No null values found")
+        
+        if negative.any():
+            negative_cols = [col for col, neg in zip(numeric_columns, negative) if neg]
+            negative_result = (False, f"Found negative values in: {negative_cols}")
+        else:
+            negative_result = (True, "No negative values found")
+        
+        return {
+            'data_types': (True, "All numeric columns have correct types"),
+            'null_values': null_result,
+            'negative_values': negative_result,
+        }
+    
     def _check_data_types(self, df: pd.DataFrame) -> Tuple[bool, str]:
         """Check that numeric columns are numeric."""
         numeric_columns = ['open', 'high', 'low', 'close', 'volume']
@@ -158,19 +267,22 @@ class DataValidator:
         - open between low and high
         - close between low and high
         """
+        # One NumPy block instead of per-column Series (no index alignment)
+        prices = df[PRICE_COLUMNS].to_numpy(dtype=float, na_value=np.nan)
+        open_, high, low, close = prices.T
         issues = (
-            (df['low'] > df['high']) |
-            (df['open'] > df['high']) |
-            (df['close'] > df['high']) |
-            (df['open'] < df['low']) |
-            (df['close'] < df['low'])
+            (low > high) |
+            (open_ > high) |
+            (close > high) |
+            (open_ < low) |
+            (close < low)
         )
         
         if issues.any():
             issue_count = issues.sum()
             # Show sample of problematic rows
-            sample = df[issues].head(3)
-            return False, f"Found {issue_count} rows with inconsistent prices. Sample:\n{sample[['open', 'high', 'low', 'close']]}"
+            sample = df.iloc[np.flatnonzero(issues)[:3]]
+            return False, f"Found {issue_count} rows with inconsistent prices. Sample:\n{sample[PRICE_COLUMNS]}"
         
         return True, "All prices are consistent (high >= low, open/close within range)"
     
@@ -206,21 +318,21 @@ class DataValidator:
         if len(df) < 2:
             return True, "Not enough data to check for gaps"
         
-        # Calculate time differences
-        time_diff = df.index.to_series().diff()
-        median_diff = time_diff.median()
+        if not isinstance(df.index, pd.DatetimeIndex):
+            return True, "Index is not DatetimeIndex, gaps not checked"
         
-        # Find gaps (anything > 1.5x median interval)
-        gaps = time_diff[time_diff > median_diff * 1.5]
+        gap_positions, gap_ns, _ = _find_gaps(df.index)
         
-        if not gaps.empty:
-            total_gap_time = gaps.sum()
-            gap_count = len(gaps)
+        if len(gap_positions):
+            total_gap_time = pd.Timedelta(int(gap_ns.sum()))
+            gap_count = len(gap_positions)
             
-            # Get details of largest gaps
-            largest_gaps = gaps.nlargest(3)
+            # Get details of largest gaps (only these become Timedeltas)
+            largest_gaps = np.argsort(-gap_ns, kind='stable')[:3]
             gap_details = []
-            for idx, gap in largest_gaps.items():
+            for i in largest_gaps:
+                idx = df.index[gap_positions[i]]
+                gap = pd.Timedelta(int(gap_ns[i]))
                 gap_start = idx - gap
                 gap_details.append(f"{gap_start} -> {idx} ({gap})")
             
@@ -238,29 +350,28 @@ class DataValidator:
     
     def _check_outliers(self, df: pd.DataFrame) -> Tuple[bool, str]:
         """Check for statistical outliers in prices."""
-        price_cols = ['open', 'high', 'low', 'close']
+        price_cols = PRICE_COLUMNS
+        available_columns = [col for col in price_cols if col in df.columns]
         outlier_info = {}
         
-        for col in price_cols:
-            if col not in df.columns:
-                continue
-            
-            # Use IQR method for outlier detection
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 3 * IQR  # 3x IQR for more tolerance
-            upper_bound = Q3 + 3 * IQR
-            
-            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-            
-            if not outliers.empty:
-                outlier_info[col] = {
-                    'count': len(outliers),
-                    'pct': len(outliers) / len(df) * 100,
-                    'values': outliers[col].tolist()[:3]  # First 3 outliers
-                }
+        # Use IQR method for outlier detection, all columns' quartiles in one call
+        quartiles = df[available_columns].quantile([0.25, 0.75]).to_numpy(dtype=float, na_value=np.nan)
+        Q1, Q3 = quartiles
+        IQR = Q3 - Q1
+        
+        lower_bound = Q1 - 3 * IQR  # 3x IQR for more tolerance
+        upper_bound = Q3 + 3 * IQR
+        
+        prices = df[available_columns].to_numpy(dtype=float, na_value=np.nan)
+        outliers = (prices < lower_bound) | (prices > upper_bound)
+        counts = outliers.sum(axis=0)
+        
+        for i in np.flatnonzero(counts):
+            outlier_info[available_columns[i]] = {
+                'count': int(counts[i]),
+                'pct': counts[i] / len(df) * 100,
+                'values': prices[outliers[:, i], i][:3].tolist()  # First 3 outliers
+            }
         
         if outlier_info:
             outlier_summary = {k: f"{v['count']} ({v['pct']:.1f}%)" 
@@ -371,7 +482,9 @@ def detect_and_handle_gaps(df: pd.DataFrame, max_gap_minutes: int = 60) -> pd.Da
     Detect and handle gaps in time series.
     
     Large gaps (> max_gap_minutes) are left as-is.
-    Small gaps are filled with interpolation.
+    Small gaps are filled with the missing bars at the median interval:
+    prices are linearly interpolated, volume and other columns are
+    forward filled. All gaps are filled in one pass over the frame.
     
     Args:
         df: DataFrame with OHLCV data
@@ -383,41 +496,60 @@ def detect_and_handle_gaps(df: pd.DataFrame, max_gap_minutes: int = 60) -> pd.Da
     if len(df) < 2:
         return df
     
+    if not isinstance(df.index, pd.DatetimeIndex):
+        logger.warning("Index is not DatetimeIndex, gaps not handled")
+        return df
+    
     df = df.copy()
     
     # Detect gaps
-    time_diff = df.index.to_series().diff()
-    median_diff = time_diff.median()
-    
-    gaps = time_diff[time_diff > median_diff * 1.5]
+    gap_positions, gap_ns, median_ns = _find_gaps(df.index)
     
-    if gaps.empty:
+    if not len(gap_positions):
         logger.debug("No gaps detected")
         return df
     
-    logger.info(f"Found {len(gaps)} gaps in data")
+    logger.info(f"Found {len(gap_positions)} gaps in data")
     
-    # Handle small gaps with interpolation
-    for idx, gap in gaps.items():
-        gap_minutes = gap.total_seconds() / 60
-        
-        if gap_minutes <= max_gap_minutes:
-            # Interpolate small gaps
-            gap_start = idx - gap
-            df_slice = df[gap_start:idx]
-            
-            # Linear interpolation for prices
-            price_cols = ['open', 'high', 'low', 'close']
-            for col in price_cols:
-                if col in df.columns:
-                    df.loc[gap_start:idx, col] = df.loc[gap_start:idx, col].interpolate(method='linear')
-            
-            # Forward fill for volume
-            if 'volume' in df.columns:
-                df.loc[gap_start:idx, 'volume'] = df.loc[gap_start:idx, 'volume'].fillna(method='ffill')
-            
-            logger.debug(f"Interpolated gap from {gap_start} to {idx} ({gap_minutes:.1f} min)")
-        else:
-            logger.warning(f"Large gap detected ({gap_minutes:.1f} min): {idx - gap} -> {idx}")
+    small = gap_ns <= max_gap_minutes * 60 * 10**9
+    for position, ns in zip(gap_positions[~small], gap_ns[~small]):
+        idx = df.index[position]
+        gap = pd.Timedelta(int(ns))
+        logger.warning(f"Large gap detected ({gap.total_seconds() / 60:.1f} min): {idx - gap} -> {idx}")
+    
+    interval = int(median_ns)
+    if not small.any() or interval <= 0:
+        return df
+    
+    # Timestamps of the bars missing inside each small gap
+    positions = gap_positions[small]
+    counts = (gap_ns[small] - 1) // interval
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+    timestamps = df.index.as_unit('ns').asi8
+    missing = np.repeat(timestamps[positions - 1], counts) + steps * interval
+    missing_index = pd.to_datetime(missing, utc=True).tz_convert(df.index.tz)
+    
+    # Insert the empty bars just before the row ending their gap (keeps row order)
+    original_len = len(df)
+    order = np.argsort(
+        np.concatenate([np.arange(original_len), np.repeat(positions, counts) - 0.5]),
+        kind='stable'
+    )
+    inserted = pd.DataFrame(np.nan, index=missing_index, columns=df.columns)
+    df = pd.concat([df, inserted]).iloc[order]
+    is_new = order >= original_len
+    
+    # Linear interpolation for prices
+    price_cols = [col for col in PRICE_COLUMNS if col in df.columns]
+    df.loc[is_new, price_cols] = (
+        df[price_cols].interpolate(method='linear', limit_area='inside').to_numpy()[is_new]
+    )
+    
+    # Forward fill for volume (and symbol etc.)
+    other_cols = df.columns.difference(price_cols, sort=False)
+    if len(other_cols):
+        df.loc[is_new, other_cols] = df[other_cols].ffill().to_numpy()[is_new]
+    
+    logger.debug(f"Interpolated {len(positions)} gaps ({len(missing)} bars)")
     
     return df
@@ -280,7 +280,7 @@ class PortfolioManager:
             side=side,
             entry_price=fill.price,
             quantity=fill.quantity,
-            entry_time=fill.timestamp.isoformat(),
+            entry_time=fill.timestamp,
             strategy_id=fill.metadata.get('strategy_id', 'unknown'),
             stop_loss=None,  # TODO: Get from signal
             take_profit=None
@@ -827,6 +827,69 @@ class TestPerformanceCalculator(unittest.TestCase):
         # CAGR should be ~10%
         self.assertAlmostEqual(metrics['returns']['cagr'], 0.10, places=3)
 
+    def test_metrics_accept_columnar_equity_curve(self):
+        """Test that (timestamps, equity) arrays match the list-of-tuples form."""
+        equity_curve = [
+            (datetime(2023, 1, 1), 100000.0),
+            (datetime(2023, 3, 1), 95000.0),
+            (datetime(2023, 6, 1), 110000.0),
+            (datetime(2023, 12, 31), 120000.0)
+        ]
+        timestamps = np.array([t for t, _ in equity_curve], dtype='datetime64[ns]')
+        equity = np.array([v for _, v in equity_curve])
+
+        kwargs = dict(
+            trades=[],
+            initial_capital=100000.0,
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 12, 31)
+        )
+        from_tuples = PerformanceCalculator(equity_curve=equity_curve, **kwargs).calculate_all()
+        from_arrays = PerformanceCalculator(equity_curve=(timestamps, equity), **kwargs).calculate_all()
+
+        self.assertAlmostEqual(from_arrays['returns']['total_return'],
+                               from_tuples['returns']['total_return'])
+        self.assertAlmostEqual(from_arrays['drawdown']['max_drawdown_pct'],
+                               from_tuples['drawdown']['max_drawdown_pct'])
+
+
+class TestBacktestEngine(unittest.TestCase):
+    """Test BacktestEngine result persistence."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(f"{self.temp_dir}/test.db")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_save_results_persists_backtest(self):
+        """Test that _save_results stores a row that loads back intact."""
+        engine = BacktestEngine(
+            strategy_config={'name': 'mean_reversion'},
+            symbols=['BTC/USD'],
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            initial_capital=100000.0,
+            backtest_id='bt_test'
+        )
+        engine.db = self.db
+        engine._equity_values.extend([101000.0, 102500.0])
+
+        engine._save_results({'sharpe_ratio': 1.2, 'total_trades': 4})
+
+        saved = self.db.load_backtest_results('bt_test')
+        self.assertIsNotNone(saved)
+        self.assertEqual(saved['symbols'], ['BTC/USD'])
+        self.assertEqual(saved['start_date'], '2024-01-01T00:00:00')
+        self.assertEqual(saved['final_capital'], 102500.0)
+        self.assertEqual(saved['sharpe_ratio'], 1.2)
+        self.assertEqual(saved['config'], {'strategy': {'name': 'mean_reversion'}, 'risk': {}})
+        self.assertEqual(saved['results'], {'equity_curve_length': 3, 'total_bars': 2})
+
 
 class TestBacktestReport(unittest.TestCase):
     """Test BacktestReport generation."""
@@ -963,6 +1026,35 @@ class TestBacktestReport(unittest.TestCase):
         finally:
             shutil.rmtree(temp_dir)
 
+    def test_report_skips_flat_equity_charts(self):
+        """Test that no-trade (flat) equity curves skip drawdown/returns charts."""
+        temp_dir = tempfile.mkdtemp()
+
+        try:
+            equity_curve = [
+                (datetime(2023, 1, 1), 100000.0),
+                (datetime(2023, 1, 2), 100000.0),
+                (datetime(2023, 1, 3), 100000.0)
+            ]
+
+            report = BacktestReport(
+                backtest_id='test_flat',
+                metrics={},
+                equity_curve=equity_curve,
+                trades=[],
+                initial_capital=100000.0
+            )
+
+            html_path = report.generate(output_dir=temp_dir)
+
+            self.assertTrue(Path(html_path).exists())
+            self.assertTrue(Path(temp_dir, 'test_flat_equity_curve.png').exists())
+            self.assertFalse(Path(temp_dir, 'test_flat_drawdown.png').exists())
+            self.assertFalse(Path(temp_dir, 'test_flat_returns_dist.png').exists())
+
+        finally:
+            shutil.rmtree(temp_dir)
+
 
 if __name__ == '__main__':
     # Run with verbose output
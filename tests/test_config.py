@@ -0,0 +1,210 @@
+"""
+Test suite for ConfigManager.
+
+Tests:
+- Plain-dict config storage and dot-notation lookup
+- Risk and strategy config loading
+- Enabled strategy/symbol selection
+- Environment variable interpolation
+"""
+
+import pytest
+
+from src.core.config import ConfigManager
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Create a minimal config tree (main, risk, two strategies)."""
+    strategies_dir = tmp_path / 'strategies'
+    strategies_dir.mkdir()
+
+    (tmp_path / 'risk.yaml').write_text(
+        "risk_limits:\n"
+        "  max_position_pct: 0.10\n"
+    )
+    (strategies_dir / 'enabled_strategy.yaml').write_text(
+        "strategy:\n"
+        "  name: Enabled\n"
+        "  enabled: true\n"
+        "backtest:\n"
+        "  start_date: 2023-01-01\n"
+    )
+    (strategies_dir / 'disabled_strategy.yaml').write_text(
+        "strategy:\n"
+        "  name: Disabled\n"
+        "  enabled: false\n"
+    )
+    (tmp_path / 'config.yaml').write_text(
+        "system:\n"
+        "  mode: backtest\n"
+        "database:\n"
+        "  type: sqlite\n"
+        "portfolio:\n"
+        "  initial_capital: 10000.0\n"
+        "data:\n"
+        "  crypto_symbols:\n"
+        "    - symbol: BTC/USD\n"
+        "      enabled: true\n"
+        "    - symbol: XRP/USD\n"
+        "      enabled: false\n"
+        f"strategies_config: {strategies_dir}\n"
+        f"risk_config: {tmp_path / 'risk.yaml'}\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def config(config_dir):
+    """ConfigManager loaded from the temporary config tree."""
+    return ConfigManager(str(config_dir / 'config.yaml'))
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_config_is_plain_dict(config):
+    """Test that the loaded config is stored as plain Python containers."""
+    assert type(config.config) is dict
+    assert type(config.get('risk')) is dict
+
+
+def test_get_dot_notation(config):
+    """Test nested lookups, list indices and defaults."""
+    assert config.get('system.mode') == 'backtest'
+    assert config.get('risk.risk_limits.max_position_pct') == 0.10
+    assert config.get('data.crypto_symbols.0.symbol') == 'BTC/USD'
+    assert config.get('system.missing', 'fallback') == 'fallback'
+    assert config.get('system.mode.deeper') is None
+
+
+def test_enabled_symbols(config):
+    """Test enabled symbol filtering by asset type."""
+    assert config.get_enabled_symbols('CRYPTO') == ('BTC/USD',)
+    assert config.get_enabled_symbols('STOCK') == ()
+    assert config.get_enabled_symbols() == ('BTC/USD',)
+
+
+def test_strategy_configs_load_lazily(config):
+    """Test that strategies are parsed on first request only."""
+    assert config.strategies == {}
+
+    strategy = config.get_strategy_config('enabled_strategy')
+
+    assert strategy['strategy']['name'] == 'Enabled'
+    assert strategy['backtest']['start_date'] == '2023-01-01'  # Dates stay strings
+    assert config.get_strategy_config('unknown') is None
+
+
+def test_enabled_strategies_skip_disabled(config):
+    """Test that disabled strategies are filtered without being parsed."""
+    enabled = config.get_enabled_strategies()
+
+    assert list(enabled) == ['enabled_strategy']
+    assert 'disabled_strategy' not in config.strategies
+
+
+def test_enabled_strategies_merge_keys_and_aliases(config_dir):
+    """Test that a flag supplied through a merge key or alias matches a full parse."""
+    strategies_dir = config_dir / 'strategies'
+    (strategies_dir / 'merged_strategy.yaml').write_text(
+        "defaults: &defaults\n"
+        "  enabled: true\n"
+        "strategy:\n"
+        "  name: Merged\n"
+        "  <<: *defaults\n"
+    )
+    (strategies_dir / 'aliased_flag_strategy.yaml').write_text(
+        "flag: &flag true\n"
+        "strategy:\n"
+        "  enabled: *flag\n"
+    )
+    (strategies_dir / 'aliased_disabled_strategy.yaml').write_text(
+        "base: &base\n"
+        "  enabled: false\n"
+        "strategy: *base\n"
+    )
+
+    enabled = ConfigManager(str(config_dir / 'config.yaml')).get_enabled_strategies()
+
+    assert sorted(enabled) == ['aliased_flag_strategy', 'enabled_strategy', 'merged_strategy']
+    assert enabled['merged_strategy']['strategy'] == {'name': 'Merged', 'enabled': True}
+
+
+def test_validate(config):
+    """Test validation of required keys."""
+    assert config.validate() is True
+
+
+def test_validate_rejects_invalid_mode(config_dir):
+    """Test that validation runs at load time and flags a bad mode."""
+    config_file = config_dir / 'config.yaml'
+    config_file.write_text(config_file.read_text().replace('mode: backtest', 'mode: turbo'))
+
+    assert ConfigManager(str(config_file)).validate() is False
+
+
+def test_exponent_floats_match_omegaconf(config_dir):
+    """Test that YAML 1.2 exponent floats load as floats, as with OmegaConf."""
+    from omegaconf import OmegaConf
+
+    config_file = config_dir / 'config.yaml'
+    config_file.write_text(
+        config_file.read_text()
+        + "model:\n"
+        "  learning_rate: 1e-3\n"
+        "  threshold: 2.5E+2\n"
+        "  steps: 1000\n"
+        "  version: '1e-3'\n"
+    )
+
+    model = ConfigManager(str(config_file)).get('model')
+
+    assert model == {'learning_rate': 0.001, 'threshold': 250.0, 'steps': 1000, 'version': '1e-3'}
+    assert model == OmegaConf.to_container(OmegaConf.load(config_file))['model']
+
+
+def test_env_interpolation_resolved(config_dir, monkeypatch):
+    """Test env var substitution, including re-reading when the env changes."""
+    monkeypatch.setenv('QS_TEST_DB', 'postgresql')
+    config_file = config_dir / 'config.yaml'
+    config_file.write_text(
+        config_file.read_text().replace('type: sqlite', 'type: ${oc.env:QS_TEST_DB}')
+        + "paths:\n"
+        "  db_url: !ENV db://${QS_TEST_HOST}\n"
+        "  port: ${oc.env:QS_TEST_PORT,5432}\n"
+    )
+    monkeypatch.setenv('QS_TEST_HOST', 'localhost')
+
+    config = ConfigManager(str(config_file))
+    assert config.get('database.type') == 'postgresql'
+    assert config.get('paths.db_url') == 'db://localhost'
+    assert config.get('paths.port') == '5432'
+
+    monkeypatch.setenv('QS_TEST_DB', 'sqlite')
+    assert ConfigManager(str(config_file)).get('database.type') == 'sqlite'
+
+
+def test_bare_interpolation_is_not_an_env_lookup(config_dir, monkeypatch):
+    """Test that a bare ${NAME} outside !ENV is a node reference, as in OmegaConf."""
+    from omegaconf.errors import InterpolationKeyError
+
+    monkeypatch.setenv('QS_TEST_BARE', 'from-env')
+    config_file = config_dir / 'config.yaml'
+    config_file.write_text(config_file.read_text() + "log_dir: ${QS_TEST_BARE}\n")
+
+    with pytest.raises(InterpolationKeyError):
+        ConfigManager(str(config_file))
+
+
+def test_node_interpolation_falls_back_to_omegaconf(config_dir):
+    """Test that non-env interpolations are still resolved by OmegaConf."""
+    config_file = config_dir / 'config.yaml'
+    config_file.write_text(config_file.read_text() + "log_name: run_${system.mode}\n")
+
+    assert ConfigManager(str(config_file)).get('log_name') == 'run_backtest'
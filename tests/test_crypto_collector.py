@@ -0,0 +1,254 @@
+"""
+Test suite for CryptoCollector.
+
+Uses an in-memory fake exchange in place of a live CCXT connection.
+
+Tests:
+- Historical fetch and pagination (sync, chunked and concurrent)
+- Rate limiting
+- Database storage and event publishing
+- Data validation
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.core.event_bus import ThreadedEventBus
+from src.core.events import EventType
+from src.data.collectors import crypto_collector
+from src.data.collectors.crypto_collector import CryptoCollector
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HOUR_MS = 3_600_000
+
+
+class FakeExchange:
+    """Minimal stand-in for a CCXT exchange serving hourly BTC/USD candles."""
+
+    features = {'spot': {'fetchOHLCV': {'limit': 24}}}  # One day of hourly candles
+    options = {}
+
+    def __init__(self, num_candles: int = 48):
+        self.markets = {'BTC/USD': {}}
+        self.start_ms = int(START.timestamp() * 1000)
+        self.num_candles = num_candles
+        self.calls = 0
+        self.currencies = {'BTC': {}, 'USD': {}}
+        self.markets_loads = 0
+
+    def load_markets(self):
+        self.markets_loads += 1
+        return self.markets
+
+    def set_markets(self, markets, currencies=None):
+        self.markets = markets
+        self.currencies = currencies
+
+    def fetch_ohlcv(self, symbol, timeframe='1h', since=None, limit=None):
+        self.calls += 1
+        first = max(0, (since - self.start_ms) // HOUR_MS) if since else 0
+        last = min(self.num_candles, first + (limit or self.num_candles))
+        return [
+            [self.start_ms + i * HOUR_MS, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0]
+            for i in range(first, last)
+        ]
+
+
+class FakeAsyncExchange:
+    """Async wrapper around FakeExchange (ccxt.async_support interface)."""
+
+    def __init__(self, exchange: FakeExchange):
+        self.exchange = exchange
+        self.closed = False
+
+    async def fetch_ohlcv(self, symbol, timeframe='1h', since=None, limit=None):
+        await asyncio.sleep(0)
+        return self.exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+
+    async def close(self):
+        self.closed = True
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def exchange():
+    """Fake exchange with two days of hourly candles."""
+    return FakeExchange()
+
+
+@pytest.fixture
+def collector(mock_config, db_manager, event_bus, exchange, monkeypatch):
+    """CryptoCollector wired to the fake exchange, a temp DB and a backtest bus."""
+    monkeypatch.setattr(crypto_collector.time, 'sleep', lambda seconds: None)
+    with patch.object(CryptoCollector, '_init_exchange', return_value=exchange):
+        collector = CryptoCollector(mock_config, db_manager, event_bus)
+    yield collector
+    collector.close()
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_fetch_historical_data(collector):
+    """Test that a multi-day range is paginated into one sorted frame."""
+    df = collector.fetch_historical_data(
+        'BTC/USD', START, START + timedelta(hours=48), timeframe='1h'
+    )
+
+    assert len(df) == 48
+    assert df.index.is_monotonic_increasing
+    assert not df.index.has_duplicates
+    assert df['open'].iloc[0] == 100.0
+
+
+def test_fetch_historical_data_dedups_exchange_rows(collector, exchange):
+    """Test that duplicate/out-of-order candles are sorted out, not fatal."""
+    fetch_ohlcv = exchange.fetch_ohlcv
+
+    def messy_fetch_ohlcv(*args, **kwargs):
+        rows = fetch_ohlcv(*args, **kwargs)
+        return rows[1:2] + rows + rows[-1:]  # Out of order and duplicated
+
+    exchange.fetch_ohlcv = messy_fetch_ohlcv
+    df = collector.fetch_historical_data(
+        'BTC/USD', START, START + timedelta(hours=48), timeframe='1h'
+    )
+
+    assert len(df) == 48
+    assert df.index.is_monotonic_increasing
+    assert not df.index.has_duplicates
+
+
+def test_iter_historical_chunks(collector):
+    """Test that chunks are yielded one fetch window at a time, in order."""
+    chunks = list(collector.iter_historical_chunks(
+        'BTC/USD', START, START + timedelta(hours=40), timeframe='1h'
+    ))
+
+    assert [len(chunk) for chunk in chunks] == [24, 16]
+    assert chunks[1].index[0] == chunks[0].index[-1] + timedelta(hours=1)
+
+
+def test_ohlcv_limit_from_exchange(collector, exchange):
+    """Test that the page size follows the exchange's advertised limit."""
+    assert collector._ohlcv_limit == 24
+
+    exchange.options = {'fetchOHLCVLimit': 1500}
+    assert CryptoCollector._max_ohlcv_limit(exchange) == 1500
+
+    exchange.features = {}
+    exchange.options = {}
+    assert CryptoCollector._max_ohlcv_limit(exchange) == crypto_collector.DEFAULT_OHLCV_LIMIT
+
+
+def test_markets_cache_skips_reload(collector, exchange, tmp_path):
+    """Test that markets are loaded once, then restored from the disk cache."""
+    collector.markets_cache_dir = tmp_path
+    collector._load_markets(exchange)
+    exchange.markets = {}
+    collector._load_markets(exchange)
+
+    assert exchange.markets_loads == 1
+    assert exchange.markets == {'BTC/USD': {}}
+    assert exchange.currencies == {'BTC': {}, 'USD': {}}
+
+
+def test_fetch_historical_data_async(collector, exchange):
+    """Test concurrent page fetching matches the requested range."""
+    async_exchange = FakeAsyncExchange(exchange)
+
+    async def init_async_exchange():
+        return async_exchange
+
+    with patch.object(collector, '_init_async_exchange', init_async_exchange):
+        df = asyncio.run(collector.fetch_historical_data_async(
+            'BTC/USD', START + timedelta(hours=2), START + timedelta(hours=40),
+            timeframe='1h', limit=10
+        ))
+
+    assert len(df) == 38
+    assert df.index[0] == START + timedelta(hours=2)
+    assert df.index.is_monotonic_increasing
+    assert exchange.calls == 4  # 38 candles in pages of 10
+    assert async_exchange.closed
+
+
+def test_init_async_exchange(collector, exchange):
+    """Test the real async CCXT exchange gets the markets and opens its own session."""
+    pytest.importorskip('ccxt.async_support')
+    exchange.markets = {'BTC/USD': {
+        'id': 'BTC-USD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD',
+        'baseId': 'BTC', 'quoteId': 'USD', 'type': 'spot', 'spot': True, 'active': True,
+    }}
+    exchange.currencies = None
+
+    async def build_open_close():
+        async_exchange = await collector._init_async_exchange()
+        try:
+            assert async_exchange.market_id('BTC/USD') == 'BTC-USD'
+            assert async_exchange.session is None  # Left for CCXT to open
+            async_exchange.open()
+            assert not async_exchange.session.closed
+        finally:
+            await async_exchange.close()
+        return async_exchange
+
+    async_exchange = asyncio.run(build_open_close())
+
+    assert async_exchange.session is None
+
+
+def test_rate_limit_allows_burst_then_waits(collector):
+    """Test the token bucket: a burst of rate_limit requests, then spacing."""
+    waits = [collector._acquire_token() for _ in range(collector.rate_limit + 2)]
+
+    assert waits[:collector.rate_limit - 1] == [0.0] * (collector.rate_limit - 1)
+    assert waits[-1] > waits[-2] > 0
+
+
+def test_collect_and_store(collector, db_manager, event_bus):
+    """Test that candles are stored and published as MarketDataEvents."""
+    assert collector.collect_and_store(
+        'BTC/USD', START, START + timedelta(hours=24), timeframe='1h'
+    )
+
+    rows = db_manager.get_market_data('BTC/USD', START, START + timedelta(hours=24))
+    events = event_bus.get_history(event_type=EventType.MARKET_DATA)
+
+    assert len(rows) == 24
+    assert rows[0]['timestamp'] == START.isoformat()
+    assert len(events) == 24
+    assert events[-1].ohlcv['close'] == 123.5
+    assert collector._event_thread is None  # Plain EventBus: published on this thread
+
+
+def test_collect_and_store_threaded_bus(collector):
+    """Test that a ThreadedEventBus gets its events from the publisher thread."""
+    collector.event_bus = ThreadedEventBus(mode='backtest')
+
+    assert collector.collect_and_store(
+        'BTC/USD', START, START + timedelta(hours=24), timeframe='1h'
+    )
+
+    events = collector.event_bus.get_history(event_type=EventType.MARKET_DATA)
+    assert len(events) == 24
+    assert collector._event_thread.is_alive()
+
+    collector.close()
+    assert collector._event_thread is None
+
+
+def test_validate_data_rejects_inconsistent_prices(collector):
+    """Test that rows with low > high fail validation."""
+    df = collector.fetch_ohlcv('BTC/USD', timeframe='1h', limit=10)
+    df.loc[df.index[3], 'low'] = df['high'].iloc[3] + 1
+
+    assert collector.validate_data(df) is False
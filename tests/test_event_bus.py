@@ -0,0 +1,246 @@
+"""
+Test suite for EventBus.
+
+Tests:
+- Publish/dispatch to subscribers
+- Event history filtering (type and time range)
+- Statistics
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.core.event_bus import AsyncEventBus, EventBus
+from src.core.events import (
+    EventType, MARKET_DATA_BATCH_DTYPE, MarketDataBatchEvent, MarketDataEvent,
+    OrderEvent
+)
+
+
+BASE_TIME = datetime(2024, 1, 1)
+
+
+def create_market_event(minutes: int) -> MarketDataEvent:
+    """Helper to create market data event at BASE_TIME + minutes."""
+    return MarketDataEvent(
+        timestamp=BASE_TIME + timedelta(minutes=minutes),
+        symbol='BTC/USD',
+        asset_type='CRYPTO',
+        ohlcv={'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0},
+        data_source='test'
+    )
+
+
+def create_order_event(minutes: int) -> OrderEvent:
+    """Helper to create order event at BASE_TIME + minutes."""
+    return OrderEvent(
+        timestamp=BASE_TIME + timedelta(minutes=minutes),
+        type=EventType.ORDER,
+        order_id=f'order_{minutes}',
+        symbol='BTC/USD'
+    )
+
+
+@pytest.fixture
+def populated_bus():
+    """Backtest-mode bus with 10 market events and out-of-order orders."""
+    bus = EventBus(mode='backtest')
+    for i in range(10):
+        bus.publish(create_market_event(i))
+    for minutes in (8, 2, 5):
+        bus.publish(create_order_event(minutes))
+    return bus
+
+
+def test_dispatch_to_subscribers():
+    """Test that handlers receive only their event type."""
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventType.MARKET_DATA, received.append)
+
+    bus.publish(create_market_event(0))
+    bus.publish(create_order_event(0))
+    bus.process_events()
+
+    assert len(received) == 1
+    assert received[0].type == EventType.MARKET_DATA
+
+
+def test_unsubscribe_stops_delivery():
+    """Test that unsubscribed handlers no longer receive events."""
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventType.MARKET_DATA, received.append)
+    bus.unsubscribe(EventType.MARKET_DATA, received.append)
+
+    bus.publish(create_market_event(0))
+    bus.process_events()
+
+    assert received == []
+
+
+def test_async_bus_dispatches_sync_and_async_handlers():
+    """Test that the async bus awaits coroutine handlers and runs sync ones."""
+    received = []
+
+    async def on_market_async(event):
+        received.append(('async', event.symbol))
+
+    def on_market_sync(event):
+        received.append(('sync', event.symbol))
+
+    async def run():
+        bus = AsyncEventBus()
+        bus.subscribe(EventType.MARKET_DATA, on_market_async)
+        bus.subscribe(EventType.MARKET_DATA, on_market_sync)
+        await bus.publish_async(create_market_event(0))
+        await bus.process_events_async()
+
+    asyncio.run(run())
+
+    assert sorted(received) == [('async', 'BTC/USD'), ('sync', 'BTC/USD')]
+
+
+def test_market_data_batch_dispatch():
+    """Test that a batch reaches batch and per-bar subscribers."""
+    bus = EventBus()
+    batches, bars = [], []
+    bus.subscribe(EventType.MARKET_DATA_BATCH, batches.append)
+
+    bar_array = np.zeros(3, dtype=MARKET_DATA_BATCH_DTYPE)
+    bar_array['timestamp_ns'] = np.datetime64(BASE_TIME, 'ns').astype(np.int64)
+    bar_array['symbol_id'] = [0, 1, 0]
+    bar_array['close'] = [100.0, 200.0, 101.0]
+    batch = MarketDataBatchEvent(
+        timestamp=BASE_TIME, type=EventType.MARKET_DATA_BATCH,
+        bars=bar_array, symbols=('BTC/USD', 'ETH/USD'),
+        asset_type='CRYPTO', data_source='test'
+    )
+
+    bus.publish(batch)
+    assert len(bus.event_queue) == 1  # No per-bar events without subscribers
+
+    bus.subscribe(EventType.MARKET_DATA, bars.append)
+    bus.publish(batch)
+    bus.process_events()
+
+    assert len(batches) == 2
+    assert [(e.symbol, e.ohlcv['close']) for e in bars] == [
+        ('BTC/USD', 100.0), ('ETH/USD', 200.0), ('BTC/USD', 101.0)
+    ]
+    assert bars[0].timestamp == BASE_TIME
+
+
+def test_history_filter_by_type_and_time(populated_bus):
+    """Test type + time range filtering on time-ordered events."""
+    events = populated_bus.get_history(
+        event_type=EventType.MARKET_DATA,
+        start_time=BASE_TIME + timedelta(minutes=3),
+        end_time=BASE_TIME + timedelta(minutes=6)
+    )
+
+    assert [e.timestamp.minute for e in events] == [3, 4, 5, 6]
+
+
+def test_history_filter_unordered_type(populated_bus):
+    """Test time filtering when a type's events arrived out of order."""
+    events = populated_bus.get_history(
+        event_type=EventType.ORDER,
+        start_time=BASE_TIME + timedelta(minutes=4)
+    )
+
+    assert [e.order_id for e in events] == ['order_8', 'order_5']
+
+
+def test_history_filter_by_time_only(populated_bus):
+    """Test time filtering across all event types."""
+    events = populated_bus.get_history(end_time=BASE_TIME + timedelta(minutes=2))
+
+    assert len(events) == 4  # Market events 0-2 plus order_2
+
+
+def test_history_filter_by_symbol(populated_bus):
+    """Test symbol filtering, alone and combined with type/time filters."""
+    populated_bus.publish(MarketDataEvent(
+        timestamp=BASE_TIME, symbol='ETH/USD', asset_type='CRYPTO',
+        ohlcv={'close': 1.0}, data_source='test'
+    ))
+
+    eth = populated_bus.get_history(symbol='ETH/USD')
+    btc_orders = populated_bus.get_history(
+        event_type=EventType.ORDER, end_time=BASE_TIME + timedelta(minutes=5),
+        symbol='BTC/USD'
+    )
+
+    assert [e.symbol for e in eth] == ['ETH/USD']
+    assert [e.order_id for e in btc_orders] == ['order_2', 'order_5']
+    assert populated_bus.get_history(symbol='UNKNOWN/USD') == []
+
+
+def test_history_time_range_on_ordered_history():
+    """Test time-only filtering when the whole history is time-ordered."""
+    bus = EventBus(mode='backtest')
+    for i in range(2000):  # Exceeds initial columnar capacity
+        bus.publish(create_market_event(i))
+
+    events = bus.get_history(
+        start_time=BASE_TIME + timedelta(minutes=1500),
+        end_time=BASE_TIME + timedelta(minutes=1502, seconds=30)
+    )
+
+    assert [e.timestamp for e in events] == [
+        BASE_TIME + timedelta(minutes=m) for m in (1500, 1501, 1502)
+    ]
+
+
+def test_history_grows_past_expected_events():
+    """Test that preallocated history grows and supports list-style access."""
+    bus = EventBus(mode='backtest', expected_events=4)
+    for i in range(10):
+        bus.publish(create_market_event(i))
+
+    history = bus.get_history()
+
+    assert len(bus.event_history) == 10
+    assert [e.timestamp.minute for e in history] == list(range(10))
+    assert bus.event_history[-1] is history[-1]
+
+    bus.clear_history()
+    assert bus.get_history() == []
+
+
+def test_history_mixed_naive_and_aware_timestamps(populated_bus):
+    """Test that aware and naive timestamps compare as UTC instead of raising."""
+    populated_bus.publish(MarketDataEvent(
+        timestamp=datetime(2024, 1, 1, 0, 20, tzinfo=timezone.utc),
+        symbol='BTC/USD', asset_type='CRYPTO', ohlcv={'close': 1.0}, data_source='test'
+    ))
+
+    events = populated_bus.get_history(
+        event_type=EventType.MARKET_DATA,
+        start_time=datetime(2024, 1, 1, 0, 9, tzinfo=timezone.utc)
+    )
+
+    assert [e.timestamp.minute for e in events] == [9, 20]
+
+
+def test_history_disabled_in_live_mode():
+    """Test that live mode keeps no history or columnar index."""
+    bus = EventBus(mode='live')
+    bus.publish(create_market_event(0))
+
+    assert bus.get_history() == []
+    assert bus.get_history(event_type=EventType.MARKET_DATA) == []
+    assert len(bus._h_ts) == 0
+
+
+def test_stats_counts_by_type(populated_bus):
+    """Test event counts in statistics."""
+    stats = populated_bus.get_stats()
+
+    assert stats['history_size'] == 13
+    assert stats['event_counts'] == {'market_data': 10, 'order': 3}
@@ -0,0 +1,262 @@
+"""
+Test suite for FeatureEngineer.
+
+Tests:
+- Indicator values against the `ta` library definitions
+- Indicator result cache and multi-symbol batches
+- Cyclical time features
+- Fit/transform normalization (no leakage, chunked and incremental)
+- Save/load round trip (npz and legacy pickle)
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import features
+from src.data.features import FeatureEngineer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def ohlcv():
+    """300 hourly candles of a random walk, UTC-indexed."""
+    rng = np.random.default_rng(7)
+    n = 300
+    close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.002, n))
+    return pd.DataFrame({
+        'symbol': 'BTC/USD',
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, n))),
+        'low': np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, n))),
+        'close': close,
+        'volume': rng.uniform(100, 1000, n),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h', tz='UTC'))
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_indicators_match_ta(ohlcv):
+    """Test that indicator values match the ta library's implementations."""
+    ta = pytest.importorskip('ta')
+
+    features = FeatureEngineer().calculate_indicators(ohlcv)
+    close, high, low = ohlcv['close'], ohlcv['high'], ohlcv['low']
+    macd = ta.trend.MACD(close, window_slow=26, window_fast=12, window_sign=9)
+    bb = ta.volatility.BollingerBands(close, window=20, window_dev=2)
+    stoch = ta.momentum.StochasticOscillator(high, low, close, window=14, smooth_window=3)
+    expected = {
+        'rsi': ta.momentum.RSIIndicator(close, window=14).rsi(),
+        'macd': macd.macd(),
+        'macd_signal': macd.macd_signal(),
+        'bb_high': bb.bollinger_hband(),
+        'bb_low': bb.bollinger_lband(),
+        'sma_50': ta.trend.SMAIndicator(close, window=50).sma_indicator(),
+        'ema_26': ta.trend.EMAIndicator(close, window=26).ema_indicator(),
+        'stoch_d': stoch.stoch_signal(),
+        'vwap': ta.volume.VolumeWeightedAveragePrice(
+            high, low, close, ohlcv['volume'], window=14
+        ).volume_weighted_average_price(),
+    }
+
+    # Compare past the warm-up rows, which are back-filled
+    tail = slice(60, None)
+    for name, series in expected.items():
+        np.testing.assert_allclose(
+            features[name].to_numpy()[tail], series.to_numpy()[tail], rtol=1e-9,
+            err_msg=name
+        )
+
+
+def test_rolling_paths_agree(ohlcv, monkeypatch):
+    """Test that sliding-window and pandas rolling stats give the same features."""
+    short_path = FeatureEngineer().calculate_indicators(ohlcv)
+    monkeypatch.setattr(features, 'SLIDING_WINDOW_MAX_ROWS', 0)
+    long_path = FeatureEngineer().calculate_indicators(ohlcv)
+
+    pd.testing.assert_frame_equal(short_path, long_path, rtol=1e-9)
+
+
+def test_calculate_indicators_leaves_input_untouched(ohlcv):
+    """Test that the caller's frame is not modified (including unsorted/naive input)."""
+    shuffled = ohlcv.sample(frac=1, random_state=0).tz_localize(None)
+    before = shuffled.copy()
+
+    features = FeatureEngineer().calculate_indicators(shuffled)
+
+    pd.testing.assert_frame_equal(shuffled, before)
+    assert features.index.is_monotonic_increasing
+    assert str(features.index.tz) == 'UTC'
+
+
+def test_calculate_indicators_cache(ohlcv, monkeypatch):
+    """Test that repeated frames hit the cache and callers get private copies."""
+    fe = FeatureEngineer()
+    fe.calculate_indicators(ohlcv)  # First sighting: not cached
+    second = fe.calculate_indicators(ohlcv)
+    second['rsi'] = 0.0
+
+    monkeypatch.setattr(fe, '_calculate_indicators', lambda df: pytest.fail('recomputed'))
+    third = fe.calculate_indicators(ohlcv.copy())
+
+    assert third['rsi'].iloc[-1] != 0.0
+    assert len(third) == len(second)
+
+
+def test_growing_window_skips_cache(ohlcv, monkeypatch):
+    """Test that never-seen frames are neither hashed nor stored."""
+    monkeypatch.setattr(features, 'frame_fingerprint', lambda df: pytest.fail('hashed'))
+    fe = FeatureEngineer()
+
+    for end in range(100, 110):
+        fe.calculate_indicators(ohlcv.iloc[:end])
+
+    assert len(fe._indicator_cache) == 0
+
+
+def test_calculate_indicators_batch(ohlcv):
+    """Test that the multi-symbol batch matches per-symbol calculation."""
+    frames = {
+        'BTC/USD': ohlcv,
+        'ETH/USD': ohlcv.assign(symbol='ETH/USD', close=ohlcv['close'] / 20),
+        'BAD/USD': ohlcv.iloc[:10],
+    }
+
+    results = FeatureEngineer().calculate_indicators_batch(frames, max_workers=2)
+
+    assert list(results) == list(frames)
+    assert results['BAD/USD'] is None  # Too few rows
+    for symbol in ('BTC/USD', 'ETH/USD'):
+        pd.testing.assert_frame_equal(
+            results[symbol], FeatureEngineer().calculate_indicators(frames[symbol])
+        )
+
+
+def test_cyclical_time_features(ohlcv):
+    """Test hour and day-of-week sin/cos encoding."""
+    features = FeatureEngineer().calculate_indicators(ohlcv)
+    first = features.iloc[0]  # 2024-01-01 00:00 UTC, a Monday
+
+    assert first['hour_sin'] == pytest.approx(0.0)
+    assert first['hour_cos'] == pytest.approx(1.0)
+    assert first['day_of_week_sin'] == pytest.approx(0.0)
+    assert 'hour' not in features.columns
+
+
+def test_transform_uses_training_statistics(ohlcv):
+    """Test that transform applies the scaler fitted on training data."""
+    fe = FeatureEngineer()
+    train = fe.fit_transform(ohlcv.iloc[:200])
+    test = fe.transform(ohlcv.iloc[200:])
+
+    columns = fe.get_feature_names()
+    assert columns == list(FeatureEngineer.FEATURE_COLUMNS)
+    assert (train[columns].dtypes == np.float32).all()
+    np.testing.assert_allclose(train[columns].mean().to_numpy(), 0.0, atol=1e-5)
+    assert not np.allclose(test[columns].mean().to_numpy(), 0.0, atol=1e-3)
+
+
+def test_fit_transform_chunked(ohlcv):
+    """Test that chunked fitting matches one fit over all chunks' features."""
+    chunks = [ohlcv.iloc[:150], ohlcv.iloc[150:]]
+    fe = FeatureEngineer()
+
+    transformed = list(fe.fit_transform_chunked(chunks))
+
+    columns = fe.get_feature_names()
+    combined = pd.concat([fe.calculate_indicators(chunk) for chunk in chunks])
+    np.testing.assert_allclose(fe.scaler.mean_, combined[columns].mean().to_numpy())
+    assert sum(len(chunk) for chunk in transformed) == len(combined)
+    np.testing.assert_allclose(
+        pd.concat(transformed)[columns].mean().to_numpy(), 0.0, atol=1e-5
+    )
+
+    with pytest.raises(TypeError):
+        fe.fit_transform_chunked(iter(chunks))
+
+
+def test_fit_transform_batch(ohlcv):
+    """Test that a multi-symbol fit pools statistics across symbols."""
+    frames = {
+        'BTC/USD': ohlcv,
+        'ETH/USD': ohlcv.assign(symbol='ETH/USD', close=ohlcv['close'] / 20),
+        'BAD/USD': ohlcv.iloc[:10],
+    }
+    fe = FeatureEngineer()
+
+    results = fe.fit_transform_batch(frames, max_workers=2)
+
+    assert results['BAD/USD'] is None
+    pooled = pd.concat([fe.calculate_indicators(frames[s]) for s in ('BTC/USD', 'ETH/USD')])
+    np.testing.assert_allclose(
+        fe.scaler.mean_, pooled[fe.get_feature_names()].mean().to_numpy()
+    )
+    pd.testing.assert_frame_equal(results['ETH/USD'], fe.transform(frames['ETH/USD']))
+
+
+def test_transform_incremental_matches_full(ohlcv, monkeypatch):
+    """Test that bar-by-bar updates over a bounded tail match a full transform."""
+    monkeypatch.setattr(features, 'INCREMENTAL_HISTORY_ROWS', 250)
+    fe = FeatureEngineer()
+    fe.fit_transform(ohlcv.iloc[:200])
+
+    first = fe.transform_incremental(ohlcv.iloc[:200])
+    updates = [fe.transform_incremental(ohlcv.iloc[i:i + 10]) for i in range(200, 300, 10)]
+
+    incremental = pd.concat([first] + updates)
+    pd.testing.assert_frame_equal(incremental, fe.transform(ohlcv), atol=1e-4)
+    assert len(fe._history) == 250
+
+
+def test_transform_before_fit_raises(ohlcv):
+    """Test that transform refuses to run on an unfitted engineer."""
+    with pytest.raises(ValueError):
+        FeatureEngineer().transform(ohlcv)
+
+
+def test_save_load_round_trip(ohlcv, tmp_path):
+    """Test that a loaded engineer transforms identically."""
+    fe = FeatureEngineer()
+    fe.fit_transform(ohlcv.iloc[:200])
+    path = tmp_path / 'fe.pkl'
+    fe.save(str(path))
+
+    loaded = FeatureEngineer.load(str(path))
+
+    pd.testing.assert_frame_equal(loaded.transform(ohlcv), fe.transform(ohlcv))
+
+
+def test_load_legacy_pickle(ohlcv, tmp_path):
+    """Test that engineers pickled by earlier versions still load."""
+    fe = FeatureEngineer()
+    fe.fit_transform(ohlcv.iloc[:200])
+    path = tmp_path / 'fe_legacy.pkl'
+    with open(path, 'wb') as f:
+        pickle.dump({
+            'scaler': fe.scaler,
+            'is_fitted': True,
+            'feature_columns': fe.feature_columns
+        }, f)
+
+    loaded = FeatureEngineer.load(str(path))
+
+    pd.testing.assert_frame_equal(loaded.transform(ohlcv), fe.transform(ohlcv))
+
+
+def test_talib_rolling_stats_match(ohlcv, monkeypatch):
+    """Test that the TA-Lib backend gives the same features as the NumPy path."""
+    pytest.importorskip('talib')
+
+    talib_path = FeatureEngineer().calculate_indicators(ohlcv)
+    monkeypatch.setattr(features, 'talib', None)
+    numpy_path = FeatureEngineer().calculate_indicators(ohlcv)
+
+    pd.testing.assert_frame_equal(talib_path, numpy_path, rtol=1e-9)
@@ -15,6 +15,7 @@ Total: 20 tests
 import sys
 import os
 import logging
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
 from typing import List, Dict
@@ -597,8 +598,7 @@ class TestEdgeCases:
         event_bus.subscribe(EventType.RISK_ALERT, lambda e: alerts.append(e))
 
         # Create signal with missing quantity in metadata
-        signal = create_test_signal()
-        signal.metadata = {}  # Empty metadata
+        signal = replace(create_test_signal(), metadata={})  # Empty metadata
 
         # Process signal
         event_bus.publish(signal)
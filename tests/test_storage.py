@@ -0,0 +1,357 @@
+"""
+Test suite for DatabaseManager.
+
+Tests:
+- Connection configuration (WAL, PRAGMAs), schema versioning and indexes
+- Market data insert and query round trips (batched transactions)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import storage
+from src.data.storage import DatabaseManager
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _candle_rows(n, close=None):
+    """Build n hourly BTC/USD market_data rows from START (close defaults to the hour)."""
+    return [
+        ('BTC/USD', 'CRYPTO', (START + timedelta(hours=i)).isoformat(),
+         1.0, 2.0, 0.5, float(i) if close is None else close, 10.0, None, None, 'test')
+        for i in range(n)
+    ]
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_connection_uses_wal(db_manager):
+    """Test that file databases are opened in WAL mode with tuned PRAGMAs."""
+    conn = db_manager.get_connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+
+
+def test_in_memory_database():
+    """Test that an in-memory database skips WAL and still works."""
+    db = DatabaseManager(':memory:')
+    try:
+        conn = db.get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'memory'
+        assert db.insert_market_data(
+            'BTC/USD', 'CRYPTO', START,
+            {'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 10.0}, 'test'
+        )
+        assert len(db.get_market_data('BTC/USD', START, START + timedelta(hours=1))) == 1
+    finally:
+        db.close()
+
+
+def test_bulk_insert_commits_per_batch(db_manager, monkeypatch):
+    """Test that bulk inserts run in batches and a failing batch is rolled back."""
+    monkeypatch.setattr(storage, 'BULK_INSERT_BATCH_ROWS', 5)
+    rows = _candle_rows(12, close=1.5)
+
+    assert db_manager.bulk_insert_market_data(rows) == 12
+
+    # Second batch breaks the asset_type CHECK constraint on its last row
+    bad = [row[:2] + (f'2025-01-01T00:0{i}:00',) + row[3:] for i, row in enumerate(rows[:10])]
+    bad[9] = ('BTC/USD', 'BOND') + bad[9][2:]
+
+    assert db_manager.bulk_insert_market_data(bad) == 5
+    assert db_manager.query("SELECT COUNT(*) AS n FROM market_data")[0]['n'] == 17
+    assert not db_manager.get_connection().in_transaction
+
+
+def test_bulk_insert_consumes_iterable_lazily(db_manager, monkeypatch):
+    """Test that a generator is pulled one batch at a time, committing as it goes."""
+    monkeypatch.setattr(storage, 'BULK_INSERT_BATCH_ROWS', 5)
+    stored_when_pulled = []
+
+    def rows():
+        for row in _candle_rows(12, close=1.5):
+            stored_when_pulled.append(
+                db_manager.query("SELECT COUNT(*) AS n FROM market_data")[0]['n']
+            )
+            yield row
+
+    assert db_manager.bulk_insert_market_data(rows()) == 12
+    assert stored_when_pulled == [0] * 5 + [5] * 5 + [10] * 2
+
+
+def test_bulk_insert_multi_row_statements(db_manager):
+    """Test that multi-row inserts store every row and keep replace semantics."""
+    rows = _candle_rows(150)  # Two 64-row statements plus a 22-row remainder
+    rows.append(rows[3][:6] + (-1.0,) + rows[3][7:])  # Replaces hour 3
+
+    assert db_manager.bulk_insert_market_data(rows) == 151
+
+    stored = db_manager.get_market_data('BTC/USD', START, START + timedelta(hours=200))
+    assert [row['close'] for row in stored] == [-1.0 if i == 3 else float(i) for i in range(150)]
+
+
+def test_get_market_data_df_matches_rows(db_manager):
+    """Test that the DataFrame fetch returns the same rows as get_market_data."""
+    db_manager.bulk_insert_market_data(_candle_rows(10))
+    end = START + timedelta(hours=5)
+
+    df = db_manager.get_market_data_df('BTC/USD', START, end)
+    expected = db_manager.get_market_data('BTC/USD', START, end)
+
+    assert list(df.columns) == list(expected[0])
+    assert df['close'].tolist() == [row['close'] for row in expected]
+    assert df['timestamp'].iloc[0] == START
+    assert db_manager.get_market_data_df('ETH/USD', START, end).empty
+
+
+def test_iter_market_data_streams_in_batches(db_manager, monkeypatch):
+    """Test that streamed rows match get_market_data across fetch batches."""
+    monkeypatch.setattr(storage, 'FETCH_ARRAY_SIZE', 3)
+    db_manager.bulk_insert_market_data(_candle_rows(10))
+    end = START + timedelta(hours=20)
+
+    streamed = db_manager.iter_market_data('BTC/USD', START, end)
+
+    assert next(streamed)['close'] == 0.0
+    assert [row['close'] for row in streamed] == [float(i) for i in range(1, 10)]
+    assert len(db_manager.get_market_data('BTC/USD', START, end, limit=4)) == 4
+
+
+def test_bulk_timestamps_match_isoformat(db_manager):
+    """Test that vectorized timestamp formatting matches datetime.isoformat()."""
+    index = pd.date_range(START, periods=3, freq='1h')
+    ohlcv = np.ones((3, 5))
+
+    db_manager.insert_market_data_bulk('BTC/USD', 'CRYPTO', index, ohlcv, 'test')
+    db_manager.insert_market_data_bulk(
+        'ETH/USD', 'CRYPTO', index + pd.Timedelta(milliseconds=5), ohlcv, 'test'
+    )
+
+    stored = db_manager.query("SELECT symbol, timestamp FROM market_data ORDER BY id")
+    expected = list(index) + list(index + pd.Timedelta(milliseconds=5))
+    assert [row['timestamp'] for row in stored] == [ts.isoformat() for ts in expected]
+
+
+def test_update_position_fields(db_manager):
+    """Test position updates in any field order and rejection of unknown fields."""
+    position_id = db_manager.create_position(
+        'BTC/USD', 'CRYPTO', 'LONG', 1.0, 100.0, START, 'test_strategy'
+    )
+
+    assert db_manager.update_position(position_id, status='CLOSED', exit_price=110.0,
+                                      exit_time=START + timedelta(hours=1))
+    assert db_manager.update_position(position_id, exit_time=START, exit_price=120.0)
+    assert not db_manager.update_position(position_id, **{'status = NULL --': 1})
+
+    position = db_manager.query("SELECT * FROM positions WHERE id = ?", (position_id,))[0]
+    assert position['status'] == 'CLOSED'
+    assert position['exit_price'] == 120.0
+    assert position['exit_time'] == START.isoformat()
+
+
+def test_open_positions_use_partial_index(db_manager):
+    """Test that open-position lookups read the partial index, without a sort."""
+    conn = db_manager.get_connection()
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM positions WHERE status = 'OPEN' "
+        "AND symbol = ? ORDER BY entry_time DESC", ('BTC/USD',)
+    ).fetchall()
+
+    details = ' '.join(row['detail'] for row in plan)
+    assert 'idx_positions_open_symbol' in details
+    assert 'TEMP B-TREE' not in details
+
+
+def test_bulk_insert_signals_and_risk_events(db_manager):
+    """Test the batched signal and risk-event inserts."""
+    signals = [
+        (f'SYM{i}/USD', 'CRYPTO', START.isoformat(), 'test_strategy', 'BUY', 0.8, 100.0, None)
+        for i in range(70)
+    ]
+    events = [
+        (START.isoformat(), 'DRAWDOWN', 'HIGH', None, None, None, f'event {i}', None)
+        for i in range(3)
+    ]
+
+    assert db_manager.bulk_insert_signals(signals) == 70
+    assert db_manager.bulk_log_risk_events(events) == 3
+    assert db_manager.bulk_log_risk_events([events[0][:2] + ('SEVERE',) + events[0][3:]]) == 0
+
+    assert db_manager.query("SELECT COUNT(*) AS n FROM signals")[0]['n'] == 70
+    assert len(db_manager.get_recent_risk_events(limit=10)) == 3
+
+
+def test_connection_per_thread(db_manager):
+    """Test that threads get their own connections, closed when the thread exits."""
+    main_conn = db_manager.get_connection()
+    thread_conns = []
+
+    def worker():
+        thread_conns.append(db_manager.get_connection())
+        db_manager.insert_market_data(
+            'BTC/USD', 'CRYPTO', START,
+            {'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 10.0}, 'test'
+        )
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert thread_conns[0] is not main_conn
+    assert db_manager.get_connection() is main_conn
+    assert len(db_manager.get_market_data('BTC/USD', START, START)) == 1
+    assert db_manager._connections == [main_conn]
+    with pytest.raises(sqlite3.ProgrammingError):
+        thread_conns[0].execute("SELECT 1")
+
+    db_manager.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        main_conn.execute("SELECT 1")
+    assert db_manager.get_connection() is not main_conn
+
+
+def test_close_survives_failing_connection(db_manager):
+    """Test that close() still closes the other connections when one fails."""
+    main_conn = db_manager.get_connection()
+    results = {}
+
+    def worker():
+        conn = results['conn'] = db_manager.get_connection()
+        conn.close()  # PRAGMA optimize now raises on this one
+        results['closed'] = db_manager.close()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert results['closed'] is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        main_conn.execute("SELECT 1")
+
+
+def test_write_cursor_reused(db_manager):
+    """Test that single-row inserts share one cursor per thread until close()."""
+    cursor = db_manager._cursor()
+    db_manager.insert_signal('BTC/USD', 'CRYPTO', START, 'test_strategy', 'BUY', 0.9, 100.0)
+    db_manager.log_risk_event('DRAWDOWN', 'WARNING', 'test')
+
+    assert db_manager._cursor() is cursor
+    assert len(db_manager.query("SELECT * FROM signals")) == 1
+
+    db_manager.close()
+    assert db_manager._cursor() is not cursor
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_metadata_json_round_trip(db_manager, monkeypatch, use_orjson):
+    """Test that metadata is stored as JSON text with either serializer."""
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(storage, 'orjson', None)
+    metadata = {
+        'zscore': -2.5, 'levels': [1, 2], 7: 'int key', 'reason': 'oversold',
+        'signal_time': START, 'weights': np.array([0.5, np.nan]), 'bars': np.int64(3),
+        'sharpe': float('nan'),
+    }
+
+    position_id = db_manager.create_position(
+        'BTC/USD', 'CRYPTO', 'LONG', 1.0, 100.0, START, 'test_strategy', metadata=metadata
+    )
+
+    stored = db_manager.query("SELECT metadata FROM positions WHERE id = ?", (position_id,))
+    assert json.loads(stored[0]['metadata']) == {
+        'zscore': -2.5, 'levels': [1, 2], '7': 'int key', 'reason': 'oversold',
+        'signal_time': '2024-01-01T00:00:00+00:00', 'weights': [0.5, None], 'bars': 3,
+        'sharpe': None,
+    }
+
+
+def test_get_market_data_ndarray(db_manager):
+    """Test the structured-array fetch against the dict rows."""
+    index = pd.date_range(START, periods=5, freq='1h')
+    ohlcv = np.column_stack([np.arange(5.0) + k for k in range(5)])
+    db_manager.insert_market_data_bulk('BTC/USD', 'CRYPTO', index, ohlcv, 'test')
+
+    records = db_manager.get_market_data_ndarray('BTC/USD', START, START + timedelta(hours=3))
+
+    assert records.dtype == storage.MARKET_DATA_DTYPE
+    np.testing.assert_array_equal(records['timestamp'], index[:4].asi8 // 1_000_000)
+    np.testing.assert_array_equal(records['close'], ohlcv[:4, 3])
+    assert len(db_manager.get_market_data_ndarray('ETH/USD', START, START)) == 0
+
+
+def test_schema_applied_once_per_version(temp_db_path):
+    """Test that reopening a database skips the schema script unless it changed."""
+    DatabaseManager(temp_db_path).close()
+
+    db = DatabaseManager(temp_db_path)
+    conn = db.get_connection()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == storage.SCHEMA_VERSION
+
+    conn.execute("DROP INDEX idx_positions_open")
+    conn.execute("PRAGMA user_version = 0")  # As if written by an older schema
+    db.close()
+
+    db = DatabaseManager(temp_db_path)
+    indexes = db.query("SELECT name FROM sqlite_master WHERE type = 'index'")
+    db.close()
+    assert 'idx_positions_open' in {row['name'] for row in indexes}
+
+
+def test_bulk_insert_checkpoints_wal(db_manager, temp_db_path, monkeypatch):
+    """Test that bulk inserts truncate the WAL every CHECKPOINT_INTERVAL_ROWS rows."""
+    monkeypatch.setattr(storage, 'CHECKPOINT_INTERVAL_ROWS', 10)
+    rows = _candle_rows(12, close=1.5)
+
+    db_manager.bulk_insert_market_data(rows)
+
+    assert os.path.getsize(temp_db_path + '-wal') == 0
+    assert db_manager._rows_since_checkpoint == 0
+    assert db_manager.checkpoint()[0] == 0
+
+
+def test_database_errors_logged_programming_errors_raised(db_manager):
+    """Test that SQLite errors return a failure value while caller bugs propagate."""
+    ohlcv = {'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 10.0}
+
+    assert not db_manager.insert_market_data('BTC/USD', 'BOND', START, ohlcv, 'test')
+    with pytest.raises(KeyError):
+        db_manager.insert_market_data('BTC/USD', 'CRYPTO', START, {'open': 1.0}, 'test')
+
+
+def test_backtest_results_round_trip(db_manager):
+    """Test compressed results storage and loading of legacy plain-JSON rows."""
+    results = {'equity_curve': [100000.0 + i for i in range(1000)], 'trades': []}
+    assert db_manager.save_backtest_results(
+        'bt-1', 'test_strategy', ['BTC/USD'], 'CRYPTO', START, START + timedelta(days=1),
+        100000.0, 101000.0, {'sharpe_ratio': 1.5}, {'window': 20}, results
+    )
+    db_manager.get_connection().execute(
+        "INSERT INTO backtest_results (backtest_id, strategy_id, symbols, asset_type, "
+        "start_date, end_date, initial_capital, final_capital, total_return, config, results) "
+        "VALUES ('bt-legacy', 's', '[]', 'CRYPTO', '', '', 1, 1, 0, '{}', ?)",
+        (json.dumps(results),)
+    )
+
+    loaded = db_manager.load_backtest_results('bt-1')
+
+    assert isinstance(db_manager.query("SELECT results FROM backtest_results")[0]['results'], bytes)
+    assert loaded['results'] == results
+    assert loaded['symbols'] == ['BTC/USD']
+    assert loaded['config'] == {'window': 20}
+    assert db_manager.load_backtest_results('bt-legacy')['results'] == results
+    assert db_manager.load_backtest_results('missing') is None
@@ -14,7 +14,9 @@ import pandas as pd
 import numpy as np
 import pytz
 
-from src.data.validators import DataValidator, validate_ohlcv, clean_ohlcv, detect_and_handle_gaps
+from src.data.validators import (
+    PRICE_COLUMNS, DataValidator, validate_ohlcv, clean_ohlcv, detect_and_handle_gaps
+)
 
 
 # ============================================================================
@@ -114,6 +116,48 @@ class TestInvalidDataDetection:
         result = strict_validator.validate(df)
         assert result is False, "Price inconsistency should fail validation"
 
+    def test_price_inconsistency_counts_rows(self, valid_ohlcv_data, strict_validator):
+        """Test that each inconsistent row is counted once and sampled."""
+        df = valid_ohlcv_data.copy()
+        df.loc[df.index[4], 'open'] = df['high'].iloc[4] + 1
+        df.loc[df.index[9], 'close'] = df['low'].iloc[9] - 1
+
+        passed, message = strict_validator._check_price_consistency(df)
+
+        assert passed is False
+        assert message.startswith("Found 2 rows")
+        assert str(df.index[4]) in message and str(df.index[9]) in message
+
+    def test_price_consistency_nullable_dtype(self, valid_ohlcv_data, strict_validator):
+        """Test that nullable Float64 prices with pd.NA are checked like NaN."""
+        df = valid_ohlcv_data.astype({col: 'Float64' for col in PRICE_COLUMNS})
+        df.loc[df.index[2], 'open'] = pd.NA
+
+        assert strict_validator._check_price_consistency(df)[0] is True
+
+        df.loc[df.index[6], 'low'] = df['high'].iloc[6] + 1
+        passed, message = strict_validator._check_price_consistency(df)
+        assert passed is False
+        assert message.startswith("Found 1 rows")
+
+    def test_fused_scan_matches_individual_checks(self, valid_ohlcv_data, strict_validator):
+        """Test that the one-pass column scan reports what the separate checks do."""
+        df = valid_ohlcv_data.copy()
+        df.loc[df.index[5:8], 'close'] = np.nan
+        df.loc[df.index[3], 'volume'] = -100
+
+        fused = strict_validator._fused_column_scan(df)
+
+        assert fused == {
+            'data_types': strict_validator._check_data_types(df),
+            'null_values': strict_validator._check_null_values(df),
+            'negative_values': strict_validator._check_negative_values(df),
+        }
+        assert fused['null_values'] == (False, "Found null values: {'close': 3}")
+
+        # Non-numeric columns fall back to the individual checks
+        assert strict_validator._fused_column_scan(df.astype({'open': str})) == {}
+
     def test_duplicate_timestamps_fails(self, valid_ohlcv_data, strict_validator):
         """Test that duplicate timestamps fail validation."""
         df = valid_ohlcv_data.copy()
@@ -123,6 +167,75 @@ class TestInvalidDataDetection:
         assert result is False, "Duplicate timestamps should fail validation"
 
 
+    def test_outliers_reported_per_column(self, valid_ohlcv_data, strict_validator):
+        """Test that IQR outliers are counted for the affected column only."""
+        df = valid_ohlcv_data.copy()
+        df.loc[df.index[[3, 7]], 'high'] = 500000
+
+        passed, message = strict_validator._check_outliers(df)
+
+        assert passed is True  # Averaged over four columns, 2% is under the 5% limit
+        assert message == "Found potential outliers: {'high': '2 (8.0%)'}"
+
+    def test_outliers_nullable_dtype(self, valid_ohlcv_data, strict_validator):
+        """Test that nullable Float64 prices with pd.NA are scanned like NaN."""
+        df = valid_ohlcv_data.astype({col: 'Float64' for col in PRICE_COLUMNS})
+        df.loc[df.index[2], 'open'] = pd.NA
+        df.loc[df.index[[3, 7]], 'high'] = 500000
+
+        passed, message = strict_validator._check_outliers(df)
+
+        assert passed is True
+        assert message == "Found potential outliers: {'high': '2 (8.0%)'}"
+
+
+# ============================================================================
+# Test Result Cache
+# ============================================================================
+
+class TestValidationCache:
+    """Tests for caching validation results by frame contents."""
+
+    def test_repeated_validation_uses_cache(self, valid_ohlcv_data, strict_validator,
+                                            monkeypatch):
+        """Test that an unchanged frame is not re-checked and gets the same report."""
+        assert strict_validator.validate(valid_ohlcv_data) is True
+        report = strict_validator.get_validation_report()
+
+        monkeypatch.setattr(strict_validator, '_check_gaps',
+                            lambda df: pytest.fail('re-checked'))
+        assert strict_validator.validate(valid_ohlcv_data.copy()) is True
+        assert strict_validator.get_validation_report() == report
+
+    def test_changed_frame_or_mode_revalidates(self, valid_ohlcv_data, strict_validator):
+        """Test that in-place edits and strict mode changes miss the cache."""
+        df = valid_ohlcv_data.copy()
+        assert strict_validator.validate(df) is True
+
+        df.loc[df.index[5], 'close'] = np.nan
+        assert strict_validator.validate(df) is False
+
+        strict_validator.strict_mode = False
+        assert strict_validator.validate(df) is True
+
+
+    def test_timezone_change_revalidates(self, valid_ohlcv_data, strict_validator):
+        """Test that a tz-naive copy of a validated frame does not hit its entry."""
+        assert strict_validator.validate(valid_ohlcv_data) is True
+
+        assert strict_validator.validate(valid_ohlcv_data.tz_localize(None)) is False
+        assert strict_validator.validation_results['timezone_aware']['passed'] is False
+
+    def test_unhashable_column_validates_uncached(self, valid_ohlcv_data, strict_validator):
+        """Test that a frame with list-valued cells is validated without caching."""
+        df = valid_ohlcv_data.copy()
+        df['tags'] = [['spot']] * len(df)
+
+        assert strict_validator.validate(df) is True
+        assert strict_validator.validate(df) is True
+        assert len(strict_validator._cache) == 0
+
+
 # ============================================================================
 # Test Gap Detection
 # ============================================================================
@@ -140,6 +253,21 @@ class TestGapDetection:
             "Gap detection should identify gaps in data"
 
 
+    def test_gap_details_largest_first(self, valid_ohlcv_data, strict_validator):
+        """Test gap count, total and the largest gaps reported in the message."""
+        df = valid_ohlcv_data.drop(valid_ohlcv_data.index[[3, 10, 11, 12, 20, 21]])
+
+        passed, message = strict_validator._check_gaps(df)
+
+        assert passed is False  # 3 gaps in 19 rows is over 10%
+        assert message == (
+            "Found 3 gaps in data. Total gap time: 0 days 09:00:00. Largest gaps: "
+            "2024-01-01 09:00:00+00:00 -> 2024-01-01 13:00:00+00:00 (0 days 04:00:00), "
+            "2024-01-01 19:00:00+00:00 -> 2024-01-01 22:00:00+00:00 (0 days 03:00:00), "
+            "2024-01-01 02:00:00+00:00 -> 2024-01-01 04:00:00+00:00 (0 days 02:00:00)"
+        )
+
+
 # ============================================================================
 # Test Data Cleaning
 # ============================================================================
@@ -177,6 +305,29 @@ class TestDataCleaning:
             "Gap handling should not reduce data size"
 
 
+    def test_gap_handling_fills_missing_bars(self, valid_ohlcv_data):
+        """Test that small gaps get interpolated bars and large gaps are left open."""
+        df = valid_ohlcv_data.drop(valid_ohlcv_data.index[[3, 10, 11, 12, 13]])
+
+        df_handled = detect_and_handle_gaps(df, max_gap_minutes=120)
+
+        expected_index = valid_ohlcv_data.index.drop(valid_ohlcv_data.index[10:14])
+        assert df_handled.index.equals(expected_index)
+        filled = df_handled.loc[valid_ohlcv_data.index[3]]
+        before, after = valid_ohlcv_data.iloc[2], valid_ohlcv_data.iloc[4]
+        assert filled['close'] == pytest.approx((before['close'] + after['close']) / 2)
+        assert filled['volume'] == before['volume']
+        assert filled['symbol'] == 'BTC/USD'
+
+    def test_gap_handling_non_datetime_index(self, valid_ohlcv_data):
+        """Test that a frame without a DatetimeIndex is returned unchanged."""
+        df = valid_ohlcv_data.reset_index(drop=True)
+
+        df_handled = detect_and_handle_gaps(df, max_gap_minutes=120)
+
+        pd.testing.assert_frame_equal(df_handled, df)
+
+
 # ============================================================================
 # Run Tests (for backward compatibility with script)
 # ============================================================================